@@ -0,0 +1,83 @@
+# aim_assist.py
+# -*- coding: utf-8 -*-
+"""
+Aim assist from an inverse-ballistics table.
+
+At level load, every pig is looked up in levelgen's ShotIndex. The
+index holds the flight path of every grid (power, angle) shot, using the
+same integration as Bird.update. For each grid power, the angles that
+hit the pig are grouped into contiguous runs, and the middle grid angle
+of each run becomes a target angle. Powers with no hit get no targets, so
+there is no assist at a power that cannot reach the pig. Per frame the
+query is one dict lookup plus a bisect, so it runs every frame inside
+handle_gesture_input.
+"""
+import bisect
+import math
+from levelgen import PIG_RADIUS, SHOT_ANGLES_DEG, SHOT_POWERS
+
+POWER_STEP = SHOT_POWERS.step
+ANGLE_STEP = math.radians(SHOT_ANGLES_DEG.step)
+
+
+class AimAssist:
+    def __init__(self, index, strength=0.5):
+        """index: levelgen.ShotIndex; strength: 0 = off, 1 = snap to the target angle"""
+        self.index = index
+        self.strength = strength
+        self.targets = {}  # (pig x, pig y) -> [sorted target angles per grid power]
+
+    def build(self, pigs):
+        """Precompute target angles for every pig of the level"""
+        self.targets = {}
+        powers = list(SHOT_POWERS)
+        for pig in pigs:
+            per_power = {p: [] for p in powers}
+            for shot_id in self.index.shots_hitting(pig.x, pig.y, PIG_RADIUS):
+                power, angle, _ = self.index.shots[shot_id]
+                per_power[power].append(angle)
+            self.targets[(pig.x, pig.y)] = [self._run_centers(sorted(per_power[p])) for p in powers]
+
+    @staticmethod
+    def _run_centers(angles):
+        """Middle grid angle of each run of adjacent grid angles (itself a hitting shot)"""
+        centers = []
+        run = []
+        for angle in angles:
+            if run and angle - run[-1] > ANGLE_STEP * 1.5:
+                centers.append(run[len(run) // 2])
+                run = []
+            run.append(angle)
+        if run:
+            centers.append(run[len(run) // 2])
+        return centers
+
+    def target_angle(self, pigs, power, angle):
+        """Closest hitting angle at this power for the nearest live pig, or None"""
+        target_pig = None
+        for pig in pigs:
+            if pig.is_alive and (target_pig is None or pig.x < target_pig.x):
+                target_pig = pig
+        if target_pig is None:
+            return None
+        table = self.targets.get((target_pig.x, target_pig.y))
+        if not table:
+            return None
+        i = min(len(table) - 1, max(0, int(round((power - SHOT_POWERS.start) / POWER_STEP))))
+        angles = table[i]
+        if not angles:
+            return None
+        k = bisect.bisect_left(angles, angle)
+        if k == 0:
+            return angles[0]
+        if k == len(angles):
+            return angles[-1]
+        before, after = angles[k - 1], angles[k]
+        return before if angle - before <= after - angle else after
+
+    def adjust(self, pigs, power, angle):
+        """Angle nudged toward the target by `strength`"""
+        target = self.target_angle(pigs, power, angle)
+        if target is None or not self.strength:
+            return angle
+        return angle + (target - angle) * self.strength
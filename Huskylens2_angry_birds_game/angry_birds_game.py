@@ -1,6 +1,38 @@
 import pygame
 import math
-import random
+import assets
+from aim_assist import AimAssist
+from atlas import build_scene_atlas
+from quality import QualityGovernor
+from rng import GameRandom
+from levelgen import LevelGenerator
+from metrics import REGISTRY
+import snapshot
+from shadows import ShadowCompositor
+from sky import OVERLAY_LAYERS, SKY_LAYERS, ParallaxSky
+from trail import TrailBuffer, TrailRenderer
+
+# Logical (world) resolution; the window may be any size and is scaled to fit
+LOGICAL_WIDTH = 1200
+LOGICAL_HEIGHT = 600
+GROUND_Y = 550
+SLINGSHOT_POS = (100, 400)
+# "scaled": SDL scales the logical surface on the GPU (pygame.SCALED)
+# "smoothscale": one pygame.transform.smoothscale per frame into the window
+RENDER_MODE = "scaled"
+# Fixed seed for reproducible levels/effects; None = $ANGRY_BIRDS_SEED or random
+GAME_SEED = None
+
+# Shared by all game instances so the shot index is built once per process
+LEVEL_GENERATOR = LevelGenerator()
+# Nudge aim toward a shot that hits the nearest pig: 0 = off, 1 = snap
+AIM_ASSIST_STRENGTH = 0.0
+
+TRAIL_LENGTH = 30  # Default trail capacity; the quality governor adjusts it
+TRAIL_RENDERER = TrailRenderer()  # Shared stamp LUTs
+
+LAUNCHES = REGISTRY.counter("launches_total", "Birds launched")
+LEVELS_COMPLETED = REGISTRY.counter("levels_completed_total", "Levels cleared")
 
 class Bird:
     def __init__(self, x, y):
@@ -12,25 +44,15 @@ class Bird:
         self.vy = 0
         self.radius = 15
         self.color = (255, 0, 0)
-        self.trail = []  # Trajectory points
+        self.trail = TrailBuffer(TRAIL_LENGTH)  # Capacity follows the quality level
         self.is_launched = False
         self.is_aiming = False  # Whether currently aiming
         self.gravity = 0.3
         
         # Try to load bird sprite
-        self.image = None
-        self.use_image = False
-        try:
-            # Attempt to load bird sprite file
-            self.image = pygame.image.load("bird.png")
-            self.image = pygame.transform.scale(self.image, (self.radius * 3, self.radius * 3))
-            self.use_image = True
-            print("✅ Loaded bird image: bird.png")
-        except pygame.error as e:
-            print(f"⚠️ Failed to load bird.png: {e}")
-            print("💡 Hint: Place bird.png in the project directory")
-            # Fallback to vector drawing when image is unavailable
-            self.use_image = False
+        # Falls back to vector drawing when the image is unavailable
+        self.image = assets.load_image("bird.png", (self.radius * 3, self.radius * 3))
+        self.use_image = self.image is not None
         
     def launch(self, power, angle):
         """Launch the bird"""
@@ -39,7 +61,7 @@ class Bird:
         self.vy = power * math.sin(angle) * 0.3
         self.is_launched = True
         self.is_aiming = False
-        self.trail = []
+        self.trail.clear()
     
     def set_aiming_position(self, power, angle):
         """Set bird position while aiming"""
@@ -59,9 +81,7 @@ class Bird:
         """Update bird physics and position"""
         if self.is_launched:
             # Append trajectory point
-            self.trail.append((self.x, self.y))
-            if len(self.trail) > 20:
-                self.trail.pop(0)
+            self.trail.append(self.x, self.y)
             
             # Integrate motion
             self.x += self.vx
@@ -69,43 +89,16 @@ class Bird:
             self.vy += self.gravity  # Gravity
             
             # Ground collision
-            if self.y > 550:
-                self.y = 550
+            if self.y > GROUND_Y:
+                self.y = GROUND_Y
                 self.vy *= -0.3  # Bounce
                 self.vx *= 0.8   # Friction
                 
-    def draw(self, screen):
+    def draw(self, screen, draw_trail=True):
         """Draw the bird"""
-        # Enhanced trail rendering
-        if len(self.trail) > 1:
-            for i in range(len(self.trail) - 1):
-                current_pos = self.trail[i]
-                next_pos = self.trail[i + 1]
-                
-                # Trail alpha and size gradient
-                alpha = int((i / len(self.trail)) * 255)
-                trail_size = max(1, int(self.radius * (i / len(self.trail)) * 0.8))
-                
-                # Trail color gradient (red→yellow→transparent)
-                if i < len(self.trail) * 0.3:
-                    color = (255, int(200 * (i / len(self.trail) * 3)), 0, alpha)
-                elif i < len(self.trail) * 0.7:
-                    color = (255, 255, int(100 * ((i - len(self.trail) * 0.3) / (len(self.trail) * 0.4))), alpha)
-                else:
-                    color = (int(255 * ((len(self.trail) - i) / (len(self.trail) * 0.3))), 100, 100, alpha)
-                
-                # Streamlined trail segments
-                if i < len(self.trail) - 1:
-                    trail_surface = pygame.Surface((trail_size * 4, trail_size * 4), pygame.SRCALPHA)
-                    pygame.draw.circle(trail_surface, color, (trail_size * 2, trail_size * 2), trail_size)
-                    
-                    # Outer glow
-                    glow_surface = pygame.Surface((trail_size * 6, trail_size * 6), pygame.SRCALPHA)
-                    glow_color = (*color[:3], alpha // 3)
-                    pygame.draw.circle(glow_surface, glow_color, (trail_size * 3, trail_size * 3), trail_size * 2)
-                    
-                    screen.blit(glow_surface, (int(current_pos[0] - trail_size * 3), int(current_pos[1] - trail_size * 3)))
-                    screen.blit(trail_surface, (int(current_pos[0] - trail_size * 2), int(current_pos[1] - trail_size * 2)))
+        # Enhanced trail rendering (the game batches all trails itself)
+        if draw_trail:
+            TRAIL_RENDERER.draw(screen, [self.trail], self.radius)
         
         # Flight effects
         if self.is_launched and abs(self.vx) > 1:
@@ -251,9 +244,13 @@ class Bird:
         self.vy = 0
         self.is_launched = False
         self.is_aiming = False
-        self.trail = []
+        self.trail.clear()
 
 class Pig:
+    HEALTH_STATES = (100, 50)   # Health values pre-rendered into the atlas
+    TILE_SIZE = (64, 72)
+    TILE_ANCHOR = (32, 40)      # Pig center inside its atlas tile
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
@@ -263,19 +260,9 @@ class Pig:
         self.is_alive = True
         
         # Try to load pig sprite
-        self.image = None
-        self.use_image = False
-        try:
-            # Attempt to load pig sprite file
-            self.image = pygame.image.load("pig.png")
-            self.image = pygame.transform.scale(self.image, (self.radius * 3, self.radius * 3))
-            self.use_image = True
-            print("✅ Successfully loaded pig image: pig.png")
-        except pygame.error as e:
-            print(f"⚠️ Failed to load pig.png: {e}")
-            print("💡 Hint: Place pig.png in the project directory")
-            # Fallback to vector drawing when image is unavailable
-            self.use_image = False
+        # Shared, decoded once (falls back to vector drawing when unavailable)
+        self.image = assets.load_image("pig.png", (self.radius * 3, self.radius * 3))
+        self.use_image = self.image is not None
         
     def take_damage(self, damage):
         """Take damage"""
@@ -285,35 +272,46 @@ class Pig:
             return True  # Return True if eliminated
         return False
         
+    def sprite_key(self, health=None):
+        """Atlas key for this pig at the given (default: current) health"""
+        return ("pig", self.use_image, self.health if health is None else health)
+
     def draw(self, screen):
         """Draw the pig"""
         if self.is_alive:
-            if self.use_image and self.image:
-                # Draw pig using sprite
-                pig_rect = self.image.get_rect()
-                pig_rect.center = (int(self.x), int(self.y))
-                screen.blit(self.image, pig_rect)
+            self.draw_at(screen, int(self.x), int(self.y), self.health)
+
+    def draw_at(self, screen, x, y, health):
+        """Draw the pig centered at (x, y) with the given health"""
+        if self.use_image and self.image:
+            # Draw pig using sprite
+            pig_rect = self.image.get_rect()
+            pig_rect.center = (x, y)
+            screen.blit(self.image, pig_rect)
+            
+            # Add visual effects if pig is injured
+            if health < 100:
+                # Draw health bar
+                bar_width = 30
+                bar_height = 4
+                bar_x = int(x - bar_width // 2)
+                bar_y = int(y - self.radius - 10)
                 
-                # Add visual effects if pig is injured
-                if self.health < 100:
-                    # Draw health bar
-                    bar_width = 30
-                    bar_height = 4
-                    bar_x = int(self.x - bar_width // 2)
-                    bar_y = int(self.y - self.radius - 10)
-                    
-                    # Background bar
-                    pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, bar_width, bar_height))
-                    # Health bar
-                    health_width = int((self.health / 100) * bar_width)
-                    pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, health_width, bar_height))
-            else:
-                # Use traditional drawing method
-                self.draw_detailed_pig(screen)
+                # Background bar
+                pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, bar_width, bar_height))
+                # Health bar
+                health_width = int((health / 100) * bar_width)
+                pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, health_width, bar_height))
+        else:
+            # Use traditional drawing method
+            self.draw_detailed_pig(screen, x, y, health)
     
-    def draw_detailed_pig(self, screen):
+    def draw_detailed_pig(self, screen, x=None, y=None, health=None):
         """Draw detailed pig (used when no image is available)"""
-        x, y = int(self.x), int(self.y)
+        if x is None:
+            x, y = int(self.x), int(self.y)
+        if health is None:
+            health = self.health
         
         # Pig body (circular, green)
         pygame.draw.circle(screen, (50, 200, 50), (x, y), self.radius)
@@ -343,7 +341,7 @@ class Pig:
         pygame.draw.circle(screen, (0, 0, 0), (x + 3, y + 5), 1)
         
         # Mouth (smile or frown)
-        if self.health > 50:
+        if health > 50:
             # Smile
             pygame.draw.arc(screen, (0, 0, 0), (x - 8, y + 8, 16, 10), 0, 3.14159, 2)
         else:
@@ -351,6 +349,8 @@ class Pig:
             pygame.draw.arc(screen, (0, 0, 0), (x - 8, y + 15, 16, 10), 3.14159, 6.28318, 2)
 
 class Block:
+    DAMAGE_TIERS = 4
+
     def __init__(self, x, y, width, height, color=(139, 69, 19)):
         self.x = x
         self.y = y
@@ -376,84 +376,131 @@ class Block:
             self.block_type = "wood"
             
         self.max_health = self.health
+        self.tier = self.DAMAGE_TIERS
+        self._sprite_key = self.sprite_key(self.tier)
+        self.on_tier_change = None  # Callback(block, old_tier, new_tier); tier 0 = destroyed
         
     def take_damage(self, damage):
         """Take damage"""
         self.health -= damage
         if self.health <= 0:
             self.is_destroyed = True
-            return True
-        return False
-        
+        new_tier = 0 if self.is_destroyed else self.damage_tier()
+        if new_tier != self.tier:
+            # Only threshold crossings swap the sprite and notify listeners
+            old_tier = self.tier
+            self.tier = new_tier
+            if new_tier:
+                self._sprite_key = self.sprite_key(new_tier)
+            if self.on_tier_change:
+                self.on_tier_change(self, old_tier, new_tier)
+        return self.is_destroyed
+        
+    def damage_tier(self):
+        """Health bucket, DAMAGE_TIERS when pristine down to 1"""
+        ratio = max(0, self.health) / self.max_health
+        return max(1, math.ceil(ratio * self.DAMAGE_TIERS))
+
+    def tier_color(self, tier):
+        """Body color for a damage tier (darker as health drops)"""
+        ratio = tier / self.DAMAGE_TIERS
+        return (
+            int(self.original_color[0] * ratio),
+            int(self.original_color[1] * ratio),
+            int(self.original_color[2] * ratio)
+        )
+
+    def sprite_key(self, tier=None):
+        """Atlas key for this block at the given (default: current) tier"""
+        if tier is None:
+            return self._sprite_key
+        return ("block", self.block_type, self.original_color, self.width, self.height, tier)
+
     def draw(self, screen):
         """Draw the block"""
         if not self.is_destroyed:
-            # Change color based on health
-            health_ratio = self.health / self.max_health
-            color = (
-                int(self.original_color[0] * health_ratio),
-                int(self.original_color[1] * health_ratio),
-                int(self.original_color[2] * health_ratio)
-            )
-            
-            # Draw block body
-            pygame.draw.rect(screen, color, (self.x, self.y, self.width, self.height))
-            
-            # Add texture effects based on type
-            if self.block_type == "wood":
-                # Wood grain effect
-                for i in range(0, self.height, 8):
-                    lighter_color = (min(255, color[0] + 30), min(255, color[1] + 20), color[2])
-                    pygame.draw.line(screen, lighter_color, 
-                                   (self.x + 2, self.y + i), 
-                                   (self.x + self.width - 2, self.y + i), 1)
-            elif self.block_type == "stone":
-                # Stone texture
-                for i in range(0, self.width, 10):
-                    for j in range(0, self.height, 10):
-                        darker_color = (max(0, color[0] - 20), max(0, color[1] - 20), max(0, color[2] - 20))
-                        pygame.draw.rect(screen, darker_color, 
-                                       (self.x + i, self.y + j, 2, 2))
-            elif self.block_type == "ice":
-                # Ice effect - transparency and highlights
-                ice_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-                ice_surface.fill((*color, 200))  # Semi-transparent
-                screen.blit(ice_surface, (self.x, self.y))
-                
-                # Ice highlights
-                pygame.draw.line(screen, (255, 255, 255), 
-                               (self.x + 5, self.y + 5), 
-                               (self.x + self.width - 5, self.y + 5), 2)
-                pygame.draw.line(screen, (255, 255, 255), 
-                               (self.x + 5, self.y + 5), 
-                               (self.x + 5, self.y + self.height - 5), 2)
+            self.draw_at(screen, self.x, self.y, self.tier_color(self.tier), self.tier)
+
+    def draw_at(self, screen, x, y, color, tier=None):
+        """Draw the block body with its top-left corner at (x, y)"""
+        # Draw block body
+        pygame.draw.rect(screen, color, (x, y, self.width, self.height))
+        
+        # Add texture effects based on type
+        if self.block_type == "wood":
+            # Wood grain effect
+            for i in range(0, self.height, 8):
+                lighter_color = (min(255, color[0] + 30), min(255, color[1] + 20), color[2])
+                pygame.draw.line(screen, lighter_color, 
+                               (x + 2, y + i), 
+                               (x + self.width - 2, y + i), 1)
+        elif self.block_type == "stone":
+            # Stone texture
+            for i in range(0, self.width, 10):
+                for j in range(0, self.height, 10):
+                    darker_color = (max(0, color[0] - 20), max(0, color[1] - 20), max(0, color[2] - 20))
+                    pygame.draw.rect(screen, darker_color, 
+                                   (x + i, y + j, 2, 2))
+        elif self.block_type == "ice":
+            # Ice effect - transparency and highlights
+            ice_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            ice_surface.fill((*color, 200))  # Semi-transparent
+            screen.blit(ice_surface, (x, y))
             
-            # Draw border
-            border_color = (max(0, color[0] - 50), max(0, color[1] - 50), max(0, color[2] - 50))
-            pygame.draw.rect(screen, border_color, (self.x, self.y, self.width, self.height), 2)
+            # Ice highlights
+            pygame.draw.line(screen, (255, 255, 255), 
+                           (x + 5, y + 5), 
+                           (x + self.width - 5, y + 5), 2)
+            pygame.draw.line(screen, (255, 255, 255), 
+                           (x + 5, y + 5), 
+                           (x + 5, y + self.height - 5), 2)
+        
+        # Cracks, one more per lost damage tier
+        if tier is not None:
+            crack_color = (max(0, color[0] - 70), max(0, color[1] - 70), max(0, color[2] - 70))
+            for i in range(self.DAMAGE_TIERS - tier):
+                cx = x + self.width * (i + 1) // (self.DAMAGE_TIERS + 1)
+                pygame.draw.lines(screen, crack_color, False,
+                                  [(cx, y + 2), (cx - 4, y + self.height // 3),
+                                   (cx + 3, y + 2 * self.height // 3), (cx - 1, y + self.height - 3)], 1)
+
+        # Draw border
+        border_color = (max(0, color[0] - 50), max(0, color[1] - 50), max(0, color[2] - 50))
+        pygame.draw.rect(screen, border_color, (x, y, self.width, self.height), 2)
 
 class Slingshot:
+    TILE_SIZE = (96, 80)
+    TILE_ANCHOR = (48, 40)   # Slingshot (x, y) inside its atlas tile
+
     def __init__(self, x, y):
         self.x = x
         self.y = y
         self.width = 20
         self.height = 90
         
-    def draw(self, screen, bird_pos=None, aiming=False):
-        """Draw a simple Y-shaped slingshot - only the slingshot body"""
+    def sprite_key(self):
+        return ("slingshot",)
+
+    def rope_points(self):
+        """Fork tips the rope is tied to"""
+        fork_start_y = self.y + 20
+        return (self.x - 35, fork_start_y - 50), (self.x + 35, fork_start_y - 50)
+
+    def draw_body(self, screen, x, y):
+        """Draw the Y-shaped slingshot body (no rope) anchored at (x, y)"""
         # Y-shaped fork design
-        fork_start_y = self.y + 20  # Adjust Y-shaped slingshot starting position
+        fork_start_y = y + 20  # Adjust Y-shaped slingshot starting position
         fork_height = 50
         fork_width = 35
         
         # Fork connection - simplified version
-        connection_rect = pygame.Rect(self.x - 8, fork_start_y - 5, 16, 15)
+        connection_rect = pygame.Rect(x - 8, fork_start_y - 5, 16, 15)
         pygame.draw.rect(screen, (100, 65, 40), connection_rect, border_radius=8)
         pygame.draw.rect(screen, (140, 90, 55), connection_rect, width=2, border_radius=8)
         
         # Left fork
-        left_start = (self.x - 5, fork_start_y)
-        left_end = (self.x - fork_width, fork_start_y - fork_height)
+        left_start = (x - 5, fork_start_y)
+        left_end = (x - fork_width, fork_start_y - fork_height)
         
         # Left fork body
         pygame.draw.line(screen, (120, 80, 45), left_start, left_end, 12)
@@ -464,8 +511,8 @@ class Slingshot:
                         (left_end[0] - 2, left_end[1] - 2), 4)
         
         # Right fork
-        right_start = (self.x + 5, fork_start_y)
-        right_end = (self.x + fork_width, fork_start_y - fork_height)
+        right_start = (x + 5, fork_start_y)
+        right_end = (x + fork_width, fork_start_y - fork_height)
         
         # Right fork body
         pygame.draw.line(screen, (120, 80, 45), right_start, right_end, 12)
@@ -486,6 +533,12 @@ class Slingshot:
         pygame.draw.circle(screen, (180, 120, 75), right_end, 8, 2)  # Border
         pygame.draw.circle(screen, (200, 140, 90), right_end, 4)  # Inner
         
+    def draw(self, screen, bird_pos=None, aiming=False, draw_body=True):
+        """Draw a simple Y-shaped slingshot; draw_body=False when the atlas drew it"""
+        if draw_body:
+            self.draw_body(screen, self.x, self.y)
+        left_end, right_end = self.rope_points()
+        
         # Rope connection points
         left_rope_point = left_end
         right_rope_point = right_end
@@ -531,7 +584,7 @@ class Slingshot:
                         pred_x = bird_pos[0] + initial_vx * time
                         pred_y = bird_pos[1] + initial_vy * time + 0.5 * gravity * time * time
                         
-                        if pred_y > 550:  # Ground height
+                        if pred_y > GROUND_Y:  # Ground height
                             break
                             
                         trajectory_points.append((int(pred_x), int(pred_y)))
@@ -587,7 +640,7 @@ class Slingshot:
                     
                     # Force value display
                     power_percentage = int(power_ratio * 100)
-                    font = pygame.font.Font(None, 24)
+                    font = assets.default_font(24)
                     power_text = font.render(f"{power_percentage}%", True, (255, 255, 255))
                     text_rect = power_text.get_rect(center=(self.x, bar_y - 15))
                     screen.blit(power_text, text_rect)
@@ -607,45 +660,46 @@ class Slingshot:
             pygame.draw.line(screen, (120, 80, 50), left_rope_point, right_rope_point, 1)
 
 class AngryBirdsGame:
-    def __init__(self):
+    def __init__(self, screen=None, window_size=None, render_mode=RENDER_MODE, seed=GAME_SEED,
+                 aim_assist=AIM_ASSIST_STRENGTH):
         pygame.init()
-        self.width = 1200
-        self.height = 600
-        self.screen = pygame.display.set_mode((self.width, self.height))
-        pygame.display.set_caption("Gesture-Controlled Angry Birds")
+        self.rng = GameRandom(seed)
+        self.seed = self.rng.seed
+        self.width = LOGICAL_WIDTH
+        self.height = LOGICAL_HEIGHT
+        self.window = None
+        self.render_mode = render_mode
+        self._scaled_view = None
+        if screen is None:
+            self.open_window(window_size)
+        else:
+            # Caller-owned target (split-screen tile or offscreen surface)
+            self.screen = screen
         self.clock = pygame.time.Clock()
         
         # Background image
-        self.background_image = None
-        self.use_background_image = False
-        try:
-            # Attempt to load background image file
-            self.background_image = pygame.image.load("background.png")
-            self.background_image = pygame.transform.scale(self.background_image, (self.width, self.height))
-            self.use_background_image = True
-            print("✅ Loaded background image: background.png")
-        except pygame.error as e:
-            print(f"⚠️ Failed to load background.png: {e}")
-            print("💡 Hint: Place background.png in the project directory; falling back to default background")
-            self.use_background_image = False
+        # Falls back to the gradient background when unavailable
+        self.background_image = assets.load_image("background.png", (self.width, self.height))
+        self.use_background_image = self.background_image is not None
 
         # Score panel background image
-        self.score_bg_image = None
-        try:
-            self.score_bg_image = pygame.image.load("Scoring_Zone.png")
-            print("✅ Loaded score panel background image: Scoring_Zone.png")
-        except pygame.error as e:
-            print(f"❌ Failed to load score panel background image Scoring_Zone.png: {e}")
-            self.score_bg_image = None
+        self.score_bg_image = assets.load_image("Scoring_Zone.png")
         
         # Animation state
         self.time_counter = 0
         self.cloud_offset = 0
         self.particles = []  # Particle effects
+        self.damage_listeners = []  # Callback(block, old_tier, new_tier), e.g. for sounds
+        self.shot_listeners = []    # Callback(result dict) when a shot ends, e.g. scores.py
+        self.level_listeners = []   # Callback(completed level, score)
+        self.quality = QualityGovernor()
+        self.shadows = ShadowCompositor(self.width, self.height, GROUND_Y)
+        self.sky = ParallaxSky(self.width, SKY_LAYERS)
+        self.overlay_clouds = ParallaxSky(self.width, OVERLAY_LAYERS)
         
         # Game objects
-        self.slingshot = Slingshot(100, 400)
-        self.bird = Bird(100, 400)
+        self.slingshot = Slingshot(*SLINGSHOT_POS)
+        self.bird = Bird(*SLINGSHOT_POS)
         self.pigs = []
         self.blocks = []
         
@@ -655,28 +709,76 @@ class AngryBirdsGame:
         self.is_aiming = False
         self.aim_power = 0
         self.aim_angle = 0
+        self.shot_snapshot = None  # World state captured right before the last launch
+        self.current_shot = None   # Stats of the shot in flight, see end_shot()
+        self.aim_assist = None     # AimAssist when enabled, rebuilt per level
         
-        # Fonts (attempt Chinese-capable fonts; fallback to default)
-        try:
-            self.font = pygame.font.SysFont('microsoftyaheimicrosoftyaheiui', 28)
-            self.small_font = pygame.font.SysFont('microsoftyaheimicrosoftyaheiui', 20)
-        except:
-            try:
-                # Fallback: use SimHei if available
-                self.font = pygame.font.SysFont('simhei', 28)
-                self.small_font = pygame.font.SysFont('simhei', 20)
-            except:
-                # Final fallback: default font
-                self.font = pygame.font.Font(None, 36)
-                self.small_font = pygame.font.Font(None, 24)
+        # Fonts (Chinese-capable if installed; path cached on disk by assets.py)
+        self.font = assets.load_font(28)
+        self.small_font = assets.load_font(20)
         
         self.create_level()
-        
+        self.set_aim_assist(aim_assist)
+        
+    def open_window(self, window_size=None):
+        """Create the OS window and the logical render target"""
+        logical = (self.width, self.height)
+        self.window = None
+        if self.render_mode == "scaled" and hasattr(pygame, "SCALED"):
+            # SDL scales the logical surface to the window itself
+            try:
+                self.window = pygame.display.set_mode(logical, pygame.SCALED | pygame.RESIZABLE)
+                self.screen = self.window
+            except pygame.error as e:
+                # No renderer (some drivers, or a second SCALED window): scale on the CPU
+                print(f"⚠️ Scaled window unavailable ({e}); using smoothscale")
+        if self.window is None:
+            self.render_mode = "smoothscale"
+            self.window = pygame.display.set_mode(window_size or logical, pygame.RESIZABLE)
+            self.screen = pygame.Surface(logical).convert()
+            self.on_resize()
+        pygame.display.set_caption("Gesture-Controlled Angry Birds")
+
+    def on_resize(self):
+        """Rebuild resolution-dependent state; only runs when the window size changes"""
+        if self.render_mode != "smoothscale":
+            return
+        self.window = pygame.display.get_surface()
+        win_w, win_h = self.window.get_size()
+        scale = min(win_w / self.width, win_h / self.height)
+        view = pygame.Rect(0, 0, int(self.width * scale), int(self.height * scale))
+        view.center = (win_w // 2, win_h // 2)
+        self.window.fill((0, 0, 0))  # Letterbox bars are drawn once per resize
+        if view.size == (self.width, self.height):
+            self._scaled_view = None
+        else:
+            self._scaled_view = self.window.subsurface(view)
+        self._view_rect = view
+
+    def handle_event(self, event):
+        """Window events the game owns (resize)"""
+        if event.type == pygame.VIDEORESIZE:
+            self.on_resize()
+
+    def present(self):
+        """Scale the logical frame to the window and flip"""
+        if self.window is None:
+            return  # Caller-owned target; the caller presents it
+        if self.render_mode == "smoothscale":
+            if self._scaled_view is None:
+                self.window.blit(self.screen, self._view_rect)
+            else:
+                pygame.transform.smoothscale(self.screen, self._scaled_view.get_size(), self._scaled_view)
+        pygame.display.flip()
+
     def create_level(self):
         """Create level - reference screenshot design"""
         self.pigs = []
         self.blocks = []
         
+        self.atlas = None
+        self.shadows.invalidate()
+
         if self.level == 1:
             # Level 1: Basic structure
             # Left platform
@@ -739,16 +841,20 @@ class AngryBirdsGame:
             self.pigs.append(Pig(620, 430))
             
         else:
-            # Random level
-            base_x = 650
-            for i in range(min(6, self.level)):
-                x = base_x + i * 60 + random.randint(-20, 20)
-                y = 500 - random.randint(0, 150)
-                block_type = random.choice([(160, 82, 45), (128, 128, 128), (173, 216, 230)])
-                self.blocks.append(Block(x, y, 50, 50, block_type))
-                
-                if random.random() < 0.4:  # 40% chance to place pig
-                    self.pigs.append(Pig(x + 25, y - 30))
+            # Generated level: supported towers, every pig reachable, cached by (seed, level)
+            spec = LEVEL_GENERATOR.generate(self.seed, self.level)
+            for x, y, w, h, color in spec["blocks"]:
+                self.blocks.append(Block(x, y, w, h, color))
+            for x, y in spec["pigs"]:
+                self.pigs.append(Pig(x, y))
+
+        for block in self.blocks:
+            block.on_tier_change = self.on_block_tier_change
+
+        # Pre-render every block/pig/slingshot state of this level
+        self.atlas = build_scene_atlas(self.blocks, self.pigs, self.slingshot)
+        if self.aim_assist:
+            self.aim_assist.build(self.pigs)
         
     def handle_gesture_input(self, gesture_params):
         """Handle gesture input"""
@@ -761,6 +867,8 @@ class AngryBirdsGame:
                 self.aim_power = min(gesture_params['power'], 100)  # Limit maximum power
                 # Use gesture detection angle directly, no additional conversion
                 self.aim_angle = gesture_params['angle']
+                if self.aim_assist:
+                    self.aim_angle = self.aim_assist.adjust(self.pigs, self.aim_power, self.aim_angle)
                 
                 # Make bird follow slingshot pull movement
                 self.bird.set_aiming_position(self.aim_power, self.aim_angle)
@@ -774,9 +882,66 @@ class AngryBirdsGame:
             if gesture_params['should_launch']:
                 # Launch bird using current aiming parameters
                 print(f"🚀 Launching bird! Power: {self.aim_power:.1f}, Angle: {math.degrees(self.aim_angle):.1f}°")
+                self.shot_snapshot = self.snapshot()  # For retry_shot()
+                LAUNCHES.inc()
+                self.current_shot = {
+                    'level': self.level,
+                    'power': self.aim_power,
+                    'angle': self.aim_angle,
+                    'pigs_hit': 0,
+                    'blocks_broken': 0,
+                    'score_before': self.score,
+                    'launch_tick': self.time_counter,
+                }
                 self.bird.launch(self.aim_power, self.aim_angle)
                 self.is_aiming = False
             
+    def set_aim_assist(self, strength):
+        """Enable (strength > 0) or disable aim assist"""
+        if not strength:
+            self.aim_assist = None
+            return
+        if self.aim_assist is None:
+            self.aim_assist = AimAssist(LEVEL_GENERATOR.shot_index(), strength)
+            self.aim_assist.build(self.pigs)
+        self.aim_assist.strength = strength
+
+    def snapshot(self):
+        """Full world state as bytes (see snapshot.py)"""
+        return snapshot.snapshot(self)
+
+    def restore(self, data):
+        """Return the world to a state captured by snapshot()"""
+        snapshot.restore(self, data)
+        self.current_shot = None  # A rewound shot never ends
+
+    def end_shot(self):
+        """Report the finished shot to shot_listeners"""
+        shot = self.current_shot
+        if shot is None:
+            return
+        self.current_shot = None
+        result = {
+            'level': shot['level'],
+            'power': shot['power'],
+            'angle': shot['angle'],
+            'pigs_hit': shot['pigs_hit'],
+            'blocks_broken': shot['blocks_broken'],
+            'score_delta': self.score - shot['score_before'],
+            'score': self.score,
+            'ticks': self.time_counter - shot['launch_tick'],
+        }
+        for listener in self.shot_listeners:
+            listener(result)
+
+    def retry_shot(self):
+        """Rewind to just before the last launch"""
+        if self.shot_snapshot is None:
+            return False
+        self.restore(self.shot_snapshot)
+        print("⏪ Shot rewound")
+        return True
+
     def check_collisions(self):
         """Check collisions"""
         if not self.bird.is_launched:
@@ -792,7 +957,10 @@ class AngryBirdsGame:
             if bird_rect.colliderect(pig_rect) and pig.is_alive:
                 if pig.take_damage(50):
                     self.score += 100
+                    if self.current_shot:
+                        self.current_shot['pigs_hit'] += 1
                     self.pigs.remove(pig)
+                    self.shadows.invalidate()
                     # Add explosion particle effects
                     self.add_explosion_particles(pig.x, pig.y)
                     
@@ -802,6 +970,8 @@ class AngryBirdsGame:
             if bird_rect.colliderect(block_rect) and not block.is_destroyed:
                 if block.take_damage(30):
                     self.score += 50
+                    if self.current_shot:
+                        self.current_shot['blocks_broken'] += 1
                     self.blocks.remove(block)
                     # Add explosion particle effects
                     self.add_explosion_particles(block.x + block.width//2, block.y + block.height//2)
@@ -811,50 +981,76 @@ class AngryBirdsGame:
         self.time_counter += 1
         self.cloud_offset = (self.cloud_offset + 0.2) % self.width  # Cloud floating
         
+        # Apply current quality budget
+        settings = self.quality.settings
+        self.bird.trail.set_capacity(settings['trail_length'])
+        
         # Update particle effects
         self.update_particles()
+        excess = len(self.particles) - settings['max_particles']
+        if excess > 0:
+            del self.particles[:excess]  # Drop the oldest first
         
         self.bird.update()
         self.check_collisions()
         
         # Check if reset is needed
         if self.bird.is_launched and (self.bird.x > self.width or 
-                                     (abs(self.bird.vx) < 0.1 and abs(self.bird.vy) < 0.1 and self.bird.y >= 545)):
+                                     (abs(self.bird.vx) < 0.1 and abs(self.bird.vy) < 0.1 and self.bird.y >= GROUND_Y - 5)):
             # Bird has stopped, reset
-            self.bird.reset(100, 400)
+            self.bird.reset(*SLINGSHOT_POS)
+            self.end_shot()
             
         # Check victory condition
         if len(self.pigs) == 0:
+            self.end_shot()
+            for listener in self.level_listeners:
+                listener(self.level, self.score)
             self.level += 1
+            LEVELS_COMPLETED.inc()
             self.create_level()
-            self.bird.reset(100, 400)
+            self.bird.reset(*SLINGSHOT_POS)
+            self.shot_snapshot = None
             # Victory particle effects
             self.add_victory_particles()
     
+    def on_block_tier_change(self, block, old_tier, new_tier):
+        """A block crossed a damage threshold (new_tier 0 = destroyed)"""
+        if new_tier:
+            # Destruction already gets an explosion; cracking sheds a few chips
+            self.add_debris_particles(block.x + block.width // 2, block.y + block.height // 2,
+                                      block.tier_color(new_tier))
+        else:
+            self.shadows.invalidate()  # Only the baked shadow layer changes
+        for listener in self.damage_listeners:
+            listener(block, old_tier, new_tier)
+
+    def add_debris_particles(self, x, y, color, count=6):
+        """Add small chips when a block cracks"""
+        rng = self.rng.particles
+        for _ in range(count):
+            self.particles.append({
+                'x': x + rng.uniform(-8, 8),
+                'y': y + rng.uniform(-8, 8),
+                'vx': rng.uniform(-2, 2),
+                'vy': rng.uniform(-3, 0),
+                'life': rng.randint(15, 30),
+                'color': color,
+                'size': rng.uniform(2, 4)
+            })
+
     def add_victory_particles(self):
         """Add victory particle effects"""
+        rng = self.rng.particles
         for _ in range(20):
             self.particles.append({
-                'x': random.randint(self.width//4, 3*self.width//4),
-                'y': random.randint(100, 300),
-                'vx': random.uniform(-2, 2),
-                'vy': random.uniform(-3, -1),
+                'x': rng.randint(self.width//4, 3*self.width//4),
+                'y': rng.randint(100, 300),
+                'vx': rng.uniform(-2, 2),
+                'vy': rng.uniform(-3, -1),
                 'life': 60,
                 'color': (255, 215, 0),  # Gold
-                'size': random.randint(3, 8)
-            })
-    
-    def add_explosion_particles(self, x, y):
-        """Add explosion particle effects"""
-        for _ in range(15):
-            self.particles.append({
-                'x': x + random.uniform(-10, 10),
-                'y': y + random.uniform(-10, 10),
-                'vx': random.uniform(-4, 4),
-                'vy': random.uniform(-4, 4),
-                'life': 30,
-                'color': (255, random.randint(100, 200), 0),  # Orange-red
-                'size': random.randint(2, 6)
+                'size': rng.randint(3, 8)
             })
     
     def update_particles(self):
@@ -880,29 +1076,26 @@ class AngryBirdsGame:
             # Use optimized gradient background
             self.draw_gradient_background()
         
-        # Draw ground shadow effects
-        self.draw_ground_shadow()
+        # Baked ground/block/pig/slingshot shadows, plus the bird's ground shadow
+        self.shadows.draw_static(self.screen, self.blocks, self.pigs, self.slingshot)
+        self.shadows.draw_contact(self.screen, self.bird.x, self.bird.y, self.bird.radius)
         
-        # Draw game objects
-        for block in self.blocks:
-            block.draw(self.screen)
-            
-        for pig in self.pigs:
-            if pig.is_alive:
-                pig.draw(self.screen)
+        # Draw game objects: blocks, pigs and slingshot body in one batch
+        self.draw_scene_sprites()
         
-        # Draw slingshot - draw slingshot and rope first
+        # Draw slingshot rope
         if self.is_aiming and not self.bird.is_launched:
             # Bird is already in correct aiming position, connect rope directly to bird position
-            self.slingshot.draw(self.screen, (self.bird.x, self.bird.y), True)
+            self.slingshot.draw(self.screen, (self.bird.x, self.bird.y), True, draw_body=False)
             
             # Draw enhanced prediction trajectory - starting from bird's current position
             self.draw_enhanced_trajectory(self.bird.x, self.bird.y, self.aim_power, self.aim_angle)
         else:
-            self.slingshot.draw(self.screen)
+            self.slingshot.draw(self.screen, draw_body=False)
         
         # Draw bird - after slingshot rope to ensure bird is on top of rope
-        self.bird.draw(self.screen)
+        TRAIL_RENDERER.draw(self.screen, [self.bird.trail], self.bird.radius)
+        self.bird.draw(self.screen, draw_trail=False)
         
         # Draw particle effects
         self.draw_particles()
@@ -910,8 +1103,32 @@ class AngryBirdsGame:
         # Draw optimized UI interface
         self.draw_enhanced_ui()
     
+    def draw_scene_sprites(self):
+        """Blit blocks, pigs and the slingshot body from the level atlas"""
+        atlas = self.atlas
+        items = []
+        for block in self.blocks:
+            if not block.is_destroyed:
+                key = block.sprite_key()
+                if key in atlas:
+                    items.append((key, (block.x, block.y)))
+                else:
+                    block.draw(self.screen)
+        ax, ay = Pig.TILE_ANCHOR
+        for pig in self.pigs:
+            if pig.is_alive:
+                key = pig.sprite_key()
+                if key in atlas:
+                    items.append((key, (int(pig.x) - ax, int(pig.y) - ay)))
+                else:
+                    pig.draw(self.screen)
+        sx, sy = Slingshot.TILE_ANCHOR
+        items.append((self.slingshot.sprite_key(), (self.slingshot.x - sx, self.slingshot.y - sy)))
+        atlas.blits(self.screen, items)
+
     def draw_gradient_background(self):
         """Draw beautiful gradient background and landscape"""
+        rng = self.rng.reset_background()
         # === Sky gradient ===
         for y in range(400):  # Sky area
             ratio = y / 400
@@ -961,19 +1178,19 @@ class AngryBirdsGame:
         grass_surface = pygame.Surface((self.width, 100), pygame.SRCALPHA)
         for i in range(0, self.width, 8):
             # Random grass height and color
-            grass_height = random.randint(3, 12)
-            grass_color_variation = random.randint(-20, 20)
+            grass_height = rng.randint(3, 12)
+            grass_color_variation = rng.randint(-20, 20)
             grass_color = (max(0, min(255, 34 + grass_color_variation)), 
                           max(0, min(255, 139 + grass_color_variation)), 
                           max(0, min(255, 34 + grass_color_variation)))
             
             # Draw grass blades
-            start_x = i + random.randint(-2, 2)
+            start_x = i + rng.randint(-2, 2)
             pygame.draw.line(grass_surface, grass_color, 
-                           (start_x, 100), (start_x + random.randint(-2, 2), 100 - grass_height), 3)
+                           (start_x, 100), (start_x + rng.randint(-2, 2), 100 - grass_height), 3)
             
             # Add some detail grass blades
-            if random.random() < 0.3:
+            if rng.random() < 0.3:
                 pygame.draw.line(grass_surface, (20, 100, 20), 
                                (start_x + 1, 100), (start_x - 1, 100 - grass_height // 2), 1)
         
@@ -984,89 +1201,27 @@ class AngryBirdsGame:
         
     def draw_enhanced_clouds(self):
         """Draw enhanced cloud effects"""
-        current_time = pygame.time.get_ticks() / 1000.0
-        
-        # Multi-layer clouds, moving at different speeds
-        cloud_layers = [
-            {'positions': [(100, 80), (400, 60), (700, 90), (950, 70)], 'speed': 0.2, 'alpha': 180, 'size': 1.0},
-            {'positions': [(200, 120), (500, 100), (800, 140), (50, 110)], 'speed': 0.15, 'alpha': 150, 'size': 0.8},
-            {'positions': [(300, 50), (600, 180), (900, 40), (150, 160)], 'speed': 0.1, 'alpha': 120, 'size': 1.2}
-        ]
-        
-        for layer in cloud_layers:
-            cloud_surface = pygame.Surface((120, 60), pygame.SRCALPHA)
-            
-            for base_x, y in layer['positions']:
-                # Cloud floating
-                x = (base_x + current_time * layer['speed'] * 20) % (self.width + 120) - 60
-                
-                # Draw multiple overlapping circles to form 3D clouds
-                cloud_surface.fill((0, 0, 0, 0))  # Clear surface
-                
-                # Cloud shadows
-                shadow_offset = 3
-                pygame.draw.circle(cloud_surface, (100, 100, 100, 40), 
-                                 (35 + shadow_offset, 35 + shadow_offset), int(25 * layer['size']))
-                pygame.draw.circle(cloud_surface, (100, 100, 100, 40), 
-                                 (50 + shadow_offset, 25 + shadow_offset), int(20 * layer['size']))
-                pygame.draw.circle(cloud_surface, (100, 100, 100, 40), 
-                                 (65 + shadow_offset, 35 + shadow_offset), int(22 * layer['size']))
-                
-                # Main cloud body
-                cloud_color = (255, 255, 255, layer['alpha'])
-                pygame.draw.circle(cloud_surface, cloud_color, (35, 35), int(25 * layer['size']))
-                pygame.draw.circle(cloud_surface, cloud_color, (50, 25), int(20 * layer['size']))
-                pygame.draw.circle(cloud_surface, cloud_color, (65, 35), int(22 * layer['size']))
-                
-                # Cloud highlights
-                highlight_color = (255, 255, 255, min(255, layer['alpha'] + 50))
-                pygame.draw.circle(cloud_surface, highlight_color, (40, 30), int(12 * layer['size']))
-                pygame.draw.circle(cloud_surface, highlight_color, (55, 20), int(10 * layer['size']))
-                
-                self.screen.blit(cloud_surface, (x, y))
+        # Multi-layer clouds, moving at different speeds (pre-rendered tiles)
+        self.sky.draw(self.screen, self.time_counter, self.quality.settings['cloud_layers'])
     
     def draw_animated_clouds(self):
         """Draw animated cloud effects"""
         # Add subtle cloud floating effect
         cloud_alpha = 100 + int(20 * math.sin(self.time_counter * 0.02))
-        cloud_surface = pygame.Surface((100, 50), pygame.SRCALPHA)
-        cloud_surface.set_alpha(cloud_alpha)
-        
-        # Draw additional clouds
-        positions = [(200 + self.cloud_offset % self.width, 80), 
-                    (500 + self.cloud_offset % self.width, 120),
-                    (800 + self.cloud_offset % self.width, 60)]
-        
-        for x, y in positions:
-            pygame.draw.circle(cloud_surface, (255, 255, 255), (25, 25), 20)
-            pygame.draw.circle(cloud_surface, (255, 255, 255), (40, 20), 15)
-            pygame.draw.circle(cloud_surface, (255, 255, 255), (55, 25), 18)
-            self.screen.blit(cloud_surface, (x - 50, y))
+        self.overlay_clouds.draw(self.screen, self.time_counter, alpha=cloud_alpha)
     
     def draw_shadow(self, x, y, width, height):
         """Draw rectangular shadow"""
-        shadow_surface = pygame.Surface((width, height), pygame.SRCALPHA)
-        shadow_surface.fill((0, 0, 0, 50))
-        self.screen.blit(shadow_surface, (x, y))
+        self.screen.blit(self.shadows.rect_stamp(width, height), (x, y))
     
     def draw_circular_shadow(self, x, y, radius):
         """Draw circular shadow"""
-        shadow_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(shadow_surface, (0, 0, 0, 50), (radius, radius), radius)
-        self.screen.blit(shadow_surface, (x - radius, y - radius))
-    
-    def draw_ground_shadow(self):
-        """Draw ground shadow effects"""
-        # Add gradient shadow above ground
-        for i in range(20):
-            alpha = 30 - i
-            if alpha > 0:
-                shadow_surface = pygame.Surface((self.width, 1), pygame.SRCALPHA)
-                shadow_surface.fill((0, 0, 0, alpha))
-                self.screen.blit(shadow_surface, (0, 530 + i))
+        self.screen.blit(self.shadows.circle_stamp(radius), (x - radius, y - radius))
     
     def draw_particles(self):
         """Draw enhanced particle effects"""
+        glow = self.quality.settings['particle_glow']
+        spark_trail = self.quality.settings['spark_trail']
         for particle in self.particles[:]:
             # Update particle state
             particle['x'] += particle['vx']
@@ -1088,7 +1243,7 @@ class AngryBirdsGame:
                 # Explosion particles - brighter and more dazzling
                 # Outer glow
                 outer_size = int(particle['size'] * 2)
-                if outer_size > 0:
+                if outer_size > 0 and glow:
                     outer_surface = pygame.Surface((outer_size * 2, outer_size * 2), pygame.SRCALPHA)
                     outer_color = (*particle['color'], alpha // 3)
                     pygame.draw.circle(outer_surface, outer_color, (outer_size, outer_size), outer_size)
@@ -1103,6 +1258,8 @@ class AngryBirdsGame:
                     self.screen.blit(main_surface, (int(particle['x'] - main_size), int(particle['y'] - main_size)))
                 
                 # Core highlight
+                if not glow:
+                    continue
                 core_size = max(1, int(particle['size'] * 0.6))
                 core_surface = pygame.Surface((core_size * 2, core_size * 2), pygame.SRCALPHA)
                 core_color = (255, 255, 200, min(255, alpha * 2))
@@ -1111,7 +1268,7 @@ class AngryBirdsGame:
             
             elif particle.get('type') == 'spark':
                 # Spark particles - trail effect
-                spark_length = int(particle['size'] * 3)
+                spark_length = min(int(particle['size'] * 3), spark_trail)
                 end_x = int(particle['x'] - particle['vx'] * 3)
                 end_y = int(particle['y'] - particle['vy'] * 3)
                 
@@ -1139,48 +1296,49 @@ class AngryBirdsGame:
     
     def add_explosion_particles(self, x, y, intensity=20):
         """Add enhanced explosion particle effects"""
+        rng = self.rng.particles
         # Main explosion particles
         for _ in range(intensity):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(2, 8)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(2, 8)
             self.particles.append({
-                'x': x + random.uniform(-5, 5),
-                'y': y + random.uniform(-5, 5),
+                'x': x + rng.uniform(-5, 5),
+                'y': y + rng.uniform(-5, 5),
                 'vx': math.cos(angle) * speed,
                 'vy': math.sin(angle) * speed,
-                'life': random.randint(30, 60),
-                'size': random.uniform(3, 8),
-                'color': random.choice([(255, 100, 0), (255, 150, 0), (255, 200, 100), (255, 80, 80)]),
+                'life': rng.randint(30, 60),
+                'size': rng.uniform(3, 8),
+                'color': rng.choice([(255, 100, 0), (255, 150, 0), (255, 200, 100), (255, 80, 80)]),
                 'type': 'explosion'
             })
         
         # Spark particles
         for _ in range(intensity // 2):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(8, 15)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(8, 15)
             self.particles.append({
                 'x': x,
                 'y': y,
                 'vx': math.cos(angle) * speed,
                 'vy': math.sin(angle) * speed,
-                'life': random.randint(15, 30),
-                'size': random.uniform(1, 3),
-                'color': random.choice([(255, 255, 0), (255, 200, 0), (255, 255, 200)]),
+                'life': rng.randint(15, 30),
+                'size': rng.uniform(1, 3),
+                'color': rng.choice([(255, 255, 0), (255, 200, 0), (255, 255, 200)]),
                 'type': 'spark'
             })
         
         # Smoke particles
         for _ in range(intensity // 3):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 3)
+            angle = rng.uniform(0, 2 * math.pi)
+            speed = rng.uniform(1, 3)
             self.particles.append({
-                'x': x + random.uniform(-10, 10),
-                'y': y + random.uniform(-10, 10),
+                'x': x + rng.uniform(-10, 10),
+                'y': y + rng.uniform(-10, 10),
                 'vx': math.cos(angle) * speed,
                 'vy': math.sin(angle) * speed - 2,  # Float upward
-                'life': random.randint(40, 80),
-                'size': random.uniform(5, 12),
-                'color': random.choice([(100, 100, 100), (120, 120, 120), (80, 80, 80)]),
+                'life': rng.randint(40, 80),
+                'size': rng.uniform(5, 12),
+                'color': rng.choice([(100, 100, 100), (120, 120, 120), (80, 80, 80)]),
                 'type': 'smoke'
             })
     
@@ -1319,7 +1477,7 @@ class AngryBirdsGame:
             
             # Gesture information display
             params = self.last_gesture_params
-            small_font = pygame.font.Font(None, 24)
+            small_font = assets.default_font(24)
             
             # Status indicator
             if params.get('params_locked', False):
@@ -1421,7 +1579,7 @@ class AngryBirdsGame:
             y += vy
             vy += gravity  # Use same gravity value
             
-            if y > 550:  # Hit ground (consistent with Bird class)
+            if y > GROUND_Y:  # Hit ground (consistent with Bird class)
                 break
         
         # Draw dashed trajectory
@@ -1501,13 +1659,21 @@ class AngryBirdsGame:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
+                self.handle_event(event)
                     
             self.update()
             self.draw()
+            self.present()
             self.clock.tick(60)
+            self.quality.record(self.clock.get_rawtime())
             
         pygame.quit()
 
 if __name__ == "__main__":
-    game = AngryBirdsGame()
+    import argparse
+    parser = argparse.ArgumentParser(description="Angry Birds (mouse-free demo loop)")
+    parser.add_argument("--seed", type=int, default=GAME_SEED, help="Seed for reproducible levels and effects")
+    args = parser.parse_args()
+    game = AngryBirdsGame(seed=args.seed)
+    print(f"🎲 Seed: {game.seed}")
     game.run()
@@ -0,0 +1,108 @@
+# assets.py
+# -*- coding: utf-8 -*-
+"""
+Shared image and font cache.
+
+Every image is decoded and scaled once per (file, size) and shared by all
+objects (previously each Pig reloaded pig.png). Font lookup is the slow
+part of a cold start: pygame.font.SysFont scans the system font directory,
+which can take seconds on Windows, so the resolved font file is cached on
+disk in FONT_CACHE_FILE and reused on the next run.
+"""
+import json
+import os
+import threading
+import pygame
+
+FONT_CACHE_FILE = "font_cache.json"
+FONT_NAMES = ["microsoftyaheimicrosoftyaheiui", "simhei"]  # Chinese-capable first
+
+# (file, size) pairs the game shows; preloaded during the startup splash
+GAME_IMAGES = [
+    ("bird.png", (45, 45)),
+    ("pig.png", (60, 60)),
+    ("background.png", (1200, 600)),
+    ("Scoring_Zone.png", None),
+]
+
+_images = {}
+_fonts = {}
+_lock = threading.Lock()
+_font_path = False  # False = not resolved yet, None = use the default font
+
+
+def load_image(path, size=None):
+    """Decoded (and scaled) image, or None when it cannot be loaded"""
+    key = (path, size)
+    if key in _images:
+        return _images[key]
+    try:
+        image = pygame.image.load(path)
+        if size is not None:
+            image = pygame.transform.scale(image, size)
+    except (pygame.error, FileNotFoundError) as e:
+        print(f"⚠️ Failed to load {path}: {e}")
+        print(f"💡 Hint: Place {path} in the project directory")
+        image = None
+    with _lock:
+        _images[key] = image
+    return image
+
+
+def preload_images(specs=GAME_IMAGES):
+    """Decode every (file, size) in specs; safe to run in a worker thread"""
+    for path, size in specs:
+        load_image(path, size)
+
+
+def resolve_font_path(cache_path=FONT_CACHE_FILE):
+    """Font file for FONT_NAMES, from the disk cache when it is still valid"""
+    global _font_path
+    if _font_path is not False:
+        return _font_path
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("names") == FONT_NAMES and (cached["path"] is None or os.path.exists(cached["path"])):
+            _font_path = cached["path"]
+            return _font_path
+    except (OSError, ValueError, KeyError):
+        pass
+
+    path = None
+    for name in FONT_NAMES:
+        path = pygame.font.match_font(name)  # Scans the font directory once
+        if path:
+            break
+    try:
+        with open(cache_path, "w", encoding="utf-8") as f:
+            json.dump({"names": FONT_NAMES, "path": path}, f)
+    except OSError as e:
+        print(f"⚠️ Could not write font cache: {e}")
+    _font_path = path
+    return path
+
+
+def load_font(size):
+    """
+    Chinese-capable font at `size`; the default font at the same size when
+    none is installed (as SysFont did before).
+    """
+    path = resolve_font_path()
+    key = (path, size)
+    if key not in _fonts:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        try:
+            _fonts[key] = pygame.font.Font(path, size)
+        except (pygame.error, OSError):
+            _fonts[key] = pygame.font.Font(None, size)
+    return _fonts[key]
+
+
+def default_font(size):
+    """pygame's built-in font, cached (it was re-created every frame)"""
+    key = (None, size)
+    if key not in _fonts:
+        _fonts[key] = pygame.font.Font(None, size)
+    return _fonts[key]
@@ -0,0 +1,75 @@
+# atlas.py
+# -*- coding: utf-8 -*-
+"""
+Sprite atlas for the static-looking scene objects.
+
+At level load every block (per material, size and damage tier), every
+pig health state and the slingshot body are rendered once into a
+single texture. The scene is then drawn with one Surface.blits() call
+instead of dozens of pygame.draw primitives per object per frame.
+"""
+import pygame
+
+ATLAS_WIDTH = 1024
+ATLAS_PADDING = 2
+
+
+class SpriteAtlas:
+    def __init__(self):
+        self.surface = None
+        self.rects = {}   # key -> area inside self.surface
+
+    def build(self, entries):
+        """
+        entries: {key: (width, height, render)} where render(surface) draws
+        the sprite at the origin of a width x height subsurface.
+        """
+        # Shelf packing, tallest sprites first
+        order = sorted(entries.items(), key=lambda item: -item[1][1])
+        x = y = shelf_h = 0
+        placed = []
+        for key, (w, h, render) in order:
+            if x + w > ATLAS_WIDTH:
+                x, y = 0, y + shelf_h + ATLAS_PADDING
+                shelf_h = 0
+            placed.append((key, pygame.Rect(x, y, w, h), render))
+            x += w + ATLAS_PADDING
+            shelf_h = max(shelf_h, h)
+
+        self.surface = pygame.Surface((ATLAS_WIDTH, max(1, y + shelf_h)), pygame.SRCALPHA)
+        self.rects = {}
+        for key, rect, render in placed:
+            render(self.surface.subsurface(rect))
+            self.rects[key] = rect
+        return self
+
+    def __contains__(self, key):
+        return key in self.rects
+
+    def blits(self, target, items):
+        """Draw (key, dest) pairs with a single batched call"""
+        surface = self.surface
+        rects = self.rects
+        target.blits([(surface, dest, rects[key]) for key, dest in items], doreturn=False)
+
+
+def build_scene_atlas(blocks, pigs, slingshot):
+    """Pre-render every sprite the current level can show"""
+    entries = {}
+    for block in blocks:
+        for tier in range(1, block.DAMAGE_TIERS + 1):
+            key = block.sprite_key(tier)
+            if key not in entries:
+                entries[key] = (block.width, block.height,
+                                lambda surf, b=block, t=tier: b.draw_at(surf, 0, 0, b.tier_color(t), t))
+    for pig in pigs:
+        for health in pig.HEALTH_STATES:
+            key = pig.sprite_key(health)
+            if key not in entries:
+                w, h = pig.TILE_SIZE
+                ax, ay = pig.TILE_ANCHOR
+                entries[key] = (w, h, lambda surf, p=pig, hp=health, ax=ax, ay=ay: p.draw_at(surf, ax, ay, hp))
+    w, h = slingshot.TILE_SIZE
+    ax, ay = slingshot.TILE_ANCHOR
+    entries[slingshot.sprite_key()] = (w, h, lambda surf: slingshot.draw_body(surf, ax, ay))
+    return SpriteAtlas().build(entries)
@@ -0,0 +1,166 @@
+# calibration.py
+# -*- coding: utf-8 -*-
+"""
+Per-player / per-mount calibration for the HUSKYLENS aiming map.
+
+A calibration is a least-squares fit of a few reference hand positions
+to the (power, angle) each one should produce. The fit is baked into a
+FRAME_W x FRAME_H lookup table so every serial sample costs one index.
+
+Record a new calibration with:
+    python calibration.py [output.npz]
+"""
+import math
+import sys
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; main_uno falls back to the analytic mapping
+    np = None
+
+FRAME_W = 320
+FRAME_H = 240
+TABLE_VERSION = 1
+
+# Reference poses recorded by the calibration wizard: (prompt, power, angle in degrees)
+REFERENCE_POSES = [
+    ("Fist at your WEAKEST, flat shot", 0.0, 0.0),
+    ("Fist at your STRONGEST, flat shot", 100.0, 0.0),
+    ("Fist at a medium shot aimed HIGH", 50.0, 45.0),
+    ("Fist at a medium shot aimed LOW", 50.0, -45.0),
+]
+SAMPLE_SECONDS = 1.5
+
+
+class CalibrationTable:
+    """Precomputed (power, angle) for every pixel of the HUSKYLENS frame"""
+
+    def __init__(self, table):
+        self.table = np.asarray(table, dtype=np.float32)
+        self.frame_h, self.frame_w = self.table.shape[:2]
+        # Nested lists index faster than NumPy scalars for single lookups
+        self._rows = self.table.tolist()
+
+    def lookup(self, x, y):
+        """Return (power, angle) for box center (x, y)"""
+        x = int(x)
+        y = int(y)
+        if x < 0:
+            x = 0
+        elif x >= self.frame_w:
+            x = self.frame_w - 1
+        if y < 0:
+            y = 0
+        elif y >= self.frame_h:
+            y = self.frame_h - 1
+        return self._rows[y][x]
+
+    def save(self, path):
+        """Persist the table to an .npz file"""
+        np.savez_compressed(path, table=self.table, version=TABLE_VERSION)
+
+    @classmethod
+    def load(cls, path):
+        """Load a table written by save()"""
+        with np.load(path) as data:
+            if int(data["version"]) != TABLE_VERSION:
+                raise ValueError(f"Unsupported calibration version in {path}")
+            return cls(data["table"])
+
+
+def bake_default_table(left_weight, top_weight, max_angle_h_deg, max_angle_v_deg,
+                       frame_w=FRAME_W, frame_h=FRAME_H):
+    """Bake the analytic main_uno mapping into a table (vectorized)"""
+    xs = np.arange(frame_w, dtype=np.float64)[None, :]
+    ys = np.arange(frame_h, dtype=np.float64)[:, None]
+
+    power = 100.0 * (left_weight * (xs / frame_w) + top_weight * (1.0 - ys / frame_h))
+    power = np.clip(power, 0.0, 100.0)
+
+    h_angle = (frame_w / 2 - xs) / (frame_w / 2) * math.radians(max_angle_h_deg)
+    v_angle = (frame_h / 2 - ys) / (frame_h / 2) * math.radians(max_angle_v_deg)
+    angle = v_angle + h_angle
+
+    table = np.empty((frame_h, frame_w, 2), dtype=np.float32)
+    table[..., 0] = power
+    table[..., 1] = angle
+    return CalibrationTable(table)
+
+
+def fit_table(samples, frame_w=FRAME_W, frame_h=FRAME_H):
+    """
+    Fit power and angle as affine functions of (x, y) and bake the table.
+    samples: iterable of (x, y, power, angle_radians), at least 3 non-collinear.
+    """
+    samples = np.asarray(list(samples), dtype=np.float64)
+    if samples.ndim != 2 or samples.shape[0] < 3:
+        raise ValueError("Calibration needs at least 3 reference samples")
+
+    design = np.column_stack([samples[:, 0], samples[:, 1], np.ones(len(samples))])
+    if np.linalg.matrix_rank(design) < 3:
+        raise ValueError("Reference positions are collinear; spread your hand positions out")
+    coeffs, _, _, _ = np.linalg.lstsq(design, samples[:, 2:4], rcond=None)
+
+    xs = np.arange(frame_w, dtype=np.float64)[None, :]
+    ys = np.arange(frame_h, dtype=np.float64)[:, None]
+    table = np.empty((frame_h, frame_w, 2), dtype=np.float32)
+    table[..., 0] = np.clip(coeffs[0, 0] * xs + coeffs[1, 0] * ys + coeffs[2, 0], 0.0, 100.0)
+    table[..., 1] = coeffs[0, 1] * xs + coeffs[1, 1] * ys + coeffs[2, 1]
+    return CalibrationTable(table)
+
+
+def load_table(path):
+    """Load a calibration file, or return None when unavailable"""
+    if np is None:
+        print("⚠️ NumPy not installed; using built-in aiming map")
+        return None
+    try:
+        table = CalibrationTable.load(path)
+        print(f"✅ Loaded calibration: {path}")
+        return table
+    except FileNotFoundError:
+        return None
+    except (OSError, KeyError, ValueError) as e:
+        print(f"⚠️ Failed to load calibration {path}: {e}")
+        return None
+
+
+def record_samples(reader, poses=REFERENCE_POSES, seconds=SAMPLE_SECONDS):
+    """Interactively record the averaged fist position for each reference pose"""
+    samples = []
+    for prompt, power, angle_deg in poses:
+        input(f"👉 {prompt}, then press Enter...")
+        xs, ys = [], []
+        deadline = time.time() + seconds
+        while time.time() < deadline:
+            data = reader.latest or {}
+            if data.get("gesture") == "grab":
+                xs.append(int(data.get("x", 0)))
+                ys.append(int(data.get("y", 0)))
+            time.sleep(0.03)
+        if not xs:
+            raise RuntimeError("No fist detected; make sure the HUSKYLENS sees your hand")
+        x, y = sum(xs) / len(xs), sum(ys) / len(ys)
+        print(f"   recorded x={x:.0f} y={y:.0f} from {len(xs)} samples")
+        samples.append((x, y, power, math.radians(angle_deg)))
+    return samples
+
+
+def main(path):
+    if np is None:
+        raise RuntimeError("Calibration requires NumPy: pip install numpy")
+    import main_uno  # Imported lazily: main_uno loads this module at startup
+
+    reader = main_uno.SerialReader(main_uno.COM_PORT, main_uno.BAUDRATE)
+    reader.start()
+    try:
+        table = fit_table(record_samples(reader))
+    finally:
+        reader.stop()
+    table.save(path)
+    print(f"💾 Saved calibration: {path}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "calibration.npz")
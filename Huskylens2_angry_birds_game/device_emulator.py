@@ -0,0 +1,264 @@
+# device_emulator.py
+# -*- coding: utf-8 -*-
+"""
+Software HUSKYLENS 2 + UNO over a pseudo-terminal (Linux/macOS).
+
+Speaks exactly what Huskylens2_angry_birds_game.ino prints: the ready
+banner, grab JSON with x/y/w/h/held_ms, release and hand_open, using the
+sketch's own grab/release logic. Hands follow a random or scripted path
+at the sketch's natural cadence or a fixed message rate, with optional
+jitter, dropped messages, dropout gaps and corrupted bytes.
+
+Usage:
+    python device_emulator.py                      # prints the pty path
+    python device_emulator.py --rate 500 --corrupt 0.01 --link /tmp/huskylens
+    python main_uno.py --port /tmp/huskylens
+
+Scripted paths are JSON lines of keyframes; positions are interpolated
+between keyframes of the same gesture:
+    {"t_ms": 0, "gesture": "fist", "x": 120, "y": 120, "w": 50, "h": 60}
+    {"t_ms": 800, "gesture": "fist", "x": 220, "y": 150, "w": 50, "h": 60}
+    {"t_ms": 830, "gesture": "palm", "x": 220, "y": 150, "w": 55, "h": 65}
+    {"t_ms": 1000, "gesture": null}
+"""
+import argparse
+import json
+import math
+import os
+import random
+import threading
+import time
+
+ID_FIST = 1
+ID_PALM = 2
+FRAME_W = 320
+FRAME_H = 240
+# Sketch loop delays per outcome (ms)
+FIST_DELAY_MS = 30
+PALM_DELAY_MS = 50
+IDLE_DELAY_MS = 100
+BANNER = b'{"status":"ready","mode":"learned_ID"}\r\n'
+
+
+def _fmt(value, digits):
+    """Arduino Serial.print(float, digits): no negative zero"""
+    return "%.*f" % (digits, round(value, digits) + 0.0)
+
+
+class SketchLogic:
+    """The sketch's loop() state machine, turning hand observations into lines"""
+
+    def __init__(self):
+        self.grabbed = False
+        self.base = None
+        self.grab_start_ms = 0
+        self.last_power = 0.0
+        self.last_angle = 0.0
+
+    def step(self, now_ms, hand):
+        """hand: None or (gesture, x, y, w, h); returns (line bytes or None, loop delay ms)"""
+        if hand is None:
+            return None, IDLE_DELAY_MS
+        gesture, x, y, w, h = hand
+        if gesture == "fist":
+            if not self.grabbed:
+                self.grabbed = True
+                self.base = (x, y)
+                self.grab_start_ms = now_ms
+                self.last_power = self.last_angle = 0.0
+            dx = x - self.base[0]
+            dy = y - self.base[1]
+            power = max(0.0, min(100.0, math.hypot(dx, dy) / 2.0))
+            angle = math.atan2(-dy, dx)
+            self.last_power, self.last_angle = power, angle
+            line = ('{"gesture":"grab","id":%d,"power":%s,"angle":%s,"x":%d,"y":%d,"w":%d,"h":%d,"held_ms":%d}\r\n'
+                    % (ID_FIST, _fmt(power, 1), _fmt(angle, 4), x, y, w, h, now_ms - self.grab_start_ms))
+            return line.encode("ascii"), FIST_DELAY_MS
+        if self.grabbed:
+            line = ('{"gesture":"release","id":%d,"power":%s,"angle":%s}\r\n'
+                    % (ID_PALM, _fmt(self.last_power, 1), _fmt(self.last_angle, 4)))
+            self.grabbed = False
+            self.base = None
+            self.last_power = self.last_angle = 0.0
+            return line.encode("ascii"), PALM_DELAY_MS
+        return b'{"gesture":"hand_open","id":%d}\r\n' % ID_PALM, PALM_DELAY_MS
+
+
+def random_path(rng):
+    """Endless hand observations: rest, grab, pull back, release"""
+    while True:
+        for _ in range(rng.randint(3, 15)):
+            yield None
+        x, y = rng.uniform(60, 180), rng.uniform(60, 180)
+        w, h = rng.randint(40, 70), rng.randint(45, 80)
+        tx, ty = x + rng.uniform(20, 140), y + rng.uniform(-80, 80)
+        steps = rng.randint(15, 45)
+        for i in range(steps + 1):
+            k = i / steps
+            # Eased pull plus a little tremor
+            px = x + (tx - x) * (1 - (1 - k) ** 2) + rng.uniform(-2, 2)
+            py = y + (ty - y) * (1 - (1 - k) ** 2) + rng.uniform(-2, 2)
+            yield ("fist", int(min(FRAME_W, max(0, px))), int(min(FRAME_H, max(0, py))),
+                   w + rng.randint(-3, 3), h + rng.randint(-3, 3))
+        for _ in range(rng.randint(1, 4)):
+            yield ("palm", int(tx), int(ty), w + 5, h + 5)
+
+
+def load_script(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def scripted_path(keyframes, loop=True, frame_ms=FIST_DELAY_MS):
+    """Hand observations sampled every frame_ms along interpolated keyframes"""
+    end = keyframes[-1]["t_ms"]
+    while True:
+        t = 0
+        i = 0
+        while t <= end:
+            while i + 1 < len(keyframes) and keyframes[i + 1]["t_ms"] <= t:
+                i += 1
+            k = keyframes[i]
+            if not k.get("gesture"):
+                yield None
+            else:
+                x, y = k["x"], k["y"]
+                nxt = keyframes[i + 1] if i + 1 < len(keyframes) else None
+                if nxt and nxt.get("gesture") == k["gesture"] and nxt["t_ms"] > k["t_ms"]:
+                    f = (t - k["t_ms"]) / (nxt["t_ms"] - k["t_ms"])
+                    x += (nxt["x"] - x) * f
+                    y += (nxt["y"] - y) * f
+                yield (k["gesture"], int(x), int(y), k.get("w", 50), k.get("h", 60))
+            t += frame_ms
+        if not loop:
+            return
+
+
+class DeviceEmulator(threading.Thread):
+    def __init__(self, script=None, rate=None, jitter_ms=0.0, drop=0.0, corrupt=0.0,
+                 dropout_every_s=0.0, dropout_ms=0.0, seed=None, link=None, loop=True):
+        """
+        rate: messages/s (None = the sketch's own loop delays); drop: chance a
+        message is lost; corrupt: chance a message has a byte flipped or is cut
+        short; every ~dropout_every_s the device goes silent for dropout_ms.
+        """
+        super().__init__(daemon=True)
+        import tty  # POSIX only
+        self.rng = random.Random(seed)
+        self.path = scripted_path(load_script(script), loop) if script else random_path(self.rng)
+        self.rate = rate
+        self.jitter_ms = jitter_ms
+        self.drop = drop
+        self.corrupt = corrupt
+        self.dropout_every_s = dropout_every_s
+        self.dropout_ms = dropout_ms
+        self.logic = SketchLogic()
+        self.running = True
+        self.stats = {"sent": 0, "bytes": 0, "dropped": 0, "corrupted": 0, "overflow": 0, "dropouts": 0}
+
+        self.master, self.slave = os.openpty()
+        tty.setraw(self.slave)  # No echo or newline translation
+        os.set_blocking(self.master, False)
+        self.port = os.ttyname(self.slave)
+        self.link = link
+        if link:
+            if os.path.lexists(link):
+                os.remove(link)
+            os.symlink(self.port, link)
+
+    def _write(self, data):
+        try:
+            os.write(self.master, data)
+            self.stats["bytes"] += len(data)
+            return True
+        except BlockingIOError:
+            # Nobody is reading and the pty buffer is full: a real UART drops it too
+            self.stats["overflow"] += 1
+            return False
+
+    def _mangle(self, line):
+        data = bytearray(line)
+        if self.rng.random() < 0.5:
+            data[self.rng.randrange(len(data) - 2)] = self.rng.randrange(256)
+        else:
+            data = data[:self.rng.randrange(1, len(data) - 2)] + b"\r\n"
+        return bytes(data)
+
+    def run(self):
+        start = time.perf_counter()
+        self._write(BANNER)
+        next_t = start
+        next_dropout = start + self._dropout_gap()
+        for hand in self.path:
+            if not self.running:
+                break
+            now = time.perf_counter()
+            line, delay_ms = self.logic.step(int((now - start) * 1000), hand)
+            if self.dropout_every_s and now >= next_dropout:
+                self.stats["dropouts"] += 1
+                next_t = now + self.dropout_ms / 1000.0
+                next_dropout = next_t + self._dropout_gap()
+            elif line:
+                if self.rng.random() < self.drop:
+                    self.stats["dropped"] += 1
+                else:
+                    if self.rng.random() < self.corrupt:
+                        line = self._mangle(line)
+                        self.stats["corrupted"] += 1
+                    if self._write(line):
+                        self.stats["sent"] += 1
+            if self.rate:
+                interval = 1.0 / self.rate if line else 0.0  # Rate counts messages, not idle loops
+            else:
+                interval = delay_ms / 1000.0
+            if self.jitter_ms:
+                interval += self.rng.uniform(-self.jitter_ms, self.jitter_ms) / 1000.0
+            next_t += max(0.0, interval)
+            wait = next_t - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+
+    def _dropout_gap(self):
+        if not self.dropout_every_s:
+            return float("inf")
+        return self.rng.expovariate(1.0 / self.dropout_every_s)
+
+    def stop(self):
+        self.running = False
+        if self.is_alive():
+            self.join(timeout=1.0)
+        for fd in (self.master, self.slave):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        if self.link and os.path.islink(self.link):
+            os.remove(self.link)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Emulated HUSKYLENS/UNO on a pseudo-terminal")
+    parser.add_argument("--script", help="JSON-lines keyframe path (default: random hands)")
+    parser.add_argument("--once", action="store_true", help="Play the script once instead of looping")
+    parser.add_argument("--rate", type=float, help="Messages per second (default: sketch timing)")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--drop", type=float, default=0.0, help="Probability a message is lost")
+    parser.add_argument("--corrupt", type=float, default=0.0, help="Probability a message is corrupted")
+    parser.add_argument("--dropout-every", type=float, default=0.0, help="Mean seconds between silent gaps")
+    parser.add_argument("--dropout-ms", type=float, default=500.0, help="Length of a silent gap")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--link", help="Also expose the port under this path (e.g. /tmp/huskylens)")
+    args = parser.parse_args()
+
+    emulator = DeviceEmulator(args.script, args.rate, args.jitter_ms, args.drop, args.corrupt,
+                              args.dropout_every, args.dropout_ms, args.seed, args.link, not args.once)
+    emulator.start()
+    print(f"🤖 Emulated HUSKYLENS/UNO on {args.link or emulator.port}")
+    print(f"   python main_uno.py --port {args.link or emulator.port}")
+    try:
+        while emulator.is_alive():
+            time.sleep(5)
+            print(f"📊 {emulator.stats}")
+    except KeyboardInterrupt:
+        pass
+    emulator.stop()
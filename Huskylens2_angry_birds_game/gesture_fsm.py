@@ -0,0 +1,170 @@
+# gesture_fsm.py
+# -*- coding: utf-8 -*-
+"""
+Table-driven gesture state machine for the UNO+HUSKYLENS controller.
+
+Samples from the sketch ("grab", "release", "hand_open") are debounced
+with N-of-M confirmation before they may leave the current state. The
+sketch sends "release" only once, on the first palm frame of a draw, so
+a release is held pending until a following palm frame or a short quiet
+spell on the line confirms it; a "grab" in the meantime discards it. Each
+state can require a minimum dwell time, and an active draw times out to
+idle when the camera stops reporting. Time is always passed in by the
+caller, so a recorded sample list replays deterministically.
+"""
+import json
+from collections import deque
+
+IDLE = "idle"
+GRABBED = "grabbed"   # Fist seen, hand has not moved far enough to aim
+AIMING = "aiming"
+
+# Gestures that vote for the same physical hand pose
+GESTURE_CLASS = {
+    "grab": "fist",
+    "release": "palm",
+    "hand_open": "palm",
+}
+
+# (state, gesture) -> candidate transitions, first passing guard wins:
+# (guard name or None, next state, action or None)
+TRANSITIONS = {
+    (IDLE, "grab"):         [(None, GRABBED, "grab_start")],
+    (GRABBED, "grab"):      [("moved_enough", AIMING, "aim"), (None, GRABBED, None)],
+    (GRABBED, "release"):   [(None, IDLE, "cancel")],
+    (GRABBED, "hand_open"): [(None, IDLE, "cancel")],
+    (AIMING, "grab"):       [(None, AIMING, "aim")],
+    (AIMING, "release"):    [("launch_ready", IDLE, "launch"), (None, IDLE, "cancel")],
+    (AIMING, "hand_open"):  [(None, IDLE, "cancel")],
+}
+
+# Pose each state is "held" by; other poses must be confirmed before leaving
+HOLD_CLASS = {IDLE: "palm", GRABBED: "fist", AIMING: "fist"}
+
+# Defaults: a lone misclassified palm frame can no longer abort or fire a
+# draw, while entering a draw stays immediate. Keys are pose classes or, to
+# override their class, single gestures.
+DEFAULT_CONFIRM = {"fist": (1, 1), "palm": (2, 3)}   # -> (N, M)
+DEFAULT_MIN_DWELL_MS = {IDLE: 0, GRABBED: 0, AIMING: 120}
+DEFAULT_TIMEOUT_MS = 1500
+# The sketch prints "release" once and then "hand_open" only while the palm
+# stays in view (~50-80 ms later); if the hand leaves the frame instead, the
+# line goes quiet and the release confirms after this long
+DEFAULT_RELEASE_QUIET_MS = 200
+TRACE_SIZE = 256
+
+
+class GestureStateMachine:
+    def __init__(self, guards=None, confirm=None, min_dwell_ms=None,
+                 timeout_ms=DEFAULT_TIMEOUT_MS, release_quiet_ms=DEFAULT_RELEASE_QUIET_MS,
+                 trace_size=TRACE_SIZE):
+        self.guards = guards or {}
+        self.confirm = dict(DEFAULT_CONFIRM, **(confirm or {}))
+        self.min_dwell_ms = dict(DEFAULT_MIN_DWELL_MS, **(min_dwell_ms or {}))
+        self.timeout_ms = timeout_ms
+        self.release_quiet_ms = release_quiet_ms
+        window = max(m for _, m in self.confirm.values())
+        self.window = deque(maxlen=window)     # Recent pose classes
+        self.trace = deque(maxlen=trace_size)  # Ring buffer of transitions
+        self.reset()
+
+    def reset(self, now_ms=0):
+        self.state = IDLE
+        self.entered_ms = now_ms
+        self.last_sample_ms = now_ms
+        self.pending = None    # (gesture, x, y) waiting for confirmation
+        self.fired_xy = None   # Coordinates of the sample behind the last fired action
+        self.window.clear()
+
+    def feed(self, gesture, x, y, now_ms):
+        """Process one new sample; returns the fired action or None"""
+        self.last_sample_ms = now_ms
+        cls = GESTURE_CLASS.get(gesture)
+        if cls is None:
+            return None
+        self.window.append(cls)
+
+        if cls == HOLD_CLASS[self.state]:
+            if self.pending and (self.pending[0] == "release" or self._votes(self.pending[0]) == 0):
+                self.pending = None  # Outlier aged out, or the fist is back: no release
+            if self.pending is None:
+                return self._fire(gesture, x, y, now_ms, "sample")
+            return None
+
+        if (self.pending is None or GESTURE_CLASS[self.pending[0]] != cls
+                or self._rule(gesture) != self._rule(self.pending[0])):
+            self.pending = (gesture, x, y)
+        return self._try_pending(now_ms)
+
+    def tick(self, now_ms):
+        """Advance timers without a new sample; returns the fired action or None"""
+        if self.state != IDLE and now_ms - self.last_sample_ms > self.timeout_ms:
+            self.pending = None
+            self._record(now_ms, self.state, IDLE, None, "cancel", "timeout")
+            self.state = IDLE
+            self.entered_ms = now_ms
+            return "cancel"
+        if self.pending:
+            return self._try_pending(now_ms)
+        return None
+
+    def _rule(self, gesture):
+        """(N, M) confirmation for a gesture: its own entry, else its class's"""
+        return self.confirm.get(gesture) or self.confirm[GESTURE_CLASS[gesture]]
+
+    def _votes(self, gesture):
+        cls = GESTURE_CLASS[gesture]
+        n, m = self._rule(gesture)
+        recent = list(self.window)[-m:]
+        return recent.count(cls)
+
+    def _try_pending(self, now_ms):
+        gesture, x, y = self.pending
+        n, _ = self._rule(gesture)
+        quiet = gesture == "release" and now_ms - self.last_sample_ms >= self.release_quiet_ms
+        if self._votes(gesture) < n and not quiet:
+            return None
+        if now_ms - self.entered_ms < self.min_dwell_ms.get(self.state, 0):
+            return None
+        self.pending = None
+        return self._fire(gesture, x, y, now_ms, "confirmed")
+
+    def _fire(self, gesture, x, y, now_ms, reason):
+        for guard, next_state, action in TRANSITIONS.get((self.state, gesture), ()):
+            if guard is None or self.guards[guard](x, y):
+                self.fired_xy = (x, y)
+                if next_state != self.state:
+                    self._record(now_ms, self.state, next_state, gesture, action, reason)
+                    self.state = next_state
+                    self.entered_ms = now_ms
+                return action
+        return None
+
+    def _record(self, now_ms, src, dst, gesture, action, reason):
+        self.trace.append((now_ms, src, dst, gesture, action, reason))
+
+    def dump(self, path=None):
+        """Return the transition trace as dicts, optionally writing JSON lines"""
+        keys = ("t_ms", "from", "to", "gesture", "action", "reason")
+        rows = [dict(zip(keys, entry)) for entry in self.trace]
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                for row in rows:
+                    f.write(json.dumps(row) + "\n")
+        return rows
+
+
+def replay(samples, **kwargs):
+    """
+    Run (t_ms, gesture, x, y) samples through a fresh machine.
+    gesture None means "no new sample, just tick". Returns (actions, trace).
+    """
+    fsm = GestureStateMachine(**kwargs)
+    actions = []
+    for t_ms, gesture, x, y in samples:
+        if gesture is None:
+            action = fsm.tick(t_ms)
+        else:
+            action = fsm.feed(gesture, x, y, t_ms)
+        actions.append(action)
+    return actions, fsm.dump()
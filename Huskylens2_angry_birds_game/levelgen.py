@@ -0,0 +1,214 @@
+# levelgen.py
+# -*- coding: utf-8 -*-
+"""
+Procedural level generator for levels 3+.
+
+Towers are stacked from material pieces so every block rests on the
+ground or on the block below it, pigs sit on tower tops or the ground,
+and each candidate is validated headless: structural support plus a
+shot sweep using the same integration as Bird.update. Difficulty is
+scored from how many (power, angle) shots reach each pig. Pure Python
+(no pygame), so it also runs in tools and benchmarks.
+
+Benchmark:
+    python levelgen.py [count]
+"""
+import math
+import random
+import sys
+import time
+from rng import derive_seed
+
+# World constants, kept in sync with angry_birds_game.py
+WORLD_WIDTH = 1200
+GROUND_Y = 550
+SLINGSHOT_POS = (100, 400)
+BIRD_RADIUS = 15
+PIG_RADIUS = 20
+GRAVITY = 0.3
+VELOCITY_SCALE = 0.3
+
+MATERIALS = {
+    "wood": (160, 82, 45),
+    "stone": (128, 128, 128),
+    "ice": (173, 216, 230),
+}
+# (width, height) building blocks
+PIECES = [(50, 50), (40, 50), (30, 30), (20, 60), (80, 20)]
+
+TOWER_ZONE = (600, 1100)     # x range towers may occupy
+MAX_ATTEMPTS = 20
+SHOT_POWERS = range(10, 101, 5)
+SHOT_ANGLES_DEG = range(-80, 81, 4)
+MAX_FLIGHT_STEPS = 600
+CELL = 40                    # Spatial hash cell size for trajectory points
+CACHE_SIZE = 64              # Generated levels kept (kiosks play for hours)
+
+
+def _simulate(power, angle):
+    """Bird positions for one shot: Bird.set_aiming_position + launch + update"""
+    pull = min(power * 0.8, 80)
+    x = SLINGSHOT_POS[0] - pull * math.cos(angle)
+    y = SLINGSHOT_POS[1] - pull * math.sin(angle)
+    vx = power * math.cos(angle) * VELOCITY_SCALE
+    vy = power * math.sin(angle) * VELOCITY_SCALE
+    points = []
+    for _ in range(MAX_FLIGHT_STEPS):
+        x += vx
+        y += vy
+        vy += GRAVITY
+        if y > GROUND_Y:
+            y = GROUND_Y
+            vy *= -0.3
+            vx *= 0.8
+        points.append((x, y))
+        if x > WORLD_WIDTH or (abs(vx) < 0.1 and abs(vy) < 0.1 and y >= GROUND_Y - 5):
+            break
+    return points
+
+
+class ShotIndex:
+    """Every grid shot's flight path, bucketed by spatial cell (built once)"""
+
+    def __init__(self):
+        self.shots = []
+        self.cells = {}
+        for power in SHOT_POWERS:
+            for angle_deg in SHOT_ANGLES_DEG:
+                angle = math.radians(angle_deg)
+                shot_id = len(self.shots)
+                points = _simulate(power, angle)
+                self.shots.append((power, angle, points))
+                for x, y in points:
+                    self.cells.setdefault((int(x) // CELL, int(y) // CELL), set()).add(shot_id)
+
+    def shots_hitting(self, cx, cy, half):
+        """Shot ids whose bird rect overlaps a square of half-size `half` around (cx, cy)"""
+        reach = half + BIRD_RADIUS
+        candidates = set()
+        for gx in range(int(cx - reach) // CELL, int(cx + reach) // CELL + 1):
+            for gy in range(int(cy - reach) // CELL, int(cy + reach) // CELL + 1):
+                candidates |= self.cells.get((gx, gy), set())
+        hits = set()
+        for shot_id in candidates:
+            for x, y in self.shots[shot_id][2]:
+                if abs(x - cx) < reach and abs(y - cy) < reach:
+                    hits.add(shot_id)
+                    break
+        return hits
+
+
+def _supported(blocks, pigs):
+    """Every block rests on ground/another block (center over support), no overlaps"""
+    for i, (x, y, w, h, _) in enumerate(blocks):
+        for j, (ox, oy, ow, oh, _) in enumerate(blocks):
+            if i != j and x < ox + ow and ox < x + w and y < oy + oh and oy < y + h:
+                return False
+        if y + h == GROUND_Y:
+            continue
+        center = x + w / 2
+        if not any(oy == y + h and ox <= center <= ox + ow for ox, oy, ow, oh, _ in blocks):
+            return False
+    for px, py in pigs:
+        bottom = py + PIG_RADIUS
+        if bottom == GROUND_Y:
+            continue
+        if not any(by == bottom and bx <= px <= bx + bw for bx, by, bw, bh, _ in blocks):
+            return False
+    return True
+
+
+class LevelGenerator:
+    def __init__(self):
+        self.index = None     # ShotIndex, built lazily on first use
+        self.cache = {}       # (seed, level) -> level dict, oldest first
+
+    def shot_index(self):
+        """The shared ShotIndex, built on first use"""
+        if self.index is None:
+            self.index = ShotIndex()
+        return self.index
+
+    def generate(self, seed, level):
+        """Validated level dict: blocks, pigs, difficulty, feasible_shots"""
+        key = (seed, level)
+        if key not in self.cache:
+            if len(self.cache) >= CACHE_SIZE:
+                del self.cache[next(iter(self.cache))]
+            self.cache[key] = self._generate(seed, level)
+        return self.cache[key]
+
+    def _generate(self, seed, level):
+        self.shot_index()
+        rng = random.Random(derive_seed(seed, "levelgen", level))
+        best = None
+        for _ in range(MAX_ATTEMPTS):
+            blocks, pigs = self._candidate(rng, level)
+            if not pigs or not _supported(blocks, pigs):
+                continue
+            scored = self._score(blocks, pigs)
+            if scored is None:
+                continue  # Some pig cannot be hit by any shot
+            best = scored
+            break
+        if best is None:
+            # Extremely unlikely; fall back to a single reachable ground pig
+            best = self._score([], [(800, GROUND_Y - PIG_RADIUS)])
+        return best
+
+    def _candidate(self, rng, level):
+        blocks, pigs = [], []
+        towers = min(4, 1 + level // 3)
+        zone_w = (TOWER_ZONE[1] - TOWER_ZONE[0]) // towers
+        max_floors = min(6, 1 + level // 2)
+        materials = list(MATERIALS.values())
+        for t in range(towers):
+            axis = TOWER_ZONE[0] + zone_w * t + zone_w // 2 + rng.randint(-15, 15)
+            top = GROUND_Y
+            prev = None
+            for _ in range(rng.randint(1, max_floors)):
+                w, h = rng.choice(PIECES)
+                if prev is not None:
+                    # Shift sideways, but keep the center over the block below
+                    shift = rng.randint(-prev[2] // 3, prev[2] // 3)
+                    x = prev[0] + prev[2] // 2 + shift - w // 2
+                else:
+                    x = axis - w // 2
+                y = top - h
+                prev = (x, y, w, h, rng.choice(materials))
+                blocks.append(prev)
+                top = y
+            if prev and rng.random() < 0.75:
+                pigs.append((prev[0] + prev[2] // 2, top - PIG_RADIUS))
+        if rng.random() < 0.3:
+            pigs.append((TOWER_ZONE[0] - 40, GROUND_Y - PIG_RADIUS))
+        return blocks, pigs
+
+    def _score(self, blocks, pigs):
+        per_pig = [self.index.shots_hitting(px, py, PIG_RADIUS) for px, py in pigs]
+        if any(not hits for hits in per_pig):
+            return None
+        total = len(self.index.shots)
+        feasible = set().union(*per_pig)
+        # The hardest pig dominates: 0 = any shot works, 1 = 1% of shots or fewer
+        hardest = min(len(hits) for hits in per_pig) / total
+        return {
+            "blocks": blocks,
+            "pigs": pigs,
+            "feasible_shots": len(feasible),
+            "difficulty": round(min(1.0, max(0.0, -math.log10(hardest) / 2)), 3),
+        }
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    generator = LevelGenerator()
+    start = time.perf_counter()
+    generator.generate(0, 3)
+    print(f"Shot index: {len(generator.index.shots)} shots in {time.perf_counter() - start:.2f} s")
+    start = time.perf_counter()
+    levels = [generator.generate(seed, 3 + seed % 10) for seed in range(1, count + 1)]
+    elapsed = time.perf_counter() - start
+    mean = sum(lv["difficulty"] for lv in levels) / len(levels)
+    print(f"Generated {count} levels in {elapsed:.2f} s ({count / elapsed * 60:.0f} levels/min), "
+          f"mean difficulty {mean:.2f}")
@@ -1,13 +1,24 @@
 # main_uno.py
 # -*- coding: utf-8 -*-
-import json
+import time
+_T0 = time.perf_counter()  # Process start, for time-to-first-frame
+
+import argparse
 import math
+import os
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 import pygame
 import serial
-import serial.tools.list_ports
-from angry_birds_game import AngryBirdsGame
+import assets
+from angry_birds_game import LOGICAL_HEIGHT, LOGICAL_WIDTH, AngryBirdsGame
+from gesture_fsm import AIMING, GestureStateMachine
+from metrics import REGISTRY, MetricsExporter
+from port_discovery import PortDiscovery
+from scores import BOOTH_ID, ScoreStore, print_leaderboard
+from shot_log import ShotLog
+from serial_framer import LineFramer
+# calibration (NumPy) and replay_export are imported lazily: they are slow or optional
 
 # Configuration
 FRAME_W = 320
@@ -22,6 +33,20 @@ BAUDRATE = 115200
 COM_PORT = None
 SMOOTH_ALPHA = 0.35
 LAUNCH_GUARD_MS = 300
+RELEASE_CONFIRM = (2, 3)   # Palm frames (N of last M) before a release/hand_open ends a draw
+AIM_MIN_DWELL_MS = 120     # Minimum aiming time before a release is accepted
+GESTURE_TIMEOUT_MS = 1500  # Drop back to idle when the hand disappears mid-draw
+GESTURE_TRACE_FILE = "gesture_trace.jsonl"  # Press T in game to dump transitions
+CALIBRATION_FILE = "calibration.npz"  # Written by `python calibration.py`
+RECOVERY_FILE = "recovery.snapshot"   # World snapshot for --resume after a crash
+RECOVERY_INTERVAL_S = 5.0
+
+SERIAL_BYTES = REGISTRY.counter("serial_bytes_total", "Bytes read from the UNO")
+SERIAL_MESSAGES = REGISTRY.counter("serial_messages_total", "Gesture/status messages parsed")
+PARSE_ERRORS = REGISTRY.counter("serial_parse_errors_total", "Malformed serial lines skipped")
+FRAME_MS = REGISTRY.histogram("frame_ms", "Frame work time excluding the tick sleep")
+FPS = REGISTRY.gauge("fps", "Frames per second")
+PARTICLES = REGISTRY.gauge("particles", "Live particles")
  
 
 
@@ -54,16 +79,17 @@ def map_power_and_angle_from_box(x, y, frame_w=FRAME_W, frame_h=FRAME_H):
     return power, angle
 
 
-
-
-
-def auto_find_port():
-    ports = list(serial.tools.list_ports.comports())
-    for p in ports:
-        desc = f"{p.description} {p.hwid}".lower()
-        if any(k in desc for k in ["arduino", "wchusb", "ch340", "usb-serial"]):
-            return p.device
-    return ports[-1].device if ports else None
+def load_aim_table(path=CALIBRATION_FILE):
+    """
+    Load the calibrated lookup table, or bake the built-in mapping into one.
+    Returns None when NumPy is unavailable (callers use map_power_and_angle_from_box).
+    """
+    import calibration
+    table = calibration.load_table(path)
+    if table is None and calibration.np is not None:
+        table = calibration.bake_default_table(
+            LEFT_WEIGHT, TOP_WEIGHT, MAX_ANGLE_H_DEG, MAX_ANGLE_V_DEG, FRAME_W, FRAME_H)
+    return table
 
 
 class SerialReader(threading.Thread):
@@ -71,35 +97,53 @@ class SerialReader(threading.Thread):
         super().__init__(daemon=True)
         self.port_name = port
         self.baudrate = baudrate
+        self.discovery = PortDiscovery(baudrate, preferred=port)
         self.ser = None
         self.running = True
         self.latest = {}
+        self.seq = 0  # Bumped for every parsed message
+        self.framer = LineFramer()  # Also fed by sessions.SharedSerialLoop
 
     def run(self):
         while self.running:
             try:
                 if not self.ser or not self.ser.is_open:
                     self._open()
-                line = self.ser.readline().decode(errors="ignore").strip()
-                if not line:
-                    continue
-                if line.startswith("{") and line.endswith("}"):
-                    self.latest = json.loads(line)
+                self._pump(self.ser.in_waiting)
+            except serial.SerialException:
+                # Unplugged or port lost: discovery polls for it with backoff
+                self.discovery.mark_lost()
+                self._close()
             except Exception:
-                try:
-                    if self.ser:
-                        self.ser.close()
-                except Exception:
-                    pass
+                self._close()
                 time.sleep(0.5)
 
+    def _pump(self, waiting):
+        """Read what the port has (blocking for at least one byte) and parse complete lines"""
+        framer = self.framer
+        bad = framer.bad_frames
+        SERIAL_BYTES.inc(framer.readinto(self.ser, waiting))
+        for message in framer.messages():
+            self.latest = message
+            self.seq += 1
+            SERIAL_MESSAGES.inc()
+        if framer.bad_frames != bad:
+            PARSE_ERRORS.inc(framer.bad_frames - bad)  # Skipped; the port stays open
+
     def _open(self):
-        if not self.port_name:
-            self.port_name = auto_find_port()
-            if not self.port_name:
-                raise RuntimeError("No available serial port found")
-        self.ser = serial.Serial(self.port_name, self.baudrate, timeout=0.2)
-        print(f"🔌 Serial connected: {self.port_name} @ {self.baudrate}")
+        self.ser = self.discovery.connect(lambda: self.running)
+        if self.ser is None:
+            raise RuntimeError("Serial reader stopped before a device was found")
+        self.ser.timeout = 0.2
+        if self.discovery.port_info:
+            self.port_name = self.discovery.port_info.device
+
+    def _close(self):
+        try:
+            if self.ser:
+                self.ser.close()
+        except Exception:
+            pass
 
     def stop(self):
         self.running = False
@@ -107,24 +151,97 @@ class SerialReader(threading.Thread):
             self.ser.close()
 
 
+def save_recovery(game, path=RECOVERY_FILE):
+    """Write the world snapshot atomically so a crash never leaves half a file"""
+    try:
+        tmp = path + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(game.snapshot())
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"⚠️ Could not save recovery snapshot: {e}")
+
+
+def load_recovery(game, path=RECOVERY_FILE):
+    try:
+        with open(path, "rb") as f:
+            game.restore(f.read())
+        print(f"♻️ Resumed from {path} (level {game.level}, score {game.score})")
+        return True
+    except (OSError, ValueError) as e:
+        print(f"⚠️ Could not resume from {path}: {e}")
+        return False
+
+
+def _since_start_ms():
+    return (time.perf_counter() - _T0) * 1000
+
+
+def show_splash():
+    """Open the window and draw a loading frame before anything slow runs"""
+    pygame.display.init()
+    pygame.font.init()
+    flags = pygame.SCALED | pygame.RESIZABLE if hasattr(pygame, "SCALED") else pygame.RESIZABLE
+    screen = pygame.display.set_mode((LOGICAL_WIDTH, LOGICAL_HEIGHT), flags)
+    pygame.display.set_caption("Gesture-Controlled Angry Birds")
+    screen.fill((135, 206, 235))
+    text = assets.default_font(48).render("Loading...", True, (255, 255, 255))
+    screen.blit(text, text.get_rect(center=(LOGICAL_WIDTH // 2, LOGICAL_HEIGHT // 2)))
+    pygame.display.flip()
+    print(f"⏱️ Splash shown after {_since_start_ms():.0f} ms")
+
+
+def cold_start(seed=None, port=COM_PORT):
+    """
+    Splash first, then resolve fonts, decode images, load the aiming table
+    and discover the serial port concurrently while the window stays responsive.
+    """
+    show_splash()
+    print("⏳ Waiting for HUSKYLENS/UNO on serial...")
+    reader = SerialReader(port, BAUDRATE)
+    reader.start()  # Port discovery runs in the reader thread
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        jobs = [pool.submit(assets.resolve_font_path),
+                pool.submit(assets.preload_images),
+                pool.submit(load_aim_table)]
+        while not all(job.done() for job in jobs):
+            pygame.event.pump()
+            time.sleep(0.01)
+    print(f"⏱️ Assets ready after {_since_start_ms():.0f} ms")
+    return UnoHuskyController(reader=reader, seed=seed, aim_table=jobs[2].result())
+
+
 class UnoHuskyController:
-    def __init__(self):
-        self.game = AngryBirdsGame()
-        port = COM_PORT or auto_find_port()
-        if not port:
-            raise RuntimeError("No available serial port was found. Please set your COM_PORT")
-        self.reader = SerialReader(port, BAUDRATE)
-        self.reader.start()
-
-        self.grabbing = False
-        self.aiming = False
+    def __init__(self, game=None, reader=None, seed=None, aim_table=None):
+        """game/reader are injected by sessions.SessionManager; default is one of each"""
+        self.game = game or AngryBirdsGame(seed=seed)
+        if reader is None:
+            # COM_PORT=None lets discovery find (and later re-find) the device
+            print("⏳ Waiting for HUSKYLENS/UNO on serial...")
+            reader = SerialReader(COM_PORT, BAUDRATE)
+            reader.start()
+        self.reader = reader
+        self.aim_table = aim_table if aim_table is not None else load_aim_table()
+
+        self.fsm = GestureStateMachine(
+            guards={"moved_enough": self._moved_enough, "launch_ready": self._launch_ready},
+            confirm={"palm": RELEASE_CONFIRM},
+            min_dwell_ms={AIMING: AIM_MIN_DWELL_MS},
+            timeout_ms=GESTURE_TIMEOUT_MS,
+        )
+        self.recorder = None  # replay_export.SessionRecorder when --record is used
+        self.physics = None   # physics_process.PhysicsProcess when --physics-process is used
+        self._last_seq = -1
+        self._now_ms = 0.0
         self.grab_origin = None
         self._p_smooth = 0.0
         self._a_smooth = 0.0
         self._inited = False
         self._last_aim_power = 0.0
         self._last_aim_angle = 0.0
+        self._last_aim_xy = (-1, -1)
         self._last_launch_ts = 0.0
+        self._launch = None  # (raw x, raw y, power, angle) of the last launch
 
     def _smooth(self, p, a):
         if not self._inited:
@@ -135,78 +252,182 @@ class UnoHuskyController:
             self._a_smooth = (1 - SMOOTH_ALPHA) * self._a_smooth + SMOOTH_ALPHA * a
         return self._p_smooth, self._a_smooth
 
-    def _handle_serial(self, data):
-        gesture = str(data.get("gesture", "none"))
-        x = int(data.get("x", FRAME_W // 2))
-        y = int(data.get("y", FRAME_H // 2))
-
-        # Fist (start/maintain draw)
-        if gesture == "grab":
-            if not self.grabbing:
-                self.grabbing = True
-                self.aiming = False
-                self.grab_origin = (x, y)
+    def _moved_enough(self, x, y):
+        dx = x - self.grab_origin[0]
+        dy = y - self.grab_origin[1]
+        return math.hypot(dx, dy) >= AIM_START_DIST_PX
+
+    def _launch_ready(self, x, y):
+        return (
+            (self._now_ms - self._last_launch_ts) > LAUNCH_GUARD_MS
+            and self._last_aim_power >= MIN_LAUNCH_POWER
+        )
+
+    def _handle_serial(self, data, now_ms=None):
+        """
+        Feed one new serial message into the gesture state machine.
+        data=None means no new message arrived; only timers advance.
+        """
+        self._now_ms = time.time() * 1000 if now_ms is None else now_ms
+        if data is None:
+            action = self.fsm.tick(self._now_ms)
+        else:
+            gesture = str(data.get("gesture", "none"))
+            x = int(data.get("x", FRAME_W // 2))
+            y = int(data.get("y", FRAME_H // 2))
+            action = self.fsm.feed(gesture, x, y, self._now_ms)
+        if action in ("grab_start", "aim"):
+            # A timer can confirm an earlier sample: use that sample's position
+            x, y = self.fsm.fired_xy
+
+        # Fist (start draw)
+        if action == "grab_start":
+            self.grab_origin = (x, y)
+
+        # Fist moved (maintain draw)
+        elif action == "aim":
+            if self.aim_table is not None:
+                power, angle = self.aim_table.lookup(x, y)
             else:
-                dx = x - self.grab_origin[0]
-                dy = y - self.grab_origin[1]
-                dist = math.hypot(dx, dy)
-                if not self.aiming and dist >= AIM_START_DIST_PX:
-                    self.aiming = True
-
-        # Release = launch
-        elif gesture == "release":
-            should = (
-                self.aiming
-                and (time.time() * 1000 - self._last_launch_ts) > LAUNCH_GUARD_MS
-                and self._last_aim_power >= MIN_LAUNCH_POWER
-            )
-            params = {
+                power, angle = map_power_and_angle_from_box(x, y)
+            power, angle = self._smooth(power, angle)
+            self._last_aim_power, self._last_aim_angle = power, angle
+            self._last_aim_xy = (x, y)
+
+        # Confirmed release = launch
+        elif action == "launch":
+            self._last_launch_ts = self._now_ms
+            self._launch = (*self._last_aim_xy, self._last_aim_power, self._last_aim_angle)
+            return {
                 "power": float(self._last_aim_power),
                 "angle": float(self._last_aim_angle),
-                "should_launch": bool(should),
+                "should_launch": True,
             }
-            if should:
-                self._last_launch_ts = time.time() * 1000
-            self.grabbing = False
-            self.aiming = False
-            return params
-
-        elif gesture == "hand_open":  # Open hand
-            self.grabbing = False
-            self.aiming = False
-
-        if self.aiming:
-            power, angle = map_power_and_angle_from_box(x, y)
-            power, angle = self._smooth(power, angle)
-            self._last_aim_power, self._last_aim_angle = power, angle
-            return {"power": power, "angle": angle, "should_launch": False}
+
+        if self.fsm.state == AIMING:
+            return {"power": self._last_aim_power, "angle": self._last_aim_angle, "should_launch": False}
         else:
             return {"power": 0, "angle": 0, "should_launch": False}
 
+    def launch_inputs(self):
+        """Raw hand position and smoothed power/angle of the last launch, for shot_log.py"""
+        return self._launch
+
+    def _poll_serial(self):
+        """Return the newest unseen serial message, or None"""
+        seq = self.reader.seq
+        if seq == self._last_seq:
+            return None
+        self._last_seq = seq
+        return self.reader.latest or None
+
+    def apply_input(self):
+        """Feed the newest serial message to the game (one frame of input)"""
+        params = self._handle_serial(self._poll_serial())
+        if self.physics:
+            self.physics.send_input(params)
+            self.game.last_gesture_params = params  # For the HUD
+        else:
+            self.game.handle_gesture_input(params)
+        if self.recorder:
+            self.recorder.record(params)
+        return params
+
     def run(self):
         print("🎮 UNO+HUSKYLENS mode started")
         clock = pygame.time.Clock()
+        next_save = time.monotonic() + RECOVERY_INTERVAL_S
+        first_frame = True
         running = True
         while running:
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
-
-            data = self.reader.latest or {}
-            params = self._handle_serial(data)
-            self.game.handle_gesture_input(params)
-            self.game.update()
+                self.game.handle_event(event)
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_t:
+                    self.fsm.dump(GESTURE_TRACE_FILE)
+                    print(f"📝 Gesture trace written: {GESTURE_TRACE_FILE}")
+                if event.type == pygame.KEYDOWN and event.key == pygame.K_r:
+                    if self.physics:
+                        self.physics.retry_shot()
+                    elif self.game.retry_shot() and self.recorder:
+                        self.recorder.record_retry()
+
+            self.apply_input()
+            if self.physics and not self.physics.is_alive():
+                print("⚠️ Physics worker exited; continuing in-process from its last tick")
+                self.physics.stop()
+                self.physics = None
+            if self.physics:
+                self.physics.apply_to(self.game)
+            else:
+                self.game.update()
             self.game.draw()
-
-            pygame.display.flip()
+            self.game.present()
+            if first_frame:
+                first_frame = False
+                print(f"⏱️ Time to first frame: {_since_start_ms():.0f} ms")
             clock.tick(60)
+            frame_ms = clock.get_rawtime()
+            self.game.quality.record(frame_ms)
+            FRAME_MS.observe(frame_ms)
+            FPS.set(clock.get_fps())
+            PARTICLES.set(len(self.game.particles))
+            if time.monotonic() >= next_save:
+                save_recovery(self.game)
+                next_save = time.monotonic() + RECOVERY_INTERVAL_S
 
         self.reader.stop()
+        if self.physics:
+            self.physics.stop()
+        if self.recorder:
+            self.recorder.close()
         pygame.quit()
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gesture-controlled Angry Birds (UNO+HUSKYLENS)")
+    parser.add_argument("--record", metavar="PATH", help="Record the session for replay_export.py")
+    parser.add_argument("--seed", type=int, help="Seed for reproducible levels and effects")
+    parser.add_argument("--resume", action="store_true", help=f"Continue from {RECOVERY_FILE}")
+    parser.add_argument("--port", default=COM_PORT,
+                        help="Serial device, e.g. COM3 or a device_emulator.py pty (default: discover)")
+    parser.add_argument("--aim-assist", type=float, metavar="STRENGTH",
+                        help="Nudge aim toward a hitting shot, 0 (off) to 1 (snap)")
+    parser.add_argument("--metrics-port", type=int, help="Serve Prometheus metrics on 127.0.0.1:PORT")
+    parser.add_argument("--booth", default=BOOTH_ID, help="Booth name for the local leaderboard")
+    parser.add_argument("--physics-process", action="store_true",
+                        help="Run physics in a worker process (world state in shared memory)")
+    args = parser.parse_args()
+    if args.record and args.physics_process:
+        # The worker ticks on its own clock, not once per recorded frame
+        parser.error("--record cannot be combined with --physics-process")
     try:
-        UnoHuskyController().run()
+        controller = cold_start(seed=args.seed, port=args.port)
+        print(f"🎲 Seed: {controller.game.seed}")
+        if args.resume:
+            load_recovery(controller.game)
+        if args.aim_assist is not None:
+            controller.game.set_aim_assist(args.aim_assist)
+        if args.physics_process:
+            from physics_process import PhysicsProcess
+            game = controller.game
+            controller.physics = PhysicsProcess(game.seed, game.aim_assist.strength if game.aim_assist else 0.0,
+                                                initial=game.snapshot())
+        REGISTRY.add_collector(controller.game.quality.metrics)
+        # Closing flushes the score queue and the shot-log columns, also when run() raises
+        with ScoreStore(booth=args.booth) as scores, ShotLog() as shot_log:
+            scores.attach(controller.game)
+            print_leaderboard(scores.top(args.booth)[:3], f"Best at booth {args.booth}")
+            shot_log.attach(controller.game, controller.launch_inputs)
+            exporter = MetricsExporter(port=args.metrics_port)
+            exporter.start()
+            try:
+                if args.record:
+                    from replay_export import SessionRecorder
+                    controller.recorder = SessionRecorder(args.record, controller.game)
+                controller.run()
+            finally:
+                exporter.stop()
     except Exception as e:
         print("Runtime error:", e)
@@ -0,0 +1,231 @@
+# metrics.py
+# -*- coding: utf-8 -*-
+"""
+Metrics registry for kiosk fleet monitoring.
+
+Counters, gauges and histograms live in one process-wide REGISTRY. Hot
+paths only bump numbers (well under a microsecond each); a background
+MetricsExporter thread periodically appends one JSON line to a rotating
+local file and, if a port is given, serves the Prometheus text format on
+localhost:
+
+    python main_uno.py --metrics-port 9108
+    curl http://127.0.0.1:9108/metrics
+"""
+import bisect
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+METRICS_FILE = "metrics.ndjson"
+METRICS_INTERVAL_S = 10.0
+MAX_FILE_BYTES = 5 * 1024 * 1024
+BACKUP_COUNT = 3          # metrics.ndjson.1 .. .3
+PROMETHEUS_PREFIX = "angry_birds_"
+FRAME_MS_BUCKETS = (4, 8, 12, 16.7, 20, 25, 33.3, 50, 100)
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help_text=""):
+        self.name = name
+        self.help = help_text
+        self.value = 0
+
+    def inc(self, amount=1):
+        self.value += amount
+
+
+class Gauge:
+    kind = "gauge"
+
+    def __init__(self, name, help_text=""):
+        self.name = name
+        self.help = help_text
+        self.value = 0
+
+    def set(self, value):
+        self.value = value
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help_text="", buckets=FRAME_MS_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.bounds = list(buckets)
+        self.counts = [0] * (len(self.bounds) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q):
+        """Upper bucket bound containing quantile q (coarse, for dashboards)"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bound, n in zip(self.bounds, self.counts):
+            seen += n
+            if seen >= target:
+                return bound
+        return float("inf")
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics = {}
+        self.collectors = []  # Callables returning {name: value}, read at export time
+
+    def _get(self, cls, name, help_text, **kwargs):
+        metric = self.metrics.get(name)
+        if metric is None:
+            metric = self.metrics[name] = cls(name, help_text, **kwargs)
+        return metric
+
+    def counter(self, name, help_text=""):
+        return self._get(Counter, name, help_text)
+
+    def gauge(self, name, help_text=""):
+        return self._get(Gauge, name, help_text)
+
+    def histogram(self, name, help_text="", buckets=FRAME_MS_BUCKETS):
+        return self._get(Histogram, name, help_text, buckets=buckets)
+
+    def add_collector(self, collect):
+        self.collectors.append(collect)
+
+    def _collected(self):
+        values = {}
+        for collect in self.collectors:
+            try:
+                values.update(collect())
+            except Exception as e:
+                print(f"⚠️ Metrics collector failed: {e}")
+        return values
+
+    def snapshot(self):
+        """Plain dict of every metric, for the NDJSON log"""
+        data = {}
+        for name, metric in self.metrics.items():
+            if metric.kind == "histogram":
+                data[name] = {"count": metric.count, "sum": round(metric.sum, 3),
+                              "p50": metric.quantile(0.5), "p95": metric.quantile(0.95)}
+            else:
+                data[name] = metric.value
+        data.update(self._collected())
+        return data
+
+    def prometheus_text(self):
+        lines = []
+        for name, metric in self.metrics.items():
+            full = PROMETHEUS_PREFIX + name
+            if metric.help:
+                lines.append(f"# HELP {full} {metric.help}")
+            lines.append(f"# TYPE {full} {metric.kind}")
+            if metric.kind == "histogram":
+                cumulative = 0
+                for bound, n in zip(metric.bounds + ["+Inf"], metric.counts):
+                    cumulative += n
+                    lines.append(f'{full}_bucket{{le="{bound}"}} {cumulative}')
+                lines.append(f"{full}_sum {metric.sum}")
+                lines.append(f"{full}_count {metric.count}")
+            else:
+                lines.append(f"{full} {metric.value}")
+        for name, value in self._collected().items():
+            if isinstance(value, (int, float)):  # Prometheus has no string samples
+                lines.append(f"# TYPE {PROMETHEUS_PREFIX}{name} gauge")
+                lines.append(f"{PROMETHEUS_PREFIX}{name} {float(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+
+class MetricsExporter(threading.Thread):
+    """Appends REGISTRY snapshots to a rotating NDJSON file; optional /metrics endpoint"""
+
+    def __init__(self, registry=REGISTRY, path=METRICS_FILE, interval_s=METRICS_INTERVAL_S, port=None):
+        super().__init__(daemon=True)
+        self.registry = registry
+        self.path = path
+        self.interval_s = interval_s
+        self.running = True
+        self.server = None
+        self._last = {}
+        self._last_time = time.monotonic()
+        if port:
+            self.server = self._serve(port)
+
+    def _serve(self, port):
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.prometheus_text().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        try:
+            server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        except OSError as e:
+            print(f"⚠️ Metrics endpoint unavailable on port {port}: {e}")
+            return None
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        print(f"📈 Prometheus metrics on http://127.0.0.1:{port}/metrics")
+        return server
+
+    def run(self):
+        while self.running:
+            time.sleep(self.interval_s)
+            self.write()
+
+    def write(self):
+        now = time.monotonic()
+        record = self.registry.snapshot()
+        # Per-second rates for counters since the previous line
+        elapsed = max(now - self._last_time, 1e-6)
+        for name, metric in self.registry.metrics.items():
+            if metric.kind == "counter":
+                record[name + "_per_s"] = round((metric.value - self._last.get(name, 0)) / elapsed, 3)
+                self._last[name] = metric.value
+        self._last_time = now
+        record["ts"] = round(time.time(), 3)
+        try:
+            self._rotate()
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            print(f"⚠️ Could not write metrics: {e}")
+
+    def _rotate(self):
+        if not os.path.exists(self.path) or os.path.getsize(self.path) < MAX_FILE_BYTES:
+            return
+        for i in range(BACKUP_COUNT - 1, 0, -1):
+            older = f"{self.path}.{i}"
+            if os.path.exists(older):
+                os.replace(older, f"{self.path}.{i + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    def stop(self):
+        self.running = False
+        self.write()
+        if self.server:
+            self.server.shutdown()
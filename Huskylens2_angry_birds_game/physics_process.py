@@ -0,0 +1,424 @@
+# physics_process.py
+# -*- coding: utf-8 -*-
+"""
+Optional split mode: physics in a worker process, rendering in this one.
+
+The worker owns a headless AngryBirdsGame and runs update() at a fixed
+60 Hz. After each tick it writes the world into one of two float64
+buffers in multiprocessing.shared_memory and then publishes that
+buffer's index. The buffer being written is never the published one,
+and each buffer carries a sequence number that is odd while a write is
+in progress (a seqlock). The render process copies the published buffer
+with a single memcpy, checks the sequence number is unchanged (retrying
+in the rare case the worker has lapped it) and only then applies the
+validated copy to its game.
+
+Gesture params, retry and quality changes go to the worker over a
+SimpleQueue (a pipe, no feeder thread); finished shots and levels come
+back over another and are handed to the render-side game's listeners.
+
+Buffer layout (float64 slots):
+    header    seq, tick, layout, score, level, aim, bird, counts
+    blocks    x, y, w, h, rgb, max_health, health, tier, destroyed
+    pigs      x, y, health, alive
+    trail     x, y per point
+    particles x, y, vx, vy, size, life, rgb, type
+
+Blocks and pigs are listed for the whole level (destroyed ones stay
+flagged), so rows only move when `layout` changes: a new level or a
+restore. The render side rebuilds its Block/Pig objects then and only
+copies health and flags on other frames.
+"""
+import multiprocessing
+import os
+import time
+from multiprocessing import shared_memory
+from quality import QUALITY_LEVELS
+from snapshot import PARTICLE_TYPE_NAMES, PARTICLE_TYPES
+
+TICK_HZ = 60
+MAX_BLOCKS = 64
+MAX_PIGS = 16
+MAX_TRAIL = 64
+MAX_PARTICLES = QUALITY_LEVELS[-1]['max_particles'] + 200  # Hits can add a burst after the trim
+READ_RETRIES = 4
+
+# Header slots
+SEQ, TICK, LAYOUT, SCORE, LEVEL, AIMING, AIM_POWER, AIM_ANGLE, CLOUD_OFFSET = range(9)
+BIRD_X, BIRD_Y, BIRD_VX, BIRD_VY, BIRD_LAUNCHED, BIRD_AIMING = range(9, 15)
+N_TRAIL, N_BLOCKS, N_PIGS, N_PARTICLES = range(15, 19)
+HEADER_SLOTS = 20
+
+BLOCK_SLOTS = 11
+PIG_SLOTS = 4
+PARTICLE_SLOTS = 10
+
+BLOCKS = HEADER_SLOTS
+PIGS = BLOCKS + MAX_BLOCKS * BLOCK_SLOTS
+TRAIL = PIGS + MAX_PIGS * PIG_SLOTS
+PARTICLES = TRAIL + MAX_TRAIL * 2
+BUFFER_SLOTS = PARTICLES + MAX_PARTICLES * PARTICLE_SLOTS
+
+# Control slots ahead of the two buffers
+LATEST = 0          # Index of the last completed buffer, -1 before the first tick
+CONTROL_SLOTS = 2
+SHM_BYTES = (CONTROL_SLOTS + 2 * BUFFER_SLOTS) * 8
+
+
+def _views(shm):
+    """(control, buffer 0, buffer 1) float64 views of the segment, no copies"""
+    slots = shm.buf.cast('d')
+    return (slots[:CONTROL_SLOTS],
+            slots[CONTROL_SLOTS:CONTROL_SLOTS + BUFFER_SLOTS],
+            slots[CONTROL_SLOTS + BUFFER_SLOTS:CONTROL_SLOTS + 2 * BUFFER_SLOTS],
+            slots)
+
+
+def write_world(view, game, blocks, pigs, layout):
+    """Write one tick into `view`; blocks/pigs are the level's full lists"""
+    view[SEQ] += 1  # Odd: write in progress
+    bird = game.bird
+    view[TICK] = game.time_counter
+    view[LAYOUT] = layout
+    view[SCORE] = game.score
+    view[LEVEL] = game.level
+    view[AIMING] = game.is_aiming
+    view[AIM_POWER] = game.aim_power
+    view[AIM_ANGLE] = game.aim_angle
+    view[CLOUD_OFFSET] = game.cloud_offset
+    view[BIRD_X] = bird.x
+    view[BIRD_Y] = bird.y
+    view[BIRD_VX] = bird.vx
+    view[BIRD_VY] = bird.vy
+    view[BIRD_LAUNCHED] = bird.is_launched
+    view[BIRD_AIMING] = bird.is_aiming
+
+    base = BLOCKS
+    for block in blocks[:MAX_BLOCKS]:
+        r, g, b = block.original_color
+        view[base] = block.x
+        view[base + 1] = block.y
+        view[base + 2] = block.width
+        view[base + 3] = block.height
+        view[base + 4] = r
+        view[base + 5] = g
+        view[base + 6] = b
+        view[base + 7] = block.max_health
+        view[base + 8] = block.health
+        view[base + 9] = block.tier
+        view[base + 10] = block.is_destroyed
+        base += BLOCK_SLOTS
+    view[N_BLOCKS] = min(len(blocks), MAX_BLOCKS)
+
+    base = PIGS
+    for pig in pigs[:MAX_PIGS]:
+        view[base] = pig.x
+        view[base + 1] = pig.y
+        view[base + 2] = pig.health
+        view[base + 3] = pig.is_alive
+        base += PIG_SLOTS
+    view[N_PIGS] = min(len(pigs), MAX_PIGS)
+
+    base = TRAIL
+    trail = bird.trail.points()[-MAX_TRAIL:]
+    for x, y in trail:
+        view[base] = x
+        view[base + 1] = y
+        base += 2
+    view[N_TRAIL] = len(trail)
+
+    base = PARTICLES
+    types = PARTICLE_TYPES
+    particles = game.particles[-MAX_PARTICLES:]
+    for p in particles:
+        r, g, b = p['color']
+        view[base] = p['x']
+        view[base + 1] = p['y']
+        view[base + 2] = p['vx']
+        view[base + 3] = p['vy']
+        view[base + 4] = p['size']
+        view[base + 5] = p['life']
+        view[base + 6] = r
+        view[base + 7] = g
+        view[base + 8] = b
+        view[base + 9] = types.get(p.get('type'), 0)
+        base += PARTICLE_SLOTS
+    view[N_PARTICLES] = len(particles)
+    view[SEQ] += 1  # Even: complete
+
+
+def _worker_main(shm_name, inbox, outbox, seed, aim_assist, initial, tick_hz):
+    """Worker process: headless game, fixed-rate update(), publish every tick"""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    import pygame
+    from angry_birds_game import LOGICAL_HEIGHT, LOGICAL_WIDTH, AngryBirdsGame
+
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    game = AngryBirdsGame(screen=pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT)),
+                          seed=seed, aim_assist=aim_assist)
+    if initial:
+        game.restore(initial)
+    game.shot_listeners.append(lambda result: outbox.put(("shot", result)))
+    game.level_listeners.append(lambda level, score: outbox.put(("level", (level, score))))
+    shm = shared_memory.SharedMemory(name=shm_name)
+    control, *buffers, slots = _views(shm)
+
+    layout = 0
+    level = game.level
+    blocks, pigs = list(game.blocks), list(game.pigs)
+    interval = 1.0 / tick_hz
+    next_t = time.perf_counter()
+    running = True
+    while running:
+        relayout = False
+        while not inbox.empty():
+            message = inbox.get()
+            if message is None:
+                running = False
+                break
+            kind, value = message
+            if kind == "input":
+                game.handle_gesture_input(value)
+            elif kind == "retry":
+                relayout = game.retry_shot()
+            elif kind == "restore":
+                game.restore(value)
+                relayout = True
+            elif kind == "aim_assist":
+                game.set_aim_assist(value)
+            elif kind == "quality":
+                game.quality.set_level(value)
+        if not running:
+            break
+
+        game.update()
+        if relayout or game.level != level:
+            level = game.level
+            blocks, pigs = list(game.blocks), list(game.pigs)
+            layout += 1
+
+        back = 0 if control[LATEST] == 1 else 1
+        write_world(buffers[back], game, blocks, pigs, layout)
+        control[LATEST] = back
+
+        next_t += interval
+        wait = next_t - time.perf_counter()
+        if wait > 0:
+            time.sleep(wait)
+        else:
+            next_t = time.perf_counter()  # Fell behind: don't try to catch up in a burst
+
+    for view in (control, *buffers, slots):
+        view.release()
+    shm.close()
+    pygame.quit()
+
+
+class PhysicsProcess:
+    def __init__(self, seed, aim_assist=0.0, initial=None, tick_hz=TICK_HZ):
+        """initial: optional snapshot bytes the worker starts from (e.g. after --resume)"""
+        ctx = multiprocessing.get_context("spawn")  # No forked SDL state in the worker
+        self.shm = shared_memory.SharedMemory(create=True, size=SHM_BYTES)
+        self.control, *self.buffers, self._slots = _views(self.shm)
+        self.control[LATEST] = -1
+        self.inbox = ctx.SimpleQueue()
+        self.outbox = ctx.SimpleQueue()
+        self.process = ctx.Process(target=_worker_main, name="physics",
+                                   args=(self.shm.name, self.inbox, self.outbox, seed, aim_assist,
+                                         initial, tick_hz),
+                                   daemon=True)
+        self.process.start()
+        self.tick = -1
+        self.layout = -1
+        self.blocks = []   # Level's full block list, in row order
+        self.pigs = []
+        self._particle_pool = []
+        self._quality_level = None
+        print(f"🧵 Physics worker started (pid {self.process.pid})")
+
+    def send_input(self, params):
+        self.inbox.put(("input", params))
+
+    def retry_shot(self):
+        self.inbox.put(("retry", None))
+
+    def restore(self, data):
+        self.inbox.put(("restore", data))
+
+    def set_aim_assist(self, strength):
+        self.inbox.put(("aim_assist", strength))
+
+    def apply_to(self, game):
+        """
+        Copy the latest completed tick into `game` for drawing.
+        Returns False when there is no new tick yet (game left as is).
+        """
+        self._dispatch_events(game)
+        if game.quality.level != self._quality_level:
+            self._quality_level = game.quality.level
+            self.inbox.put(("quality", self._quality_level))
+        for _ in range(READ_RETRIES):
+            latest = int(self.control[LATEST])
+            if latest < 0:
+                return False
+            view = self.buffers[latest]
+            seq = view[SEQ]
+            if seq % 2:
+                continue  # Lapped by the writer; the other buffer is complete now
+            if view[TICK] == self.tick:
+                return False
+            # One memcpy of the buffer, validated before the game sees any of it
+            local = memoryview(view.tobytes()).cast('d')
+            if view[SEQ] != seq:
+                continue  # Torn: the writer came back to this buffer mid-copy
+            self._apply(local, game)
+            self.tick = local[TICK]
+            return True
+        return False
+
+    def _dispatch_events(self, game):
+        """Hand the worker's finished shots and levels to the game's listeners"""
+        while not self.outbox.empty():
+            kind, value = self.outbox.get()
+            if kind == "shot":
+                for listener in game.shot_listeners:
+                    listener(value)
+            else:
+                for listener in game.level_listeners:
+                    listener(*value)
+
+    def _apply(self, view, game):
+        if view[LAYOUT] != self.layout:
+            self._relayout(view, game)
+        game.time_counter = int(view[TICK])
+        game.score = int(view[SCORE])
+        game.is_aiming = bool(view[AIMING])
+        game.aim_power = view[AIM_POWER]
+        game.aim_angle = view[AIM_ANGLE]
+        game.cloud_offset = view[CLOUD_OFFSET]
+
+        bird = game.bird
+        bird.x = view[BIRD_X]
+        bird.y = view[BIRD_Y]
+        bird.vx = view[BIRD_VX]
+        bird.vy = view[BIRD_VY]
+        bird.is_launched = bool(view[BIRD_LAUNCHED])
+        bird.is_aiming = bool(view[BIRD_AIMING])
+        trail = bird.trail
+        trail.set_capacity(game.quality.settings['trail_length'])
+        trail.clear()
+        base = TRAIL
+        for _ in range(int(view[N_TRAIL])):
+            trail.append(view[base], view[base + 1])
+            base += 2
+
+        # Health and flags only; rows are stable within a layout
+        destroyed_changed = False
+        base = BLOCKS
+        for block in self.blocks:
+            block.health = view[base + 8]
+            tier = int(view[base + 9])
+            if tier != block.tier:
+                block.tier = tier
+                if tier:
+                    block._sprite_key = block.sprite_key(tier)
+            destroyed = bool(view[base + 10])
+            if destroyed != block.is_destroyed:
+                block.is_destroyed = destroyed
+                destroyed_changed = True
+            base += BLOCK_SLOTS
+        base = PIGS
+        for pig in self.pigs:
+            pig.health = view[base + 2]
+            alive = bool(view[base + 3])
+            if alive != pig.is_alive:
+                pig.is_alive = alive
+                destroyed_changed = True
+            base += PIG_SLOTS
+        if destroyed_changed:
+            game.blocks = [b for b in self.blocks if not b.is_destroyed]
+            game.pigs = [p for p in self.pigs if p.is_alive]
+            game.shadows.invalidate()
+
+        # Particle dicts are reused; draw_particles may drop some, the pool keeps them
+        count = int(view[N_PARTICLES])
+        pool = self._particle_pool
+        while len(pool) < count:
+            pool.append({})
+        names = PARTICLE_TYPE_NAMES
+        base = PARTICLES
+        for i in range(count):
+            p = pool[i]
+            p['x'] = view[base]
+            p['y'] = view[base + 1]
+            p['vx'] = view[base + 2]
+            p['vy'] = view[base + 3]
+            p['size'] = view[base + 4]
+            p['life'] = view[base + 5]
+            p['color'] = (int(view[base + 6]), int(view[base + 7]), int(view[base + 8]))
+            kind = int(view[base + 9])
+            if kind:
+                p['type'] = names[kind]
+            else:
+                p.pop('type', None)
+            base += PARTICLE_SLOTS
+        game.particles = pool[:count]
+
+    def _relayout(self, view, game):
+        """New level or restore in the worker: rebuild blocks and pigs from the rows"""
+        # Imported here: angry_birds_game is heavy and the worker imports it itself
+        from angry_birds_game import Block, Pig
+        from atlas import build_scene_atlas
+
+        level = int(view[LEVEL])
+        level_changed = level != game.level
+        game.level = level
+        blocks = []
+        base = BLOCKS
+        for _ in range(int(view[N_BLOCKS])):
+            x, y, w, h, r, g, b, max_health, health, tier, destroyed = view[base:base + BLOCK_SLOTS].tolist()
+            block = Block(x, y, int(w), int(h), (int(r), int(g), int(b)))
+            block.max_health = max_health
+            block.health = health
+            block.tier = int(tier)
+            block.is_destroyed = bool(destroyed)
+            if block.tier:
+                block._sprite_key = block.sprite_key(block.tier)
+            block.on_tier_change = game.on_block_tier_change  # In case the game runs locally again
+            blocks.append(block)
+            base += BLOCK_SLOTS
+        # Pigs are reused where possible: constructing one loads its sprite
+        old_pigs = list(game.pigs)
+        pigs = []
+        base = PIGS
+        for _ in range(int(view[N_PIGS])):
+            x, y, health, alive = view[base:base + PIG_SLOTS].tolist()
+            pig = old_pigs.pop() if old_pigs else Pig(x, y)
+            pig.x, pig.y, pig.health, pig.is_alive = x, y, health, bool(alive)
+            pigs.append(pig)
+            base += PIG_SLOTS
+        self.blocks = blocks
+        self.pigs = pigs
+        self.layout = view[LAYOUT]
+        game.blocks = [b for b in blocks if not b.is_destroyed]
+        game.pigs = [p for p in pigs if p.is_alive]
+        game.shadows.invalidate()
+        if level_changed or game.atlas is None or any(
+                b.sprite_key() not in game.atlas for b in game.blocks):
+            game.atlas = build_scene_atlas(game.blocks, game.pigs, game.slingshot)
+
+    def is_alive(self):
+        return self.process.is_alive()
+
+    def stop(self):
+        if self.process.is_alive():
+            self.inbox.put(None)
+            self.process.join(timeout=2.0)
+            if self.process.is_alive():
+                self.process.terminate()
+        for view in (self.control, *self.buffers, self._slots):
+            view.release()
+        self.shm.close()
+        self.shm.unlink()
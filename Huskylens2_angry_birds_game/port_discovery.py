@@ -0,0 +1,214 @@
+# port_discovery.py
+# -*- coding: utf-8 -*-
+"""
+Serial port discovery for the UNO+HUSKYLENS bridge.
+
+The last verified device is cached by VID/PID/serial number, so it is
+found again even when the OS hands it a different COM name. Candidates
+are verified by the sketch's {"status":"ready"} banner (or any gesture
+message) instead of guessing, and a lost device is polled for with a
+short backoff so a re-plug reconnects well under a second. An explicit
+port (COM_PORT, or one player's port in sessions.py) is the only port tried.
+"""
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import serial
+import serial.tools.list_ports
+from metrics import REGISTRY
+
+PORT_CACHE_FILE = "serial_port_cache.json"
+PORT_KEYWORDS = ["arduino", "wchusb", "ch340", "usb-serial"]
+VERIFY_TIMEOUT_S = 3.0     # The UNO resets on open; the sketch waits for the HUSKYLENS
+UNKNOWN_TIMEOUT_S = 1.0    # Unrecognised ports are probed together, so a shorter wait
+BACKOFF_START_S = 0.05
+BACKOFF_MAX_S = 0.4
+RETRY_UNCHANGED_S = 2.0    # Re-probe recognised ports even if no hot-plug was seen
+
+SERIAL_RECONNECTS = REGISTRY.counter("serial_reconnects_total", "Serial device re-found after loss")
+
+
+def _identity(port):
+    return {"vid": port.vid, "pid": port.pid, "serial_number": port.serial_number}
+
+
+def _is_sketch_line(line):
+    """True if a line could only have come from our sketch"""
+    return line.startswith(b"{") and (b'"status":"ready"' in line or b'"gesture":' in line)
+
+
+class PortDiscovery:
+    def __init__(self, baudrate, preferred=None, cache_path=PORT_CACHE_FILE):
+        self.baudrate = baudrate
+        self.preferred = preferred  # Explicit COM_PORT/--port: the only port ever tried
+        self.cache_path = cache_path
+        self.cache_key = preferred or "auto"  # One entry per player port; they share the file
+        self.cache = self._load_cache().get(self.cache_key, {})
+        self.port_info = None
+        self.stats = {"startup_s": None, "last_recovery_s": None, "reconnects": 0}
+        self._created = time.perf_counter()
+        self._lost_at = None
+
+    def _load_cache(self):
+        """{cache key: {vid, pid, serial_number, device}} from the cache file"""
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(entries, dict):
+            return {}
+        if "vid" in entries:  # Old single-device file
+            return {"auto": entries}
+        return entries
+
+    def _save_cache(self, port):
+        self.cache = dict(_identity(port), device=port.device)
+        entries = self._load_cache()  # Re-read: other players may have written theirs
+        entries[self.cache_key] = self.cache
+        try:
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+        except OSError as e:
+            print(f"⚠️ Failed to write port cache {self.cache_path}: {e}")
+
+    def _is_cached(self, port):
+        if not self.cache or port.vid is None:
+            return False
+        ident = _identity(port)
+        return all(ident[k] == self.cache.get(k) for k in ("vid", "pid", "serial_number"))
+
+    def ranked_ports(self, include_unknown=False):
+        """Ports most likely to be our device first"""
+        ports = list(serial.tools.list_ports.comports())
+        ranked = []
+        for p in ports:
+            desc = f"{p.description} {p.hwid}".lower()
+            if self._is_cached(p):
+                rank = 0
+            elif p.device == self.cache.get("device"):
+                rank = 1
+            elif any(k in desc for k in PORT_KEYWORDS):
+                rank = 2
+            elif include_unknown:
+                rank = 3
+            else:
+                continue
+            ranked.append((rank, p))
+        ranked.sort(key=lambda item: item[0])
+        return [p for _, p in ranked]
+
+    def _open_verified(self, port, timeout=VERIFY_TIMEOUT_S):
+        """Open a port and wait for proof that our sketch is on the other end"""
+        ser = serial.Serial(port.device, self.baudrate, timeout=0.1)
+        try:
+            deadline = time.perf_counter() + timeout
+            while time.perf_counter() < deadline:
+                if _is_sketch_line(ser.readline().strip()):
+                    return ser
+        except BaseException:
+            ser.close()  # Never leak the handle when the port fails mid-check
+            raise
+        if self._is_cached(port) or port.device == self.preferred:
+            return ser  # Known device that is simply quiet (e.g. no reset on open)
+        ser.close()
+        return None
+
+    def try_connect(self, include_unknown=True):
+        """
+        One discovery pass; returns an open, verified Serial or None.
+        include_unknown=False skips ports that look like nothing we know.
+        """
+        if self.preferred:
+            # Never fall through to other ports: in sessions.py they belong to other players
+            return self._connect_preferred()
+        known = self.ranked_ports()
+        for port in known:
+            try:
+                ser = self._open_verified(port)
+            except (serial.SerialException, OSError):
+                continue
+            if ser:
+                return self._accept(port, ser)
+        if not include_unknown:
+            return None
+        # Nothing recognisable answered: try every other port at once
+        tried = {p.device for p in known}
+        unknown = [p for p in self.ranked_ports(include_unknown=True) if p.device not in tried]
+        return self._probe_parallel(unknown)
+
+    def _connect_preferred(self):
+        port = next((p for p in serial.tools.list_ports.comports() if p.device == self.preferred), None)
+        try:
+            if port is None:
+                # Explicit port that is not enumerated (e.g. a pty); trust the user
+                return serial.Serial(self.preferred, self.baudrate, timeout=0.2)
+            ser = self._open_verified(port)
+        except (serial.SerialException, OSError):
+            return None
+        return self._accept(port, ser) if ser else None
+
+    def _probe_parallel(self, ports):
+        """Verify several ports concurrently; the first to show the banner wins"""
+        if not ports:
+            return None
+        winner = None
+        with ThreadPoolExecutor(max_workers=len(ports)) as pool:
+            futures = {pool.submit(self._open_verified, p, UNKNOWN_TIMEOUT_S): p for p in ports}
+            for future in as_completed(futures):
+                try:
+                    ser = future.result()
+                except (serial.SerialException, OSError):
+                    continue
+                if ser and winner is None:
+                    winner = self._accept(futures[future], ser)
+                elif ser:
+                    ser.close()
+        return winner
+
+    def _accept(self, port, ser):
+        self.port_info = port
+        self._save_cache(port)
+        return ser
+
+    def connect(self, keep_running=lambda: True):
+        """
+        Poll with backoff until a verified device is available. Unknown
+        ports are only opened when the device list changes (opening resets
+        many boards); recognised ones are also retried every RETRY_UNCHANGED_S.
+        """
+        backoff = BACKOFF_START_S
+        known = None
+        last_try = 0.0
+        while keep_running():
+            devices = {p.device for p in serial.tools.list_ports.comports()}
+            now = time.perf_counter()
+            changed = devices != known
+            if changed or now - last_try > RETRY_UNCHANGED_S:
+                known = devices
+                last_try = now
+                ser = self.try_connect(include_unknown=changed)
+                if ser:
+                    self._report()
+                    return ser
+            time.sleep(backoff)
+            backoff = min(backoff * 2, BACKOFF_MAX_S)
+        return None
+
+    def mark_lost(self):
+        """Call when the open port fails; starts the recovery timer"""
+        if self._lost_at is None:
+            self._lost_at = time.perf_counter()
+
+    def _report(self):
+        now = time.perf_counter()
+        name = self.port_info.device if self.port_info else self.preferred
+        if self._lost_at is not None:
+            self.stats["last_recovery_s"] = now - self._lost_at
+            self.stats["reconnects"] += 1
+            SERIAL_RECONNECTS.inc()
+            self._lost_at = None
+            print(f"🔌 Serial reconnected: {name} in {self.stats['last_recovery_s'] * 1000:.0f} ms")
+        elif self.stats["startup_s"] is None:
+            self.stats["startup_s"] = now - self._created
+            print(f"🔌 Serial connected: {name} @ {self.baudrate} in {self.stats['startup_s'] * 1000:.0f} ms")
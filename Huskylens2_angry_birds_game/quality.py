@@ -0,0 +1,79 @@
+# quality.py
+# -*- coding: utf-8 -*-
+"""
+Adaptive quality governor.
+
+Watches the frame-time percentile over a sliding window and steps the
+visual quality down when frames run long (big explosions) and back up
+when there is headroom again. The game reads `governor.settings` for
+trail length, particle budget, glow layers and cloud layers.
+"""
+from collections import deque
+
+# Lowest quality first
+QUALITY_LEVELS = [
+    {"name": "minimal", "trail_length": 6,  "max_particles": 60,  "particle_glow": False, "spark_trail": 2, "cloud_layers": 1},
+    {"name": "low",     "trail_length": 10, "max_particles": 120, "particle_glow": False, "spark_trail": 4, "cloud_layers": 2},
+    {"name": "medium",  "trail_length": 20, "max_particles": 250, "particle_glow": True,  "spark_trail": 6, "cloud_layers": 3},
+    {"name": "high",    "trail_length": 30, "max_particles": 600, "particle_glow": True,  "spark_trail": 9, "cloud_layers": 5},
+]
+
+TARGET_FRAME_MS = 1000.0 / 60
+DEGRADE_RATIO = 1.1    # p95 above target * ratio -> drop a level
+RESTORE_RATIO = 0.7    # p95 below target * ratio -> raise a level
+WINDOW_FRAMES = 120
+PERCENTILE = 95
+COOLDOWN_FRAMES = 45   # Frames to observe after a change before judging again
+
+
+class QualityGovernor:
+    def __init__(self, target_ms=TARGET_FRAME_MS, window=WINDOW_FRAMES,
+                 percentile=PERCENTILE, cooldown=COOLDOWN_FRAMES, level=None):
+        self.target_ms = target_ms
+        self.percentile = percentile
+        self.cooldown = cooldown
+        self.samples = deque(maxlen=window)
+        self.level = len(QUALITY_LEVELS) - 1 if level is None else level
+        self.settings = QUALITY_LEVELS[self.level]
+        self.changes = 0
+        self.last_pct_ms = 0.0
+        self._since_change = 0
+
+    def _pct(self):
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, int(len(ordered) * self.percentile / 100))
+        return ordered[index]
+
+    def record(self, frame_ms):
+        """Feed the work time of one frame (excluding the vsync/tick sleep)"""
+        self.samples.append(frame_ms)
+        self._since_change += 1
+        if self._since_change < self.cooldown or len(self.samples) < self.cooldown:
+            return
+        self._since_change = 0
+        self.last_pct_ms = self._pct()
+        if self.last_pct_ms > self.target_ms * DEGRADE_RATIO and self.level > 0:
+            self.set_level(self.level - 1)
+        elif self.last_pct_ms < self.target_ms * RESTORE_RATIO and self.level < len(QUALITY_LEVELS) - 1:
+            self.set_level(self.level + 1)
+        else:
+            return
+        print(f"🎚️ Quality -> {self.settings['name']} (p{self.percentile} {self.last_pct_ms:.1f} ms)")
+
+    def set_level(self, level):
+        """Switch to a quality level (also used to mirror another process's governor)"""
+        if level == self.level:
+            return
+        self.level = level
+        self.settings = QUALITY_LEVELS[level]
+        self.changes += 1
+        self.samples.clear()
+
+    def metrics(self):
+        """Current quality state for monitoring"""
+        return {
+            "quality_level": self.level,
+            "quality_name": self.settings["name"],
+            "quality_changes": self.changes,
+            f"frame_ms_p{self.percentile}": self.last_pct_ms,
+        }
@@ -0,0 +1,234 @@
+# replay_export.py
+# -*- coding: utf-8 -*-
+"""
+Record kiosk sessions and export them to video offscreen.
+
+A recording is a header (seed, aim assist strength and a snapshot of
+the world when recording started, e.g. after --resume) plus the gesture
+parameters fed to AngryBirdsGame.handle_gesture_input on every frame and
+any shot retries, so a headless replay reproduces the session exactly.
+Export renders each frame into an offscreen Surface and hands the raw
+bytes through a bounded queue to a background encoder: an ffmpeg pipe
+(ffmpeg must be on PATH) or a PNG sequence compressed by a process pool.
+
+Usage:
+    python main_uno.py --record session.jsonl
+    python replay_export.py session.jsonl highlight.mp4
+    python replay_export.py session.jsonl frames/ --png
+"""
+import argparse
+import base64
+import json
+import multiprocessing
+import os
+import queue
+import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+RECORDING_VERSION = 2
+EXPORT_QUEUE_SIZE = 8   # Frames buffered between renderer and encoder
+EXPORT_PUT_TIMEOUT_S = 0.5  # How often a blocked renderer checks the encoder is alive
+RETRY = "retry"         # Event line: the player rewound the last shot (R key)
+
+
+class SessionRecorder:
+    """Append one compact JSON line of gesture parameters per frame"""
+
+    def __init__(self, path, game):
+        self.seed = game.seed  # Replays rebuild the same RNG streams
+        self.file = open(path, "w", encoding="utf-8")
+        self.file.write(json.dumps({
+            "version": RECORDING_VERSION,
+            "seed": self.seed,
+            "aim_assist": game.aim_assist.strength if game.aim_assist else 0.0,
+            "start": base64.b64encode(game.snapshot()).decode("ascii"),  # Resumed games start mid-level
+        }) + "\n")
+        self.frames = 0
+
+    def record(self, params):
+        self.file.write(json.dumps([
+            round(float(params["power"]), 3),
+            round(float(params["angle"]), 5),
+            1 if params["should_launch"] else 0,
+        ]) + "\n")
+        self.frames += 1
+
+    def record_retry(self):
+        self.file.write(json.dumps(RETRY) + "\n")
+
+    def close(self):
+        self.file.close()
+        print(f"💾 Recorded {self.frames} frames")
+
+
+def load_recording(path):
+    with open(path, "r", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("version") not in (1, RECORDING_VERSION):  # v1: seed only
+            raise ValueError(f"Unsupported recording version in {path}")
+        frames = []  # Gesture params per frame, or RETRY between frames
+        for line in f:
+            event = json.loads(line)
+            if event == RETRY:
+                frames.append(RETRY)
+                continue
+            power, angle, launch = event
+            frames.append({"power": power, "angle": angle, "should_launch": bool(launch)})
+    return header, frames
+
+
+class FfmpegEncoder:
+    """Raw RGB frames piped to an ffmpeg process"""
+
+    def __init__(self, output, size, fps):
+        try:
+            self.proc = subprocess.Popen([
+                "ffmpeg", "-loglevel", "error", "-y",
+                "-f", "rawvideo", "-pix_fmt", "rgb24",
+                "-s", f"{size[0]}x{size[1]}", "-r", str(fps), "-i", "-",
+                "-c:v", "libx264", "-preset", "veryfast", "-pix_fmt", "yuv420p", output,
+            ], stdin=subprocess.PIPE)
+        except FileNotFoundError:
+            raise RuntimeError("ffmpeg not found on PATH: install it or export with --png")
+
+    def write(self, index, data):
+        self.proc.stdin.write(data)
+
+    def close(self):
+        self.proc.stdin.close()
+        code = self.proc.wait()
+        if code != 0:
+            raise RuntimeError(f"ffmpeg exited with code {code}")
+
+    def abort(self):
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass  # Broken pipe: ffmpeg is already gone
+        self.proc.kill()
+        self.proc.wait()
+
+
+def _save_png(path, data, size):
+    """Pool worker: PNG compression is the slow part of a PNG export"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    pygame.image.save(pygame.image.frombuffer(data, size, "RGB"), path)
+
+
+class PngSequenceEncoder:
+    """Numbered PNG files, e.g. for editing in other tools, compressed on every core"""
+
+    def __init__(self, output, size, fps):
+        self.output = output
+        self.size = size
+        os.makedirs(output, exist_ok=True)
+        self.workers = max(1, (os.cpu_count() or 2) - 1)  # One core stays with the renderer
+        # Spawned, not forked: the parent already has SDL initialised
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        self.in_flight = deque()
+
+    def write(self, index, data):
+        if len(self.in_flight) >= self.workers * 2:
+            self.in_flight.popleft().result()  # Bound memory; also surfaces worker errors
+        path = os.path.join(self.output, f"frame_{index:06d}.png")
+        self.in_flight.append(self.pool.submit(_save_png, path, data, self.size))
+
+    def close(self):
+        while self.in_flight:
+            self.in_flight.popleft().result()
+        self.pool.shutdown()
+
+    def abort(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _encoder_worker(encoder, frames, errors):
+    """Encode until the None sentinel; a failure is stored in `errors` for the renderer"""
+    index = 0
+    try:
+        while True:
+            data = frames.get()
+            if data is None:
+                break
+            encoder.write(index, data)
+            index += 1
+        encoder.close()
+    except Exception as e:
+        errors.append(e)
+        encoder.abort()
+
+
+def _hand_off(pending, data, worker, errors):
+    """Queue one frame without blocking forever on an encoder that died"""
+    while True:
+        if errors:
+            raise errors[0]
+        try:
+            pending.put(data, timeout=EXPORT_PUT_TIMEOUT_S)
+            return
+        except queue.Full:
+            if not worker.is_alive():
+                raise errors[0] if errors else RuntimeError("Encoder stopped unexpectedly")
+
+
+def export_session(record_path, output, fmt="ffmpeg", fps=60):
+    """Replay a recording headless and encode every frame; returns frames/second"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from angry_birds_game import LOGICAL_HEIGHT, LOGICAL_WIDTH, AngryBirdsGame
+
+    # pygame >= 2.1.3 renamed tostring to tobytes
+    tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+
+    header, frames = load_recording(record_path)
+    pygame.init()
+    surface = pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT))
+    game = AngryBirdsGame(screen=surface, seed=header["seed"], aim_assist=header.get("aim_assist", 0.0))
+    if header.get("start"):
+        game.restore(base64.b64decode(header["start"]))
+
+    size = surface.get_size()
+    encoder = (PngSequenceEncoder if fmt == "png" else FfmpegEncoder)(output, size, fps)
+    pending = queue.Queue(maxsize=EXPORT_QUEUE_SIZE)
+    errors = []
+    worker = threading.Thread(target=_encoder_worker, args=(encoder, pending, errors), daemon=True)
+    worker.start()
+
+    start = time.perf_counter()
+    try:
+        for params in frames:
+            if params == RETRY:
+                game.retry_shot()
+                continue
+            game.handle_gesture_input(params)
+            game.update()
+            game.draw()
+            # tobytes is the single copy; the queue only passes the reference on
+            _hand_off(pending, tobytes(surface, "RGB"), worker, errors)
+        _hand_off(pending, None, worker, errors)
+        worker.join()
+        if errors:
+            raise errors[0]
+    finally:
+        pygame.quit()
+    elapsed = time.perf_counter() - start
+
+    count = sum(1 for params in frames if params != RETRY)
+    rate = count / elapsed if elapsed > 0 else 0.0
+    print(f"🎬 Exported {count} frames to {output} at {rate:.0f} fps "
+          f"({rate / fps:.1f}x real time)")
+    return rate
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export a recorded session to video")
+    parser.add_argument("recording", help="File written by main_uno.py --record")
+    parser.add_argument("output", help="Video file, or a directory with --png")
+    parser.add_argument("--png", action="store_true", help="Write a PNG sequence instead of using ffmpeg")
+    parser.add_argument("--fps", type=int, default=60)
+    args = parser.parse_args()
+    export_session(args.recording, args.output, fmt="png" if args.png else "ffmpeg", fps=args.fps)
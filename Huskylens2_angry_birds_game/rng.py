@@ -0,0 +1,44 @@
+# rng.py
+# -*- coding: utf-8 -*-
+"""
+Seeded random streams owned by a game instance.
+
+Each subsystem draws from its own random.Random, so spawning particles
+never shifts the numbers a level is generated from. Levels are
+generated from derive_seed(seed, "levelgen", level) alone (see
+levelgen.py), which makes them reproducible regardless of what happened
+earlier in the session.
+"""
+import hashlib
+import os
+import random
+
+SEED_ENV_VAR = "ANGRY_BIRDS_SEED"
+
+
+def derive_seed(seed, *parts):
+    """Stable 64-bit seed for a (seed, part...) tuple, same on every platform"""
+    digest = hashlib.sha256(repr((seed,) + parts).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "little")
+
+
+def default_seed():
+    """Seed from $ANGRY_BIRDS_SEED, or a fresh random one"""
+    value = os.environ.get(SEED_ENV_VAR)
+    if value:
+        return int(value)
+    return random.SystemRandom().randrange(2 ** 31)
+
+
+class GameRandom:
+    STREAMS = ("particles", "background")
+
+    def __init__(self, seed=None):
+        self.seed = default_seed() if seed is None else int(seed)
+        for name in self.STREAMS:
+            setattr(self, name, random.Random(derive_seed(self.seed, name)))
+
+    def reset_background(self):
+        """Rewind the background stream so static decoration is identical every frame"""
+        self.background.seed(derive_seed(self.seed, "background"))
+        return self.background
@@ -0,0 +1,220 @@
+# scores.py
+# -*- coding: utf-8 -*-
+"""
+Local high scores and session history in SQLite.
+
+The game thread never touches the disk: shot results, level completions
+and score updates from AngryBirdsGame's shot/level listeners are put on
+an in-memory queue, and a background writer thread commits them in
+batches to a WAL-mode database. Leaderboards are served from an
+in-memory top-N cache that is loaded once at startup and kept current
+as scores come in.
+
+    python scores.py                 # leaderboard of every booth
+    python scores.py --booth hall-a  # one booth
+"""
+import argparse
+import os
+import queue
+import sqlite3
+import threading
+import time
+import uuid
+from metrics import REGISTRY
+
+SCORE_DB = "scores.db"
+BOOTH_ID = os.environ.get("ANGRY_BIRDS_BOOTH", "default")
+TOP_N = 10
+BATCH_SIZE = 200          # Rows per transaction at most
+FLUSH_INTERVAL_S = 1.0    # Longest a row waits in the queue
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY, booth TEXT, seed INTEGER,
+    started REAL, ended REAL, score INTEGER, level INTEGER);
+CREATE TABLE IF NOT EXISTS shots (
+    session TEXT, ts REAL, level INTEGER, power REAL, angle REAL,
+    pigs_hit INTEGER, blocks_broken INTEGER, score_delta INTEGER, ticks INTEGER);
+CREATE TABLE IF NOT EXISTS levels (
+    session TEXT, ts REAL, level INTEGER, score INTEGER);
+CREATE INDEX IF NOT EXISTS sessions_booth_score ON sessions (booth, score DESC);
+"""
+
+_UPSERT_SESSION = ("INSERT INTO sessions (id, booth, seed, started, ended, score, level) VALUES (?, ?, ?, ?, ?, ?, ?) "
+                   "ON CONFLICT(id) DO UPDATE SET ended = excluded.ended, score = excluded.score, level = excluded.level")
+_INSERT_SHOT = "INSERT INTO shots VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_INSERT_LEVEL = "INSERT INTO levels VALUES (?, ?, ?, ?)"
+
+ROWS_WRITTEN = REGISTRY.counter("score_rows_written_total", "Rows committed to the score database")
+WRITE_ERRORS = REGISTRY.counter("score_write_errors_total", "Score database batches that failed")
+
+
+def _connect(path):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")  # WAL keeps this crash-safe; only the last batch is at risk
+    conn.executescript(SCHEMA)
+    return conn
+
+
+class Leaderboard:
+    """Top-N session scores per booth (and overall under booth None)"""
+
+    def __init__(self, top_n=TOP_N):
+        self.top_n = top_n
+        self.boards = {}  # booth -> [entry dicts], best first
+
+    def offer(self, entry):
+        for booth in (entry['booth'], None):
+            board = self.boards.setdefault(booth, [])
+            for i, old in enumerate(board):
+                if old['session'] == entry['session']:
+                    del board[i]
+                    break
+            if len(board) >= self.top_n and entry['score'] <= board[-1]['score']:
+                continue
+            board.append(entry)
+            board.sort(key=lambda e: -e['score'])
+            del board[self.top_n:]
+
+    def top(self, booth=None):
+        return list(self.boards.get(booth, []))
+
+
+def load_leaderboard(path=SCORE_DB, top_n=TOP_N):
+    """Leaderboard filled from the database (top N of every booth)"""
+    board = Leaderboard(top_n)
+    try:
+        conn = _connect(path)
+        try:
+            booths = [row[0] for row in conn.execute("SELECT DISTINCT booth FROM sessions")]
+            for booth in booths:
+                rows = conn.execute("SELECT id, score, level, ended FROM sessions WHERE booth = ? "
+                                    "ORDER BY score DESC LIMIT ?", (booth, top_n))
+                for session, score, level, ended in rows:
+                    board.offer({'session': session, 'booth': booth, 'score': score, 'level': level, 'ts': ended})
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"⚠️ Could not read scores from {path}: {e}")
+    return board
+
+
+class ScoreStore:
+    def __init__(self, path=SCORE_DB, booth=BOOTH_ID, top_n=TOP_N):
+        self.path = path
+        self.booth = booth
+        self.session = None
+        self.seed = None
+        self.started = None
+        self.best = (0, 1)      # Best (score, level) of the session; retries can lower the live score
+        self.enabled = True     # Cleared when the database cannot be opened
+        # One synchronous read at startup; afterwards the cache is authoritative
+        self.leaderboard = load_leaderboard(path, top_n)
+        self.queue = queue.SimpleQueue()
+        self.writer = threading.Thread(target=self._write_loop, name="score-writer", daemon=True)
+        self.writer.start()
+
+    def attach(self, game):
+        """Start a session for `game` and listen to its shots and levels"""
+        self.session = uuid.uuid4().hex
+        self.seed = game.seed
+        self.started = time.time()
+        self.best = (game.score, game.level)
+        game.shot_listeners.append(self.on_shot)
+        game.level_listeners.append(self.on_level)
+        self._update_session(game.score, game.level)
+
+    def on_shot(self, result):
+        now = time.time()
+        self._put(_INSERT_SHOT, (self.session, now, result['level'], result['power'], result['angle'],
+                                       result['pigs_hit'], result['blocks_broken'], result['score_delta'],
+                                       result['ticks']))
+        if result['score_delta']:
+            self._update_session(result['score'], result['level'], now)
+
+    def on_level(self, level, score):
+        now = time.time()
+        self._put(_INSERT_LEVEL, (self.session, now, level, score))
+        self._update_session(score, level + 1, now)
+
+    def _update_session(self, score, level, now=None):
+        now = now or time.time()
+        score, level = self.best = max(self.best, (score, level))
+        self._put(_UPSERT_SESSION, (self.session, self.booth, self.seed, self.started, now, score, level))
+        self.leaderboard.offer({'session': self.session, 'booth': self.booth, 'score': score,
+                                'level': level, 'ts': now})
+
+    def _put(self, sql, row):
+        if self.enabled:
+            self.queue.put((sql, row))
+
+    def top(self, booth=None):
+        """Cached leaderboard for a booth (None = all booths), best first"""
+        return self.leaderboard.top(booth)
+
+    def _write_loop(self):
+        try:
+            conn = _connect(self.path)
+        except sqlite3.Error as e:
+            print(f"⚠️ Score database unavailable ({e}); scores will not be saved")
+            self.enabled = False
+            return
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + FLUSH_INTERVAL_S
+            while len(batch) < BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+                if batch[-1] is None:
+                    break
+            if None in batch:
+                running = False
+                batch = [item for item in batch if item is not None]
+            self._commit(conn, batch)
+        conn.close()
+
+    def _commit(self, conn, batch):
+        try:
+            with conn:  # One transaction per batch
+                for sql, row in batch:
+                    conn.execute(sql, row)
+            ROWS_WRITTEN.inc(len(batch))
+        except sqlite3.Error as e:
+            WRITE_ERRORS.inc()
+            print(f"⚠️ Dropped {len(batch)} score rows: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self, timeout=5.0):
+        """Flush what is queued and stop the writer"""
+        self.enabled = False
+        self.queue.put(None)
+        self.writer.join(timeout)
+
+
+def print_leaderboard(entries, title):
+    print(f"🏆 {title}")
+    for rank, entry in enumerate(entries, 1):
+        when = time.strftime("%Y-%m-%d %H:%M", time.localtime(entry['ts'] or 0))
+        print(f"  {rank:>2}. {entry['score']:>7}  level {entry['level']:<3} {entry['booth']:<12} {when}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Show the local leaderboard")
+    parser.add_argument("--db", default=SCORE_DB)
+    parser.add_argument("--booth", help="Only this booth (default: all booths)")
+    parser.add_argument("--top", type=int, default=TOP_N)
+    args = parser.parse_args()
+    board = load_leaderboard(args.db, args.top)
+    print_leaderboard(board.top(args.booth), f"Top {args.top} ({args.booth or 'all booths'})")
@@ -0,0 +1,170 @@
+# serial_framer.py
+# -*- coding: utf-8 -*-
+"""
+Incremental line framing for the UNO serial stream.
+
+Bytes are read straight into a preallocated bytearray and lines are
+parsed in place. The fixed-layout messages printed by the sketch
+(sendGrabJSON, release, hand_open) are matched with precompiled byte
+patterns; anything else falls back to json. A malformed or oversized
+frame is counted and skipped: the framer resyncs on the next newline
+and the port stays open.
+
+Benchmark against the old readline/decode/strip/json path:
+    python serial_framer.py [messages]
+"""
+import io
+import json
+import re
+import sys
+import time
+
+FRAME_BUFFER_SIZE = 1024   # Longest sketch line is ~110 bytes
+
+_INT = rb"(-?\d+)"
+_FLOAT = rb"(-?\d+(?:\.\d+)?)"
+GRAB_PATTERN = re.compile(
+    rb'\{"gesture":"grab","id":' + _INT + rb',"power":' + _FLOAT + rb',"angle":' + _FLOAT
+    + rb',"x":' + _INT + rb',"y":' + _INT + rb',"w":' + _INT + rb',"h":' + _INT
+    + rb',"held_ms":' + _INT + rb'\}\r?')
+RELEASE_PATTERN = re.compile(
+    rb'\{"gesture":"release","id":' + _INT + rb',"power":' + _FLOAT + rb',"angle":' + _FLOAT + rb'\}\r?')
+SIMPLE_PATTERN = re.compile(rb'\{"gesture":"(\w+)","id":' + _INT + rb'\}\r?')
+
+
+def parse_frame(buf, start, end):
+    """Message dict for buf[start:end], or None when the frame is malformed"""
+    m = GRAB_PATTERN.fullmatch(buf, start, end)
+    if m:
+        i, power, angle, x, y, w, h, held = m.groups()
+        return {"gesture": "grab", "id": int(i), "power": float(power), "angle": float(angle),
+                "x": int(x), "y": int(y), "w": int(w), "h": int(h), "held_ms": int(held)}
+    m = RELEASE_PATTERN.fullmatch(buf, start, end)
+    if m:
+        i, power, angle = m.groups()
+        return {"gesture": "release", "id": int(i), "power": float(power), "angle": float(angle)}
+    m = SIMPLE_PATTERN.fullmatch(buf, start, end)
+    if m:
+        return {"gesture": m.group(1).decode("ascii"), "id": int(m.group(2))}
+    # Status banner or a future message: general JSON path
+    try:
+        message = json.loads(bytes(buf[start:end]))
+    except ValueError:
+        return None
+    return message if isinstance(message, dict) else None
+
+
+class LineFramer:
+    def __init__(self, capacity=FRAME_BUFFER_SIZE):
+        self.buffer = bytearray(capacity)
+        self.view = memoryview(self.buffer)
+        self.fill = 0
+        self.skipping = False  # Dropping an oversized frame up to the next newline
+        self.frames = 0
+        self.bad_frames = 0
+
+    def readinto(self, stream, wanted):
+        """Read up to `wanted` bytes from stream into the free space; returns the count"""
+        fill = self.fill
+        n = stream.readinto(self.view[fill:min(len(self.buffer), fill + max(1, wanted))])
+        self.fill = fill + (n or 0)
+        return n or 0
+
+    def messages(self):
+        """Yield every complete message in the buffer, then compact it"""
+        buf = self.buffer
+        fill = self.fill
+        start = 0
+        while True:
+            end = buf.find(b"\n", start, fill)
+            if end < 0:
+                break
+            if self.skipping:
+                self.skipping = False
+            elif end - start > 1 or (end > start and buf[start] != 13):
+                message = parse_frame(buf, start, end)
+                if message is None:
+                    self.bad_frames += 1
+                else:
+                    self.frames += 1
+                    yield message
+            start = end + 1
+        if start:
+            remaining = fill - start
+            self.view[:remaining] = self.view[start:fill]
+            fill = remaining
+        if fill == len(buf):
+            # No newline in a full buffer: garbage or a runaway frame
+            if not self.skipping:
+                self.bad_frames += 1
+                self.skipping = True
+            fill = 0
+        self.fill = fill
+
+
+class _SerialLike(io.RawIOBase):
+    """In-memory stream with pyserial's shape: reads are Python calls, readline is inherited"""
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        n = min(len(b), len(self.data) - self.pos)
+        b[:n] = self.data[self.pos:self.pos + n]
+        self.pos += n
+        return n
+
+
+def _legacy_parse(stream):
+    """The old SerialReader path: readline, decode, strip, json.loads"""
+    messages = bad = 0
+    while True:
+        raw = stream.readline()
+        if not raw:
+            return messages, bad
+        line = raw.decode(errors="ignore").strip()
+        if line.startswith("{") and line.endswith("}"):
+            try:
+                json.loads(line)
+                messages += 1
+            except ValueError:
+                bad += 1
+
+
+def _framer_parse(stream, chunk=64):
+    framer = LineFramer()
+    messages = 0
+    while framer.readinto(stream, chunk):
+        for _ in framer.messages():
+            messages += 1
+    return messages, framer.bad_frames
+
+
+def synthetic_stream(count, corrupt_every=0):
+    """Bytes resembling a grab/release session, optionally with corrupted lines"""
+    lines = [b'{"status":"ready","mode":"learned_ID"}\r\n']
+    for i in range(count):
+        if corrupt_every and i % corrupt_every == 0:
+            lines.append(b'{"gesture":"gr\xffab","id":1,"pow\r\n')
+        elif i % 50 == 49:
+            lines.append(b'{"gesture":"release","id":2,"power":63.5,"angle":-0.3142}\r\n')
+        else:
+            lines.append(b'{"gesture":"grab","id":1,"power":%.1f,"angle":%.4f,"x":%d,"y":%d,"w":40,"h":48,"held_ms":%d}\r\n'
+                         % (i % 100, (i % 60 - 30) / 40, 100 + i % 120, 80 + i % 90, i * 33))
+    return b"".join(lines)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    for corrupt_every in (0, 100):
+        data = synthetic_stream(count, corrupt_every)
+        for name, parse in (("readline+json", _legacy_parse), ("LineFramer", _framer_parse)):
+            start = time.perf_counter()
+            messages, bad = parse(_SerialLike(data))
+            elapsed = time.perf_counter() - start
+            print(f"{name:14s} corrupt=1/{corrupt_every or '-'}: {messages} msgs, {bad} bad, "
+                  f"{messages / elapsed:,.0f} msgs/s")
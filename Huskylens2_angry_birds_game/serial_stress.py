@@ -0,0 +1,209 @@
+# serial_stress.py
+# -*- coding: utf-8 -*-
+"""
+Serial ingestion stress harness.
+
+Floods a real SerialReader at increasing message rates, either through a
+device_emulator.py pty (pyserial + OS buffers, Linux/macOS) or an
+in-memory stream (parsing and threading only), while a headless game
+runs the normal apply_input/update/draw loop at 60 FPS. For every rate
+step it reports:
+
+    offered / parsed msgs/s    what was sent vs what SerialReader parsed
+    backlog                    bytes waiting in the port (mean / max)
+    reader / render CPU %      per-thread CPU share (Linux /proc)
+    frame p50 / p95 ms         frame work time of the render loop
+
+and writes the saturation curve as CSV so parsing or threading changes
+can be compared run to run:
+
+    python serial_stress.py --mode pty --rates 100 500 2000 10000 --out stress.csv
+"""
+import argparse
+import csv
+import os
+import random
+import threading
+import time
+
+DEFAULT_RATES = [0, 100, 250, 500, 1000, 2000, 5000, 10000, 20000]
+STEP_SECONDS = 3.0
+FRAME_S = 1.0 / 60
+SATURATION_RATIO = 0.95   # Parsed below this share of offered = saturated
+
+
+def _thread_cpu_s(native_id):
+    """CPU seconds used by one thread (Linux), or None"""
+    try:
+        with open(f"/proc/self/task/{native_id}/stat") as f:
+            fields = f.read().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, IndexError, ValueError):
+        return None
+
+
+class MemorySerial:
+    """Thread-safe in-memory stand-in for serial.Serial, fed by a producer thread"""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.cond = threading.Condition()
+        self.is_open = True
+        self.timeout = 0.2
+
+    @property
+    def in_waiting(self):
+        return len(self.data)
+
+    def write(self, chunk):
+        with self.cond:
+            self.data += chunk
+            self.cond.notify()
+
+    def readinto(self, b):
+        with self.cond:
+            if not self.data:
+                self.cond.wait(self.timeout)
+            n = min(len(b), len(self.data))
+            b[:n] = self.data[:n]
+            del self.data[:n]
+            return n
+
+    def close(self):
+        self.is_open = False
+
+
+class MemoryProducer(threading.Thread):
+    """Writes sketch output into a MemorySerial at a fixed message rate"""
+
+    def __init__(self, port, rate, seed=0):
+        super().__init__(daemon=True)
+        from device_emulator import SketchLogic, random_path
+        self.port = port
+        self.rate = rate
+        self.logic = SketchLogic()
+        self.path = random_path(random.Random(seed))
+        self.running = True
+        self.stats = {"sent": 0}
+
+    def run(self):
+        start = next_t = time.perf_counter()
+        for hand in self.path:
+            if not self.running:
+                break
+            line, _ = self.logic.step(int((time.perf_counter() - start) * 1000), hand)
+            if not line:
+                continue
+            self.port.write(line)
+            self.stats["sent"] += 1
+            next_t += 1.0 / self.rate
+            wait = next_t - time.perf_counter()
+            if wait > 0:
+                time.sleep(wait)
+
+    def stop(self):
+        self.running = False
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))] if ordered else 0.0
+
+
+def run_step(mode, rate, seconds, render=True):
+    """One rate step: fresh device, reader and game; returns a result row"""
+    import pygame
+    from angry_birds_game import LOGICAL_HEIGHT, LOGICAL_WIDTH, AngryBirdsGame
+    from main_uno import BAUDRATE, SerialReader, UnoHuskyController
+
+    source = None
+    if mode == "pty":
+        from device_emulator import DeviceEmulator
+        source = DeviceEmulator(rate=rate or 1e-3, seed=rate)
+        reader = SerialReader(source.port, BAUDRATE)
+    else:
+        reader = SerialReader("memory", BAUDRATE)
+        reader.ser = MemorySerial()
+        source = MemoryProducer(reader.ser, rate or 1e-3, seed=rate)
+    reader.start()
+    if rate:
+        source.start()
+
+    game = AngryBirdsGame(screen=pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT)), seed=0)
+    controller = UnoHuskyController(game=game, reader=reader)
+
+    # Let the reader connect (and the banner through) before measuring
+    deadline = time.perf_counter() + 5.0
+    while mode == "pty" and reader.ser is None and time.perf_counter() < deadline:
+        time.sleep(0.01)
+
+    frame_ms, backlog = [], []
+    seq0 = reader.seq
+    sent0 = source.stats["sent"]
+    reader_cpu0 = _thread_cpu_s(reader.native_id)
+    main_cpu0 = time.thread_time()
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        t0 = time.perf_counter()
+        controller.apply_input()
+        game.update()
+        if render:
+            game.draw()
+        work = time.perf_counter() - t0
+        frame_ms.append(work * 1000)
+        try:
+            backlog.append(reader.ser.in_waiting + reader.framer.fill if reader.ser else 0)
+        except Exception:
+            backlog.append(0)
+        if work < FRAME_S:
+            time.sleep(FRAME_S - work)
+    elapsed = time.perf_counter() - start
+    parsed = (reader.seq - seq0) / elapsed
+    offered = (source.stats["sent"] - sent0) / elapsed
+    reader_cpu1 = _thread_cpu_s(reader.native_id)
+    main_cpu = time.thread_time() - main_cpu0
+
+    reader.stop()
+    source.stop()
+    return {
+        "rate": rate,
+        "offered_msgs_s": round(offered, 1),
+        "parsed_msgs_s": round(parsed, 1),
+        "bad_frames": reader.framer.bad_frames,
+        "backlog_mean_b": round(sum(backlog) / len(backlog), 1) if backlog else 0,
+        "backlog_max_b": max(backlog) if backlog else 0,
+        "reader_cpu_pct": round((reader_cpu1 - reader_cpu0) / elapsed * 100, 1) if reader_cpu0 is not None and reader_cpu1 is not None else "",
+        "render_cpu_pct": round(main_cpu / elapsed * 100, 1),
+        "frame_p50_ms": round(_percentile(frame_ms, 50), 2),
+        "frame_p95_ms": round(_percentile(frame_ms, 95), 2),
+        "saturated": bool(rate) and parsed < offered * SATURATION_RATIO,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serial ingestion saturation curve")
+    parser.add_argument("--mode", choices=["pty", "memory"], default="pty" if os.name == "posix" else "memory")
+    parser.add_argument("--rates", type=int, nargs="+", default=DEFAULT_RATES, help="Messages/s per step (0 = baseline)")
+    parser.add_argument("--seconds", type=float, default=STEP_SECONDS, help="Duration of each step")
+    parser.add_argument("--no-render", action="store_true", help="Skip game.draw() (input + physics only)")
+    parser.add_argument("--out", default="serial_stress.csv")
+    args = parser.parse_args()
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    rows = []
+    print(f"{'rate':>7} {'offered':>9} {'parsed':>9} {'backlog':>9} {'reader%':>8} {'render%':>8} {'p50ms':>7} {'p95ms':>7}")
+    for rate in args.rates:
+        row = run_step(args.mode, rate, args.seconds, render=not args.no_render)
+        rows.append(row)
+        print(f"{row['rate']:>7} {row['offered_msgs_s']:>9} {row['parsed_msgs_s']:>9} {row['backlog_mean_b']:>9} "
+              f"{row['reader_cpu_pct']:>8} {row['render_cpu_pct']:>8} {row['frame_p50_ms']:>7} {row['frame_p95_ms']:>7}"
+              f"{'  ⚠️ saturated' if row['saturated'] else ''}")
+    with open(args.out, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"📈 Saturation curve written: {args.out}")
@@ -0,0 +1,174 @@
+# sessions.py
+# -*- coding: utf-8 -*-
+"""
+Several HUSKYLENS/UNO players in one process (multiplayer booths).
+
+Every player gets its own AngryBirdsGame drawing into an offscreen
+surface. One thread polls all serial ports, one loop applies input and
+steps every game's physics in the same tick, and the games are either
+tiled into a single split-screen window or, headless (no shared display),
+shown in one window per player.
+
+Usage:
+    python sessions.py COM3 COM4 COM5 COM6
+    python sessions.py /dev/ttyUSB0 /dev/ttyUSB1 --headless
+"""
+import argparse
+import math
+import threading
+import time
+import pygame
+import serial
+
+try:
+    from pygame._sdl2.video import Renderer, Texture, Window
+except ImportError:  # pygame 1.x: split-screen only
+    Window = None
+
+SPLIT_TILE_SIZE = (600, 300)   # Per-player tile in the split-screen window
+IO_IDLE_SLEEP_S = 0.002        # Poll interval when no port had data
+
+
+class SharedSerialLoop(threading.Thread):
+    """Non-blocking reads for many SerialReaders on a single thread"""
+
+    def __init__(self, readers):
+        super().__init__(daemon=True)
+        self.readers = readers
+        self.running = True
+        self.connecting = set()  # Readers whose discovery is running
+
+    def run(self):
+        while self.running:
+            busy = False
+            for reader in self.readers:
+                if not reader.ser or not reader.ser.is_open:
+                    self._reconnect(reader)
+                    continue
+                try:
+                    waiting = reader.ser.in_waiting
+                    if waiting:
+                        busy = True
+                        reader._pump(waiting)
+                except (serial.SerialException, OSError):
+                    print(f"⚠️ Serial lost: {reader.port_name}")
+                    reader.discovery.mark_lost()
+                    reader._close()
+            if not busy:
+                time.sleep(IO_IDLE_SLEEP_S)
+
+    def _reconnect(self, reader):
+        """Run the reader's discovery (backoff, banner check) off the I/O thread"""
+        if reader in self.connecting:
+            return
+        self.connecting.add(reader)
+        threading.Thread(target=self._connect, args=(reader,), daemon=True).start()
+
+    def _connect(self, reader):
+        try:
+            reader._open()
+        except RuntimeError:
+            pass  # Stopped before the device came back
+        finally:
+            self.connecting.discard(reader)
+
+    def stop(self):
+        self.running = False
+        for reader in self.readers:
+            reader.stop()
+
+
+class SessionManager:
+    def __init__(self, ports, headless=False, seed=None):
+        from angry_birds_game import LOGICAL_HEIGHT, LOGICAL_WIDTH, AngryBirdsGame
+        from main_uno import BAUDRATE, SerialReader, UnoHuskyController, load_aim_table
+
+        pygame.init()
+        if headless and Window is None:
+            print("⚠️ This pygame cannot open several windows; using split-screen")
+            headless = False
+        self.headless = headless
+        count = len(ports)
+        self.cols = math.ceil(math.sqrt(count))
+        self.rows = math.ceil(count / self.cols)
+        self.window = None
+        self.tiles = []
+        self.outputs = []  # Headless: (renderer, texture) per player
+        if headless:
+            for i in range(count):
+                window = Window(f"Angry Birds - player {i + 1}", size=SPLIT_TILE_SIZE)
+                renderer = Renderer(window)
+                renderer.logical_size = (LOGICAL_WIDTH, LOGICAL_HEIGHT)  # GPU scales to the window
+                texture = Texture(renderer, (LOGICAL_WIDTH, LOGICAL_HEIGHT), streaming=True)
+                self.outputs.append((renderer, texture))
+        else:
+            tile_w, tile_h = SPLIT_TILE_SIZE
+            self.window = pygame.display.set_mode((self.cols * tile_w, self.rows * tile_h))
+            pygame.display.set_caption(f"Gesture-Controlled Angry Birds - {count} players")
+            for i in range(count):
+                col, row = i % self.cols, i // self.cols
+                self.tiles.append(self.window.subsurface((col * tile_w, row * tile_h, tile_w, tile_h)))
+
+        self.controllers = []
+        readers = []
+        aim_table = load_aim_table()  # Read-only, so one table serves every player
+        for port in ports:
+            # A shared seed gives every player the same levels
+            game = AngryBirdsGame(screen=pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT)), seed=seed)
+            reader = SerialReader(port, BAUDRATE)
+            readers.append(reader)
+            self.controllers.append(UnoHuskyController(game=game, reader=reader, aim_table=aim_table))
+        self.games = [c.game for c in self.controllers]
+        self.io = SharedSerialLoop(readers)
+
+    def tick(self):
+        """Apply every player's input, then update each game in turn (same tick, same dt)"""
+        for controller in self.controllers:
+            controller.apply_input()
+        for game in self.games:
+            game.update()
+
+    def render(self):
+        for game in self.games:
+            game.draw()
+        if self.headless:
+            for game, (renderer, texture) in zip(self.games, self.outputs):
+                texture.update(game.screen)
+                renderer.clear()
+                texture.draw()
+                renderer.present()
+            return
+        for game, tile in zip(self.games, self.tiles):
+            pygame.transform.smoothscale(game.screen, SPLIT_TILE_SIZE, tile)
+        pygame.display.flip()
+
+    def run(self):
+        print(f"🎮 {len(self.games)}-player session started")
+        self.io.start()
+        clock = pygame.time.Clock()
+        running = True
+        while running:
+            for event in pygame.event.get():
+                if event.type in (pygame.QUIT, getattr(pygame, "WINDOWCLOSE", pygame.QUIT)):
+                    running = False
+            self.tick()
+            self.render()
+            clock.tick(60)
+            # One shared frame budget: all players degrade together
+            for game in self.games:
+                game.quality.record(clock.get_rawtime())
+        self.io.stop()
+        pygame.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run several HUSKYLENS/UNO players in one process")
+    parser.add_argument("ports", nargs="+", help="One serial port per player")
+    parser.add_argument("--headless", action="store_true",
+                        help="No shared display: one window per player instead of split-screen")
+    parser.add_argument("--seed", type=int, help="Shared seed so all players get the same levels")
+    args = parser.parse_args()
+    try:
+        SessionManager(args.ports, headless=args.headless, seed=args.seed).run()
+    except Exception as e:
+        print("Runtime error:", e)
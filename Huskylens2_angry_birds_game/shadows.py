@@ -0,0 +1,96 @@
+# shadows.py
+# -*- coding: utf-8 -*-
+"""
+Shadow compositor.
+
+Shadows of static geometry (the band above the ground, blocks, pigs and
+the slingshot) are baked into one alpha layer per level and blitted as
+a single cropped rect. The layer is rebuilt only when invalidate() is
+called (new level, block destroyed, pig popped, snapshot restored).
+Moving objects and ad-hoc shadows use stamps cached by size instead of
+allocating a Surface per call.
+"""
+import pygame
+
+SHADOW_ALPHA = 50
+SHADOW_OFFSET = (4, 4)        # Light comes from the top left
+GROUND_BAND_HEIGHT = 20       # Gradient rows above the ground line
+GROUND_BAND_ALPHA = 30
+CONTACT_FADE_PX = 400         # Height at which a flying object's ground shadow is smallest
+
+
+class ShadowCompositor:
+    def __init__(self, width, height, ground_y):
+        self.width = width
+        self.height = height
+        self.ground_y = ground_y
+        self.layer = None
+        self.area = None        # Bounding rect of everything baked into the layer
+        self.dirty = True
+        self.bakes = 0
+        self._stamps = {}
+
+    def invalidate(self):
+        self.dirty = True
+
+    def bake(self, blocks, pigs, slingshot):
+        if self.layer is None:
+            self.layer = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        layer = self.layer
+        layer.fill((0, 0, 0, 0))
+        # Overlapping shapes replace (not stack) alpha, so shadows never double-darken
+        top = self.ground_y - GROUND_BAND_HEIGHT
+        for i in range(GROUND_BAND_HEIGHT):
+            alpha = GROUND_BAND_ALPHA - i
+            if alpha > 0:
+                layer.fill((0, 0, 0, alpha), (0, top + i, self.width, 1))
+        dx, dy = SHADOW_OFFSET
+        for block in blocks:
+            if not block.is_destroyed:
+                layer.fill((0, 0, 0, SHADOW_ALPHA), (block.x + dx, block.y + dy, block.width, block.height))
+        for pig in pigs:
+            if pig.is_alive:
+                pygame.draw.circle(layer, (0, 0, 0, SHADOW_ALPHA), (int(pig.x) + dx, int(pig.y) + dy), pig.radius)
+        # Slingshot base contact shadow
+        pygame.draw.ellipse(layer, (0, 0, 0, SHADOW_ALPHA),
+                            (slingshot.x - 25, self.ground_y - 6, 50, 12))
+        self.area = layer.get_bounding_rect()
+        self.dirty = False
+        self.bakes += 1
+
+    def draw_static(self, screen, blocks, pigs, slingshot):
+        if self.dirty:
+            self.bake(blocks, pigs, slingshot)
+        screen.blit(self.layer, self.area.topleft, self.area)
+
+    def rect_stamp(self, width, height):
+        key = ("rect", width, height)
+        stamp = self._stamps.get(key)
+        if stamp is None:
+            stamp = self._stamps[key] = pygame.Surface((width, height), pygame.SRCALPHA)
+            stamp.fill((0, 0, 0, SHADOW_ALPHA))
+        return stamp
+
+    def circle_stamp(self, radius):
+        key = ("circle", radius)
+        stamp = self._stamps.get(key)
+        if stamp is None:
+            stamp = self._stamps[key] = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(stamp, (0, 0, 0, SHADOW_ALPHA), (radius, radius), radius)
+        return stamp
+
+    def contact_stamp(self, radius):
+        key = ("contact", radius)
+        stamp = self._stamps.get(key)
+        if stamp is None:
+            stamp = self._stamps[key] = pygame.Surface((radius * 2, max(2, radius // 2)), pygame.SRCALPHA)
+            pygame.draw.ellipse(stamp, (0, 0, 0, SHADOW_ALPHA), stamp.get_rect())
+        return stamp
+
+    def draw_contact(self, screen, x, y, radius):
+        """Ground shadow under a flying object, shrinking with height"""
+        height = max(0, self.ground_y - y)
+        scale = max(0.3, 1 - height / CONTACT_FADE_PX)
+        r = max(2, int(radius * scale))  # Integer radius keeps the stamp cache small
+        stamp = self.contact_stamp(r)
+        screen.blit(stamp, (int(x) - r, self.ground_y - stamp.get_height() // 2))
@@ -0,0 +1,211 @@
+# shot_log.py
+# -*- coding: utf-8 -*-
+"""
+Columnar per-shot analytics log.
+
+Every finished shot appends one fixed-width value to each column file in
+a log directory (ts.d, x.h, ... named by struct type code, little-endian,
+no per-shot JSON).
+Because each column is its own contiguous file, the reader np.memmaps
+them and aggregates over millions of shots without parsing or loading
+anything up front. Use it to tune LEFT_WEIGHT, MAX_ANGLE_*_DEG and level
+difficulty:
+
+    python shot_log.py                    # per-level summary
+    python shot_log.py --by angle --bins 12
+"""
+import argparse
+import json
+import os
+import struct
+import time
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed to read the log
+    np = None
+
+SHOT_LOG_DIR = "shot_log"
+SCHEMA_VERSION = 1
+
+# (column, struct/NumPy type code); order is the record layout
+COLUMNS = [
+    ("ts", "d"),             # When the shot ended, Unix seconds
+    ("x", "h"),              # Raw HUSKYLENS x/y of the hand at release
+    ("y", "h"),
+    ("power", "f"),          # Smoothed power/angle the controller launched with
+    ("angle", "f"),
+    ("level", "H"),
+    ("pigs_hit", "B"),
+    ("blocks_broken", "B"),
+    ("score_delta", "i"),
+    ("ticks", "I"),          # Ticks in flight
+]
+_STRUCTS = {name: struct.Struct("<" + code) for name, code in COLUMNS}
+
+
+def _column_path(directory, name, code):
+    return os.path.join(directory, f"{name}.{code}")
+
+
+class ShotLog:
+    """Appends one record per finished shot; attach() it to a game"""
+
+    def __init__(self, directory=SHOT_LOG_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        schema_path = os.path.join(directory, "schema.json")
+        if not os.path.exists(schema_path):
+            with open(schema_path, "w", encoding="utf-8") as f:
+                json.dump({"version": SCHEMA_VERSION, "columns": COLUMNS}, f)
+        self._repair()
+        self.files = [(open(_column_path(directory, name, code), "ab"), _STRUCTS[name].pack, name)
+                      for name, code in COLUMNS]
+        self.launch_source = None  # Callable returning (x, y, power, angle) of the last launch
+
+    def _repair(self):
+        """Trim columns a crash left longer than the shortest one"""
+        rows = shot_count(self.directory)
+        for name, code in COLUMNS:
+            path = _column_path(self.directory, name, code)
+            if os.path.exists(path) and os.path.getsize(path) > rows * _STRUCTS[name].size:
+                os.truncate(path, rows * _STRUCTS[name].size)
+
+    def attach(self, game, launch_source=None):
+        """launch_source: e.g. UnoHuskyController.launch_inputs; None = the game's own aim"""
+        self.launch_source = launch_source
+        game.shot_listeners.append(self.on_shot)
+
+    def on_shot(self, result):
+        launch = self.launch_source() if self.launch_source else None
+        if launch is None:
+            launch = (-1, -1, result['power'], result['angle'])
+        x, y, power, angle = launch
+        record = {
+            "ts": time.time(),
+            "x": max(-0x8000, min(int(x), 0x7FFF)),
+            "y": max(-0x8000, min(int(y), 0x7FFF)),
+            "power": power,
+            "angle": angle,
+            "level": min(result['level'], 0xFFFF),
+            "pigs_hit": min(result['pigs_hit'], 0xFF),
+            "blocks_broken": min(result['blocks_broken'], 0xFF),
+            "score_delta": result['score_delta'],
+            "ticks": result['ticks'],
+        }
+        try:
+            # Pack every column first: a bad value drops the whole record, never one column
+            packed = [pack(record[name]) for _, pack, name in self.files]
+        except struct.error as e:
+            print(f"⚠️ Could not log shot: {e}")
+            return
+        try:
+            for (f, _, _), data in zip(self.files, packed):
+                f.write(data)
+            for f, _, _ in self.files:
+                f.flush()
+        except OSError as e:
+            print(f"⚠️ Could not log shot: {e}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for f, _, _ in self.files:
+            f.close()
+
+
+def shot_count(directory=SHOT_LOG_DIR):
+    """Complete records: the shortest column wins"""
+    counts = []
+    for name, code in COLUMNS:
+        path = _column_path(directory, name, code)
+        counts.append(os.path.getsize(path) // _STRUCTS[name].size if os.path.exists(path) else 0)
+    return min(counts)
+
+
+class ShotLogReader:
+    def __init__(self, directory=SHOT_LOG_DIR):
+        if np is None:
+            raise RuntimeError("Reading the shot log requires NumPy: pip install numpy")
+        self.rows = shot_count(directory)
+        self.columns = {}
+        for name, code in COLUMNS:
+            dtype = np.dtype(code).newbyteorder("<")
+            if self.rows:
+                self.columns[name] = np.memmap(_column_path(directory, name, code), dtype=dtype,
+                                               mode="r", shape=(self.rows,))
+            else:
+                self.columns[name] = np.empty(0, dtype=dtype)
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def by_level(self):
+        """{level: {shots, hit_rate, pigs_per_shot, blocks_per_shot, mean_score, mean_ticks}}"""
+        levels = self["level"]
+        counts = np.bincount(levels)
+
+        def per_level(weights):
+            return np.bincount(levels, weights=weights, minlength=len(counts))
+
+        hits = per_level(self["pigs_hit"] > 0)
+        pigs = per_level(self["pigs_hit"])
+        blocks = per_level(self["blocks_broken"])
+        score = per_level(self["score_delta"])
+        ticks = per_level(self["ticks"])
+        summary = {}
+        for level in np.nonzero(counts)[0]:
+            n = counts[level]
+            summary[int(level)] = {
+                "shots": int(n),
+                "hit_rate": float(hits[level] / n),
+                "pigs_per_shot": float(pigs[level] / n),
+                "blocks_per_shot": float(blocks[level] / n),
+                "mean_score": float(score[level] / n),
+                "mean_ticks": float(ticks[level] / n),
+            }
+        return summary
+
+    def hit_rate_by(self, column, bins=10):
+        """[(bin start, bin end, shots, hit rate)] for x, y, power or angle"""
+        values = self[column]
+        valid = values >= 0 if column in ("x", "y") else np.ones(len(values), dtype=bool)
+        values = values[valid]
+        if not len(values):
+            return []
+        hits = self["pigs_hit"][valid] > 0
+        edges = np.histogram_bin_edges(values, bins=bins)
+        index = np.clip(np.digitize(values, edges) - 1, 0, bins - 1)
+        shots = np.bincount(index, minlength=bins)
+        hit = np.bincount(index, weights=hits, minlength=bins)
+        return [(float(edges[i]), float(edges[i + 1]), int(shots[i]), float(hit[i] / shots[i]) if shots[i] else 0.0)
+                for i in range(bins)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aggregate the per-shot analytics log")
+    parser.add_argument("--dir", default=SHOT_LOG_DIR)
+    parser.add_argument("--by", choices=["level", "x", "y", "power", "angle"], default="level")
+    parser.add_argument("--bins", type=int, default=10)
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    log = ShotLogReader(args.dir)
+    print(f"📈 {len(log)} shots in {args.dir}")
+    if args.by == "level":
+        print(f"{'level':>5} {'shots':>8} {'hit%':>6} {'pigs':>6} {'blocks':>7} {'score':>8} {'ticks':>7}")
+        for level, row in log.by_level().items():
+            print(f"{level:>5} {row['shots']:>8} {row['hit_rate'] * 100:>6.1f} {row['pigs_per_shot']:>6.2f} "
+                  f"{row['blocks_per_shot']:>7.2f} {row['mean_score']:>8.1f} {row['mean_ticks']:>7.1f}")
+    else:
+        print(f"{args.by:>21} {'shots':>8} {'hit%':>6}")
+        for lo, hi, shots, rate in log.hit_rate_by(args.by, args.bins):
+            print(f"{lo:>10.3f}..{hi:<9.3f} {shots:>8} {rate * 100:>6.1f}")
+    print(f"⏱️ {(time.perf_counter() - t0) * 1000:.1f} ms")
@@ -0,0 +1,89 @@
+# sky.py
+# -*- coding: utf-8 -*-
+"""
+Parallax cloud layers from pre-rendered wrap-around tiles.
+
+Each layer's clouds are drawn once into a tile one wrap period wide
+(screen width + cloud width). A frame then costs two blits per layer at
+that layer's scroll offset, however many clouds the layer holds.
+"""
+import pygame
+
+CLOUD_W = 120
+CLOUD_H = 60
+
+# Layers are listed by importance (the quality governor keeps the first N);
+# deeper layers are drawn first. speed is in pixels per frame.
+SKY_LAYERS = [
+    {'positions': [(100, 80), (400, 60), (700, 90), (950, 70)], 'speed': 0.067, 'alpha': 180, 'size': 1.0, 'depth': 0},
+    {'positions': [(200, 120), (500, 100), (800, 140), (50, 110)], 'speed': 0.05, 'alpha': 150, 'size': 0.8, 'depth': 0},
+    {'positions': [(300, 50), (600, 180), (900, 40), (150, 160)], 'speed': 0.033, 'alpha': 120, 'size': 1.2, 'depth': 0},
+    {'positions': [(30, 30), (260, 95), (480, 25), (660, 130), (860, 85), (1080, 35)], 'speed': 0.02, 'alpha': 90, 'size': 0.6, 'depth': 1},
+    {'positions': [(120, 150), (340, 20), (560, 70), (760, 10), (990, 120), (1140, 60)], 'speed': 0.012, 'alpha': 70, 'size': 0.5, 'depth': 2},
+]
+
+# Plain clouds drifting over the background image
+OVERLAY_LAYERS = [
+    {'positions': [(210, 80), (510, 120), (810, 60)], 'speed': 0.2, 'alpha': 255, 'size': 1.0, 'depth': 0, 'style': 'plain'},
+]
+
+
+def _draw_cloud(surface, layer):
+    """One cloud at the origin of a CLOUD_W x CLOUD_H surface"""
+    size = layer['size']
+    if layer.get('style') == 'plain':
+        for center, radius in (((25, 25), 20), ((40, 20), 15), ((55, 25), 18)):
+            pygame.draw.circle(surface, (255, 255, 255), center, radius)
+        return
+    # Cloud shadows
+    shadow_offset = 3
+    for (cx, cy), radius in (((35, 35), 25), ((50, 25), 20), ((65, 35), 22)):
+        pygame.draw.circle(surface, (100, 100, 100, 40),
+                           (cx + shadow_offset, cy + shadow_offset), int(radius * size))
+    # Main cloud body
+    cloud_color = (255, 255, 255, layer['alpha'])
+    for center, radius in (((35, 35), 25), ((50, 25), 20), ((65, 35), 22)):
+        pygame.draw.circle(surface, cloud_color, center, int(radius * size))
+    # Cloud highlights
+    highlight_color = (255, 255, 255, min(255, layer['alpha'] + 50))
+    pygame.draw.circle(surface, highlight_color, (40, 30), int(12 * size))
+    pygame.draw.circle(surface, highlight_color, (55, 20), int(10 * size))
+
+
+class ParallaxSky:
+    def __init__(self, width, layers=SKY_LAYERS):
+        self.width = width
+        self.period = width + CLOUD_W  # Wrap period of every layer
+        self.layers = layers
+        self._tiles = {}  # layer index -> (tile, top)
+
+    def _tile(self, index):
+        entry = self._tiles.get(index)
+        if entry is None:
+            layer = self.layers[index]
+            top = min(y for _, y in layer['positions'])
+            height = max(y for _, y in layer['positions']) - top + CLOUD_H
+            tile = pygame.Surface((self.period, height), pygame.SRCALPHA)
+            cloud = pygame.Surface((CLOUD_W, CLOUD_H), pygame.SRCALPHA)
+            _draw_cloud(cloud, layer)
+            for base_x, y in layer['positions']:
+                x = base_x % self.period
+                tile.blit(cloud, (x, y - top))
+                if x + CLOUD_W > self.period:
+                    tile.blit(cloud, (x - self.period, y - top))  # Wrapped part
+            if pygame.display.get_surface() is not None:
+                tile = tile.convert_alpha()
+            entry = self._tiles[index] = (tile, top)
+        return entry
+
+    def draw(self, screen, frame, count=None, alpha=None):
+        """Draw the first `count` layers for frame number `frame`"""
+        selected = range(len(self.layers) if count is None else min(count, len(self.layers)))
+        for index in sorted(selected, key=lambda i: -self.layers[i]['depth']):
+            tile, top = self._tile(index)
+            if alpha is not None:
+                tile.set_alpha(alpha)
+            # Cloud at tile x appears at (x + shift) mod period, less half a cloud
+            shift = (frame * self.layers[index]['speed']) % self.period - CLOUD_W // 2
+            screen.blit(tile, (shift - self.period, top))
+            screen.blit(tile, (shift, top))
@@ -0,0 +1,163 @@
+# snapshot.py
+# -*- coding: utf-8 -*-
+"""
+Compact binary snapshots of the full AngryBirdsGame world state.
+
+Used for rewind, instant shot retry and kiosk crash recovery. The
+layout is versioned little-endian struct data (no pickle), so a
+snapshot is plain bytes that can be stored or sent anywhere.
+
+Layout (version 2; version 1 had no rng section and still restores):
+    header    magic, version, tick, score, level, aim state, counts
+    rng       particle stream state (Mersenne Twister words, gauss_next);
+              the background stream is rewound every frame, so it has none
+    bird      position, velocity, start, flags, trail points
+    blocks    x, y, w, h, rgb, health, max_health, tier, destroyed
+    pigs      x, y, health, alive
+    particles x, y, vx, vy, size, life, rgb, type
+"""
+import struct
+
+MAGIC = b"ABSS"
+VERSION = 2
+
+_HEADER = struct.Struct("<4sHIiHfffBHHHH")
+_BIRD = struct.Struct("<6dBB")
+_BLOCK = struct.Struct("<ffHHBBBffBB")
+_PIG = struct.Struct("<fffB")
+_PARTICLE = struct.Struct("<fffffhBBBB")
+_RNG = struct.Struct("<625IBd")  # random.Random state: words + index, gauss_next flag and value
+
+PARTICLE_TYPES = {None: 0, "explosion": 1, "spark": 2, "smoke": 3}
+PARTICLE_TYPE_NAMES = {code: name for name, code in PARTICLE_TYPES.items()}
+
+
+def snapshot(game):
+    """Serialize the world state of `game` to bytes"""
+    bird = game.bird
+    trail = bird.trail.points()
+    blocks = game.blocks
+    pigs = game.pigs
+    particles = game.particles
+
+    parts = [
+        _HEADER.pack(MAGIC, VERSION, game.time_counter, game.score, game.level,
+                     game.aim_power, game.aim_angle, game.cloud_offset, game.is_aiming,
+                     len(trail), len(blocks), len(pigs), len(particles)),
+        _pack_rng(game.rng.particles),
+        _BIRD.pack(bird.x, bird.y, bird.vx, bird.vy, bird.start_x, bird.start_y,
+                   bird.is_launched, bird.is_aiming),
+    ]
+    if trail:
+        parts.append(struct.pack(f"<{len(trail) * 2}f", *[v for point in trail for v in point]))
+
+    block_pack = _BLOCK.pack
+    for b in blocks:
+        r, g, bl = b.original_color
+        parts.append(block_pack(b.x, b.y, b.width, b.height, r, g, bl,
+                                b.health, b.max_health, b.tier, b.is_destroyed))
+    pig_pack = _PIG.pack
+    for p in pigs:
+        parts.append(pig_pack(p.x, p.y, p.health, p.is_alive))
+    particle_pack = _PARTICLE.pack
+    types = PARTICLE_TYPES
+    for p in particles:
+        r, g, bl = p['color']
+        parts.append(particle_pack(p['x'], p['y'], p['vx'], p['vy'], p['size'], p['life'],
+                                   r, g, bl, types.get(p.get('type'), 0)))
+    return b"".join(parts)
+
+
+def _pack_rng(rng):
+    _, words, gauss_next = rng.getstate()
+    return _RNG.pack(*words, gauss_next is not None, gauss_next or 0.0)
+
+
+def _unpack_rng(rng, data, offset):
+    values = _RNG.unpack_from(data, offset)
+    words, has_gauss, gauss_next = values[:625], values[625], values[626]
+    rng.setstate((3, tuple(words), gauss_next if has_gauss else None))
+
+
+def restore(game, data):
+    """Replace the world state of `game` with a snapshot produced by snapshot()"""
+    # Imported here: angry_birds_game imports this module
+    from angry_birds_game import Block, Pig
+    from atlas import build_scene_atlas
+
+    (magic, version, tick, score, level, aim_power, aim_angle, cloud_offset, is_aiming,
+     n_trail, n_blocks, n_pigs, n_particles) = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version not in (1, VERSION):
+        raise ValueError(f"Unsupported snapshot (magic={magic!r}, version={version})")
+    offset = _HEADER.size
+    if version >= 2:
+        # Particles (and anything else drawn from the stream) replay as they did
+        _unpack_rng(game.rng.particles, data, offset)
+        offset += _RNG.size
+
+    level_changed = level != game.level
+    game.time_counter = tick
+    game.score = score
+    game.level = level
+    game.aim_power = aim_power
+    game.aim_angle = aim_angle
+    game.cloud_offset = cloud_offset
+    game.is_aiming = bool(is_aiming)
+
+    bird = game.bird
+    (bird.x, bird.y, bird.vx, bird.vy, bird.start_x, bird.start_y,
+     launched, aiming) = _BIRD.unpack_from(data, offset)
+    bird.is_launched = bool(launched)
+    bird.is_aiming = bool(aiming)
+    offset += _BIRD.size
+    bird.trail.clear()
+    if n_trail:
+        flat = struct.unpack_from(f"<{n_trail * 2}f", data, offset)
+        for i in range(0, n_trail * 2, 2):
+            bird.trail.append(flat[i], flat[i + 1])
+        offset += n_trail * 8
+
+    blocks = []
+    for _ in range(n_blocks):
+        x, y, w, h, r, g, bl, health, max_health, tier, destroyed = _BLOCK.unpack_from(data, offset)
+        offset += _BLOCK.size
+        block = Block(x, y, w, h, (r, g, bl))
+        block.health = health
+        block.max_health = max_health
+        block.tier = tier
+        block.is_destroyed = bool(destroyed)
+        if tier:
+            block._sprite_key = block.sprite_key(tier)
+        block.on_tier_change = game.on_block_tier_change
+        blocks.append(block)
+    game.blocks = blocks
+
+    # Pigs are reused where possible: constructing one loads its sprite
+    old_pigs = list(game.pigs)
+    pigs = []
+    for _ in range(n_pigs):
+        x, y, health, alive = _PIG.unpack_from(data, offset)
+        offset += _PIG.size
+        pig = old_pigs.pop() if old_pigs else Pig(x, y)
+        pig.x, pig.y, pig.health, pig.is_alive = x, y, health, bool(alive)
+        pigs.append(pig)
+    game.pigs = pigs
+
+    names = PARTICLE_TYPE_NAMES
+    particles = []
+    for _ in range(n_particles):
+        x, y, vx, vy, size, life, r, g, bl, kind = _PARTICLE.unpack_from(data, offset)
+        offset += _PARTICLE.size
+        particle = {'x': x, 'y': y, 'vx': vx, 'vy': vy, 'size': size, 'life': life,
+                    'color': (r, g, bl)}
+        if kind:
+            particle['type'] = names[kind]
+        particles.append(particle)
+    game.particles = particles
+
+    game.shadows.invalidate()
+    if level_changed or game.atlas is None or any(
+            b.sprite_key() not in game.atlas for b in blocks if not b.is_destroyed):
+        game.atlas = build_scene_atlas(game.blocks, game.pigs, game.slingshot)
+    if level_changed and game.aim_assist:
+        game.aim_assist.build(game.pigs)
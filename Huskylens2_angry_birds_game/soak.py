@@ -0,0 +1,232 @@
+# soak.py
+# -*- coding: utf-8 -*-
+"""
+Long-running soak test with memory and leak tracking.
+
+Auto-plays synthetic shots through AngryBirdsGame.handle_gesture_input
+(aim for a while, launch, wait for the bird to settle) for hours, either
+headless (offscreen, no frame cap) or in a window at 60 FPS. Shots are
+aimed with the aim-assist table so levels get cleared, and a level that
+still stands after FORCE_LEVEL_SHOTS shots is skipped, so create_level
+runs over and over. Every interval it samples RSS, tracemalloc's top
+allocators and object counts per type, writes one JSON line to the
+report, and flags any series that grew on every one of the last
+LEAK_WINDOW samples.
+
+    python soak.py --hours 12                 # headless
+    python soak.py --hours 12 --trace-depth 0 # no tracemalloc (it slows every allocation)
+    python soak.py --hours 1 --window         # rendered at 60 FPS
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import time
+import tracemalloc
+from collections import Counter
+
+SAMPLE_INTERVAL_S = 60.0
+LEAK_WINDOW = 6             # Consecutive growing samples before a flag
+MIN_GROWTH = {"rss_kb": 2048, "traced_kb": 1024, "objects": 500}
+TOP_ALLOCATORS = 10
+TOP_TYPES = 15
+REPORT_FILE = "soak_report.jsonl"
+TRACE_DEPTH = 1             # tracemalloc frames per allocation; top allocators only need one
+FORCE_LEVEL_SHOTS = 12      # Skip a level the bot has not cleared after this many shots
+
+
+def rss_kb():
+    """Resident set size in KiB (Linux /proc, else peak RSS from getrusage)"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:
+        return 0
+
+
+class ShotBot:
+    """Synthetic player: aims for a random time, launches, waits for the bird"""
+
+    def __init__(self, seed=0):
+        from aim_assist import AimAssist
+        from angry_birds_game import LEVEL_GENERATOR
+        from levelgen import SHOT_POWERS
+        self.rng = random.Random(seed)
+        self.powers = [p for p in SHOT_POWERS if p >= 40]
+        self.aim = AimAssist(LEVEL_GENERATOR.shot_index(), 1.0)
+        self.aimed_at = None  # (level, pig count) the aim table was built for
+        self.shot = None  # (power, angle, frames left)
+        self.shots = 0
+        self.level = None
+        self.level_shots = 0  # Shots fired at the current level
+
+    def _pick(self, game):
+        """A shot the inverse-ballistics table says hits the nearest pig, else a random one"""
+        key = (game.level, len(game.pigs))
+        if key != self.aimed_at:
+            self.aim.build(game.pigs)
+            self.aimed_at = key
+        power = self.rng.choice(self.powers)
+        # Negative angles go up; this range reaches the towers most of the time
+        angle = self.rng.uniform(-0.9, -0.1)
+        target = self.aim.target_angle(game.pigs, power, angle)
+        return [power, angle if target is None else target, self.rng.randint(20, 60)]
+
+    def params(self, game):
+        if game.bird.is_launched:
+            return {"power": 0, "angle": 0, "should_launch": False}
+        if game.level != self.level:
+            self.level = game.level
+            self.level_shots = 0
+        if self.shot is None:
+            if self.level_shots >= FORCE_LEVEL_SHOTS:
+                # Blocks in the way: move on so level creation keeps being exercised
+                self.level_shots = 0
+                game.level += 1
+                game.create_level()
+            self.shot = self._pick(game)
+        power, angle, frames = self.shot
+        self.shot[2] -= 1
+        launch = frames <= 1
+        if launch:
+            self.shot = None
+            self.shots += 1
+            self.level_shots += 1
+        return {"power": power, "angle": angle, "should_launch": launch}
+
+
+class LeakTracker:
+    def __init__(self, window=LEAK_WINDOW):
+        self.window = window
+        self.history = {}  # series -> recent values
+
+    def add(self, name, value, kind):
+        values = self.history.setdefault(name, [])
+        values.append(value)
+        del values[:-self.window]
+        if len(values) < self.window:
+            return None
+        growing = all(b > a for a, b in zip(values, values[1:]))
+        if growing and values[-1] - values[0] >= MIN_GROWTH[kind]:
+            return f"{name} +{values[-1] - values[0]} over {self.window} samples"
+        return None
+
+
+def game_counts(game):
+    """Sizes of the game's own caches and lists"""
+    import assets
+    import angry_birds_game
+    return {
+        "particles": len(game.particles),
+        "pigs": len(game.pigs),
+        "blocks": len(game.blocks),
+        "atlas_sprites": len(game.atlas.rects) if game.atlas else 0,
+        "shadow_stamps": len(game.shadows._stamps),
+        "trail_luts": len(angry_birds_game.TRAIL_RENDERER._luts),
+        "cached_images": len(assets._images),
+        "cached_levels": len(angry_birds_game.LEVEL_GENERATOR.cache),
+    }
+
+
+def sample(game, bot, frames, started, baseline, tracker):
+    gc.collect()
+    traced, peak = tracemalloc.get_traced_memory()  # (0, 0) when not tracing
+    top = []
+    if baseline is not None:
+        snap = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+        top = snap.compare_to(baseline, "lineno")[:TOP_ALLOCATORS]
+    types = Counter(type(o).__name__ for o in gc.get_objects())
+    record = {
+        "elapsed_s": round(time.monotonic() - started, 1),
+        "frames": frames,
+        "shots": bot.shots,
+        "level": game.level,
+        "rss_kb": rss_kb(),
+        "traced_kb": traced // 1024,
+        "traced_peak_kb": peak // 1024,
+        "top_allocators": [{"where": str(s.traceback[0]), "size_diff_kb": s.size_diff // 1024, "count_diff": s.count_diff}
+                           for s in top],
+        "object_types": dict(types.most_common(TOP_TYPES)),
+        "game": game_counts(game),
+    }
+    flags = [tracker.add("rss_kb", record["rss_kb"], "rss_kb")]
+    if baseline is not None:
+        flags.append(tracker.add("traced_kb", record["traced_kb"], "traced_kb"))
+    for name, count in types.most_common(TOP_TYPES):
+        flags.append(tracker.add(f"objects.{name}", count, "objects"))
+    record["leak_flags"] = [f for f in flags if f]
+    return record
+
+
+def run(hours, window=False, draw=True, interval_s=SAMPLE_INTERVAL_S, seed=0, report=REPORT_FILE,
+        trace_depth=TRACE_DEPTH):
+    if not window:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from angry_birds_game import LOGICAL_HEIGHT, LOGICAL_WIDTH, AngryBirdsGame
+
+    if trace_depth:
+        tracemalloc.start(trace_depth)
+    pygame.init()
+    if window:
+        game = AngryBirdsGame(seed=seed)
+    else:
+        pygame.display.set_mode((1, 1))
+        game = AngryBirdsGame(screen=pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT)), seed=seed)
+    bot = ShotBot(seed)
+    tracker = LeakTracker()
+    clock = pygame.time.Clock()
+    baseline = tracemalloc.take_snapshot() if trace_depth else None
+    started = time.monotonic()
+    end = started + hours * 3600
+    next_sample = started + interval_s
+    frames = 0
+    print(f"🧪 Soak test for {hours} h ({'window' if window else 'headless'}), report: {report}")
+    with open(report, "a", encoding="utf-8") as out:
+        while time.monotonic() < end:
+            if window:
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        end = 0
+                    game.handle_event(event)
+            game.handle_gesture_input(bot.params(game))
+            game.update()
+            if draw:
+                game.draw()
+            if window:
+                game.present()
+                clock.tick(60)
+            frames += 1
+            if time.monotonic() >= next_sample:
+                record = sample(game, bot, frames, started, baseline, tracker)
+                out.write(json.dumps(record) + "\n")
+                out.flush()
+                print(f"📊 {record['elapsed_s'] / 3600:.2f} h, {frames} frames, {bot.shots} shots, "
+                      f"level {game.level}, RSS {record['rss_kb'] / 1024:.1f} MB, traced {record['traced_kb']} KB")
+                for flag in record["leak_flags"]:
+                    print(f"⚠️ Possible leak: {flag}")
+                next_sample = time.monotonic() + interval_s
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Auto-play soak test with leak tracking")
+    parser.add_argument("--hours", type=float, default=12.0)
+    parser.add_argument("--window", action="store_true", help="Render in a window at 60 FPS")
+    parser.add_argument("--no-draw", action="store_true", help="Headless physics only (skip draw)")
+    parser.add_argument("--interval", type=float, default=SAMPLE_INTERVAL_S, help="Seconds between samples")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--trace-depth", type=int, default=TRACE_DEPTH,
+                        help="tracemalloc frames per allocation (0 = off, fastest)")
+    parser.add_argument("--report", default=REPORT_FILE)
+    args = parser.parse_args()
+    run(args.hours, window=args.window, draw=not args.no_draw, interval_s=args.interval,
+        seed=args.seed, report=args.report, trace_depth=args.trace_depth)
@@ -0,0 +1,38 @@
+from aim_assist import AimAssist
+from levelgen import PIG_RADIUS, SHOT_POWERS, ShotIndex
+
+
+class Pig:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.is_alive = True
+
+
+def test_every_assisted_shot_hits_the_pig():
+    index = ShotIndex()
+    pigs = [Pig(750, 480), Pig(1050, 330), Pig(620, 430)]
+    assist = AimAssist(index, strength=1.0)
+    assist.build(pigs)
+    for pig in pigs:
+        hitting = {index.shots[i][:2] for i in index.shots_hitting(pig.x, pig.y, PIG_RADIUS)}
+        hit_powers = {power for power, _ in hitting}
+        assert hitting, "pig should be reachable"
+        for power, angles in zip(SHOT_POWERS, assist.targets[(pig.x, pig.y)]):
+            if power not in hit_powers:
+                assert angles == []  # No assist toward an angle that misses at this power
+            for angle in angles:
+                assert (power, angle) in hitting
+
+
+def test_no_assist_at_a_power_that_cannot_hit():
+    index = ShotIndex()
+    pig = Pig(1050, 330)
+    assist = AimAssist(index, strength=1.0)
+    assist.build([pig])
+    hit_powers = {index.shots[i][0] for i in index.shots_hitting(pig.x, pig.y, PIG_RADIUS)}
+    missing = [p for p in SHOT_POWERS if p not in hit_powers]
+    assert missing
+    for power in missing:
+        assert assist.target_angle([pig], power, -0.5) is None
+        assert assist.adjust([pig], power, -0.5) == -0.5
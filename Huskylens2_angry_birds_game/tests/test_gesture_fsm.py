@@ -0,0 +1,120 @@
+from gesture_fsm import (AIMING, DEFAULT_CONFIRM, GESTURE_CLASS, GRABBED, HOLD_CLASS, IDLE,
+                         TRANSITIONS, GestureStateMachine, replay)
+
+ALWAYS = {"moved_enough": lambda x, y: True, "launch_ready": lambda x, y: True}
+NEVER = {"moved_enough": lambda x, y: False, "launch_ready": lambda x, y: False}
+
+
+def draw(start_ms=0, frames=10, step_ms=30):
+    """Samples of a fist held and pulled for `frames` frames"""
+    return [(start_ms + i * step_ms, "grab", 100 + i, 100) for i in range(frames)]
+
+
+def test_transition_table_is_consistent():
+    states = {IDLE, GRABBED, AIMING}
+    for (state, gesture), candidates in TRANSITIONS.items():
+        assert state in states
+        assert gesture in GESTURE_CLASS
+        assert candidates[-1][0] is None, f"{state}/{gesture} needs an unguarded fallback"
+        for guard, next_state, _ in candidates:
+            assert guard is None or guard in ALWAYS
+            assert next_state in states
+    assert set(HOLD_CLASS) == states
+    for key in DEFAULT_CONFIRM:
+        assert key in GESTURE_CLASS.values() or key in GESTURE_CLASS
+
+
+def test_grab_aim_release_launches():
+    samples = draw() + [(300, "release", 110, 100), (520, None, 0, 0)]  # Hand left: quiet line
+    actions, trace = replay(samples, guards=ALWAYS)
+    assert actions[0] == "grab_start"
+    assert actions[1:10] == ["aim"] * 9
+    assert actions[-1] == "launch"
+    assert [(row["from"], row["to"]) for row in trace] == [(IDLE, GRABBED), (GRABBED, AIMING), (AIMING, IDLE)]
+
+
+def test_single_release_then_hand_leaves_frame_still_launches():
+    # The sketch prints "release" once; after that the hand is simply gone
+    samples = draw() + [(300, "release", 110, 100)] + [(300 + i * 30, None, 0, 0) for i in range(1, 80)]
+    actions, trace = replay(samples, guards=ALWAYS)
+    assert actions.count("launch") == 1
+    assert "cancel" not in actions
+    assert trace[-1]["reason"] != "timeout"
+
+
+def test_release_confirmed_by_palm_launches_at_release_point():
+    samples = draw(frames=5) + [(200, "release", 104, 100), (260, "hand_open", 90, 80)]
+    fsm = GestureStateMachine(guards=ALWAYS)
+    actions = [fsm.feed(g, x, y, t) for t, g, x, y in samples]
+    assert actions[-2:] == [None, "launch"]
+    assert fsm.fired_xy == (104, 100)
+
+
+def test_release_during_dwell_fires_when_dwell_ends():
+    samples = [(0, "grab", 100, 100), (30, "grab", 120, 100), (60, "release", 120, 100),
+               (90, "hand_open", 120, 100), (100, None, 0, 0), (200, None, 0, 0)]
+    actions, _ = replay(samples, guards=ALWAYS, min_dwell_ms={AIMING: 120})
+    assert actions == ["grab_start", "aim", None, None, None, "launch"]
+
+
+def test_misclassified_release_mid_draw_does_not_launch():
+    # One palm frame mid-draw: the sketch prints "release", then the fist is seen again
+    samples = (draw(frames=5) + [(200, "release", 104, 100), (230, None, 0, 0)]
+               + draw(260, frames=3) + [(500, None, 0, 0)])
+    actions, trace = replay(samples, guards=ALWAYS)
+    assert "launch" not in actions
+    assert "cancel" not in actions
+    assert actions[-2] == "aim"
+    assert trace[-1]["to"] == AIMING
+
+
+def test_confirmed_hand_open_cancels():
+    samples = draw(frames=5) + [(150, "hand_open", 104, 100), (180, "hand_open", 104, 100)]
+    actions, trace = replay(samples, guards=ALWAYS)
+    assert actions[-1] == "cancel"
+    assert trace[-1]["to"] == IDLE
+
+
+def test_release_without_launch_ready_cancels():
+    samples = [(0, "grab", 100, 100), (30, "grab", 120, 100), (200, "release", 120, 100),
+               (230, "hand_open", 120, 100)]
+    guards = dict(ALWAYS, launch_ready=lambda x, y: False)
+    actions, _ = replay(samples, guards=guards)
+    assert actions[-1] == "cancel"
+
+
+def test_fist_that_does_not_move_stays_grabbed():
+    actions, trace = replay(draw(frames=4), guards=NEVER)
+    assert actions == ["grab_start", None, None, None]
+    assert trace[-1]["to"] == GRABBED
+
+
+def test_hand_lost_mid_draw_times_out():
+    samples = draw(frames=3) + [(2000, None, 0, 0)]
+    actions, trace = replay(samples, guards=ALWAYS, timeout_ms=1500)
+    assert actions[-1] == "cancel"
+    assert trace[-1]["reason"] == "timeout"
+
+
+def test_fired_xy_is_the_confirmed_sample():
+    fsm = GestureStateMachine(guards=ALWAYS, confirm={"fist": (2, 3)})
+    assert fsm.feed("grab", 10, 20, 0) is None
+    assert fsm.feed("grab", 30, 40, 30) == "grab_start"
+    assert fsm.fired_xy == (10, 20)
+
+
+def test_replay_is_deterministic():
+    samples = draw() + [(300, "hand_open", 110, 100), (330, "grab", 111, 100),
+                        (360, "release", 112, 100), (400, None, 0, 0)]
+    first = replay(samples, guards=ALWAYS)
+    second = replay(samples, guards=ALWAYS)
+    assert first == second
+
+
+def test_dump_writes_json_lines(tmp_path):
+    fsm = GestureStateMachine(guards=ALWAYS)
+    for t, gesture, x, y in draw(frames=3):
+        fsm.feed(gesture, x, y, t)
+    path = tmp_path / "trace.jsonl"
+    rows = fsm.dump(str(path))
+    assert len(path.read_text().splitlines()) == len(rows) == 2
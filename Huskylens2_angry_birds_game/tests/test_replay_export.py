@@ -0,0 +1,44 @@
+import os
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import assets  # noqa: E402
+import replay_export  # noqa: E402
+from angry_birds_game import LOGICAL_HEIGHT, LOGICAL_WIDTH, AngryBirdsGame  # noqa: E402
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class BrokenPipeEncoder:
+    """Stands in for an ffmpeg process that exited mid-export"""
+
+    def __init__(self, output, size, fps):
+        self.aborted = False
+
+    def write(self, index, data):
+        raise BrokenPipeError("ffmpeg went away")
+
+    def close(self):
+        pass
+
+    def abort(self):
+        self.aborted = True
+
+
+def test_export_raises_when_encoder_dies(tmp_path, monkeypatch):
+    monkeypatch.chdir(GAME_DIR)  # Images load relative to the game folder
+    monkeypatch.setattr(assets, "_font_path", None)  # Default font; no font_cache.json written
+    pygame.init()
+    game = AngryBirdsGame(screen=pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT)), seed=1)
+    path = str(tmp_path / "session.jsonl")
+    recorder = replay_export.SessionRecorder(path, game)
+    for _ in range(replay_export.EXPORT_QUEUE_SIZE * 3):  # More than the queue holds
+        recorder.record({"power": 0, "angle": 0, "should_launch": False})
+    recorder.close()
+
+    monkeypatch.setattr(replay_export, "FfmpegEncoder", BrokenPipeEncoder)
+    with pytest.raises(BrokenPipeError):
+        replay_export.export_session(path, str(tmp_path / "out.mp4"))
@@ -0,0 +1,75 @@
+import sqlite3
+
+from scores import Leaderboard, ScoreStore, load_leaderboard
+
+
+def entry(session, score, booth="hall-a", level=1):
+    return {"session": session, "booth": booth, "score": score, "level": level, "ts": 0.0}
+
+
+def scores_of(entries):
+    return [e["score"] for e in entries]
+
+
+def test_leaderboard_keeps_best_first_and_top_n():
+    board = Leaderboard(top_n=3)
+    for i, score in enumerate([500, 1500, 1000, 200, 3000]):
+        board.offer(entry(f"s{i}", score))
+    assert scores_of(board.top("hall-a")) == [3000, 1500, 1000]
+
+
+def test_leaderboard_replaces_the_same_session():
+    board = Leaderboard(top_n=3)
+    board.offer(entry("a", 1000))
+    board.offer(entry("b", 800))
+    board.offer(entry("a", 1200))
+    top = board.top("hall-a")
+    assert [(e["session"], e["score"]) for e in top] == [("a", 1200), ("b", 800)]
+
+
+def test_leaderboard_none_board_spans_booths():
+    board = Leaderboard(top_n=2)
+    board.offer(entry("a", 100, booth="hall-a"))
+    board.offer(entry("b", 300, booth="hall-b"))
+    board.offer(entry("c", 200, booth="hall-a"))
+    assert scores_of(board.top("hall-a")) == [200, 100]
+    assert scores_of(board.top("hall-b")) == [300]
+    assert scores_of(board.top(None)) == [300, 200]
+    assert board.top("nowhere") == []
+
+
+class Game:
+    seed = 7
+    score = 0
+    level = 1
+
+    def __init__(self):
+        self.shot_listeners = []
+        self.level_listeners = []
+
+
+def shot(score, score_delta, level=1):
+    return {"level": level, "power": 50.0, "angle": 0.5, "pigs_hit": 1, "blocks_broken": 0,
+            "score_delta": score_delta, "ticks": 90, "score": score}
+
+
+def test_queued_rows_are_committed_on_close(tmp_path):
+    path = str(tmp_path / "scores.db")
+    with ScoreStore(path=path, booth="hall-a") as store:
+        game = Game()
+        store.attach(game)
+        for listener in game.shot_listeners:
+            listener(shot(5000, 5000))
+            listener(shot(5000, 0))
+        for listener in game.level_listeners:
+            listener(1, 5000)
+        session = store.session
+    # close() returned: everything queued before it is on disk
+    conn = sqlite3.connect(path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM shots WHERE session = ?", (session,)).fetchone() == (2,)
+        assert conn.execute("SELECT level, score FROM levels").fetchall() == [(1, 5000)]
+        assert conn.execute("SELECT booth, seed, score, level FROM sessions").fetchall() == [("hall-a", 7, 5000, 2)]
+    finally:
+        conn.close()
+    assert scores_of(load_leaderboard(path).top("hall-a")) == [5000]
@@ -0,0 +1,71 @@
+import os
+import struct
+
+import pytest
+
+from shot_log import COLUMNS, ShotLog, ShotLogReader, shot_count
+
+
+def result(level=1, pigs_hit=0, blocks_broken=0, score_delta=0, ticks=100, power=50.0, angle=0.5):
+    return {"level": level, "pigs_hit": pigs_hit, "blocks_broken": blocks_broken,
+            "score_delta": score_delta, "ticks": ticks, "power": power, "angle": angle}
+
+
+def test_writer_reader_round_trip(tmp_path):
+    pytest.importorskip("numpy")
+    with ShotLog(str(tmp_path)) as log:
+        log.launch_source = lambda: (120, 80, 42.5, 0.25)
+        log.on_shot(result(level=3, pigs_hit=2, blocks_broken=4, score_delta=5000, ticks=321))
+        log.launch_source = None
+        log.on_shot(result(level=4, power=10.0, angle=-0.5))
+    reader = ShotLogReader(str(tmp_path))
+    assert len(reader) == 2
+    assert list(reader["x"]) == [120, -1]
+    assert list(reader["y"]) == [80, -1]
+    assert list(reader["power"]) == [42.5, 10.0]
+    assert list(reader["angle"]) == [0.25, -0.5]
+    assert list(reader["level"]) == [3, 4]
+    assert list(reader["pigs_hit"]) == [2, 0]
+    assert list(reader["score_delta"]) == [5000, 0]
+    assert list(reader["ticks"]) == [321, 100]
+
+
+def test_out_of_range_values_never_misalign_columns(tmp_path):
+    with ShotLog(str(tmp_path)) as log:
+        log.launch_source = lambda: (100000, -100000, 50.0, 0.5)  # Clamped to int16
+        log.on_shot(result())
+        log.launch_source = lambda: (0, 0, 50.0, 0.5)
+        log.on_shot(result(ticks=-1))  # Cannot be packed: the whole record is dropped
+        log.on_shot(result())
+    assert shot_count(str(tmp_path)) == 2
+    for name, code in COLUMNS:
+        size = os.path.getsize(os.path.join(str(tmp_path), f"{name}.{code}"))
+        assert size == 2 * struct.calcsize("<" + code), name
+
+
+def test_reopen_trims_partial_record(tmp_path):
+    with ShotLog(str(tmp_path)) as log:
+        log.on_shot(result())
+        log.on_shot(result())
+    with open(os.path.join(str(tmp_path), "ts.d"), "ab") as f:
+        f.write(b"\0" * 8)  # A crash after the first column of a third record
+    ShotLog(str(tmp_path)).close()
+    assert os.path.getsize(os.path.join(str(tmp_path), "ts.d")) == 2 * 8
+    assert shot_count(str(tmp_path)) == 2
+
+
+def test_by_level_aggregates(tmp_path):
+    pytest.importorskip("numpy")
+    with ShotLog(str(tmp_path)) as log:
+        log.on_shot(result(level=1, pigs_hit=1, blocks_broken=2, score_delta=5000, ticks=100))
+        log.on_shot(result(level=1, pigs_hit=0, blocks_broken=0, score_delta=0, ticks=300))
+        log.on_shot(result(level=2, pigs_hit=2, blocks_broken=1, score_delta=10000, ticks=200))
+    summary = ShotLogReader(str(tmp_path)).by_level()
+    assert set(summary) == {1, 2}
+    assert summary[1]["shots"] == 2
+    assert summary[1]["hit_rate"] == 0.5
+    assert summary[1]["blocks_per_shot"] == 1.0
+    assert summary[1]["mean_score"] == 2500.0
+    assert summary[1]["mean_ticks"] == 200.0
+    assert summary[2] == {"shots": 1, "hit_rate": 1.0, "pigs_per_shot": 2.0, "blocks_per_shot": 1.0,
+                          "mean_score": 10000.0, "mean_ticks": 200.0}
@@ -0,0 +1,48 @@
+import os
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import assets  # noqa: E402
+from angry_birds_game import LOGICAL_HEIGHT, LOGICAL_WIDTH, AngryBirdsGame  # noqa: E402
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+AIM = {"power": 80, "angle": 0.6, "should_launch": False}
+
+
+def fly(game, frames=240):
+    """Launch with the current aim and return the particles seen on every frame"""
+    game.handle_gesture_input(dict(AIM, should_launch=True))
+    seen = []
+    for _ in range(frames):
+        game.update()
+        seen.append([(p['x'], p['y'], p['life'], p['color']) for p in game.particles])
+    return seen
+
+
+@pytest.fixture
+def game(monkeypatch):
+    monkeypatch.chdir(GAME_DIR)  # Images load relative to the game folder
+    monkeypatch.setattr(assets, "_font_path", None)  # Default font; no font_cache.json written
+    pygame.init()
+    game = AngryBirdsGame(screen=pygame.Surface((LOGICAL_WIDTH, LOGICAL_HEIGHT)), seed=3)
+    for _ in range(10):
+        game.handle_gesture_input(AIM)
+        game.update()
+    return game
+
+
+def test_retry_replays_particles_exactly(game):
+    first = fly(game)
+    assert any(first), "the shot should spawn particles"
+    assert game.retry_shot()
+    assert fly(game) == first
+
+
+def test_restore_carries_the_particle_stream(game):
+    data = game.snapshot()
+    expected = [game.rng.particles.random() for _ in range(5)]
+    game.restore(data)
+    assert [game.rng.particles.random() for _ in range(5)] == expected
@@ -0,0 +1,103 @@
+# trail.py
+# -*- coding: utf-8 -*-
+"""
+Projectile trails.
+
+TrailBuffer is a fixed-capacity ring buffer (append is O(1), no
+pop(0)). The red -> yellow -> fading gradient and the point size only
+depend on a point's index within the capacity, so each (capacity,
+radius) pair gets a lookup table of pre-rendered glow+core stamps, built
+once. TrailRenderer draws any number of trails with one Surface.blits().
+"""
+import pygame
+
+
+class TrailBuffer:
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.xs = [0.0] * capacity
+        self.ys = [0.0] * capacity
+        self.head = 0   # Next slot to write
+        self.count = 0
+
+    def append(self, x, y):
+        head = self.head
+        self.xs[head] = x
+        self.ys[head] = y
+        self.head = (head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def clear(self):
+        self.head = 0
+        self.count = 0
+
+    def set_capacity(self, capacity):
+        """Resize, keeping the newest points (no-op when unchanged)"""
+        if capacity == self.capacity:
+            return
+        points = self.points()[-capacity:]
+        self.capacity = capacity
+        self.xs = [0.0] * capacity
+        self.ys = [0.0] * capacity
+        self.clear()
+        for x, y in points:
+            self.append(x, y)
+
+    def points(self):
+        """Points oldest to newest"""
+        start = (self.head - self.count) % self.capacity
+        xs, ys, cap = self.xs, self.ys, self.capacity
+        return [(xs[(start + i) % cap], ys[(start + i) % cap]) for i in range(self.count)]
+
+    def __len__(self):
+        return self.count
+
+
+def _gradient(i, n, radius):
+    """Color (RGBA) and size of point i of n, oldest first (the original trail look)"""
+    alpha = int((i / n) * 255)
+    size = max(1, int(radius * (i / n) * 0.8))
+    if i < n * 0.3:
+        color = (255, int(200 * (i / n * 3)), 0, alpha)
+    elif i < n * 0.7:
+        color = (255, 255, int(100 * ((i - n * 0.3) / (n * 0.4))), alpha)
+    else:
+        color = (int(255 * ((n - i) / (n * 0.3))), 100, 100, alpha)
+    return color, size
+
+
+class TrailRenderer:
+    def __init__(self):
+        self._luts = {}  # (capacity, radius) -> [(stamp, half_size)] per index
+
+    def lut(self, capacity, radius):
+        key = (capacity, radius)
+        lut = self._luts.get(key)
+        if lut is None:
+            lut = []
+            for i in range(capacity):
+                color, size = _gradient(i, capacity, radius)
+                stamp = pygame.Surface((size * 6, size * 6), pygame.SRCALPHA)
+                # Outer glow, then the core on top
+                pygame.draw.circle(stamp, (*color[:3], color[3] // 3), (size * 3, size * 3), size * 2)
+                pygame.draw.circle(stamp, color, (size * 3, size * 3), size)
+                lut.append((stamp, size * 3))
+            self._luts[key] = lut
+        return lut
+
+    def draw(self, screen, trails, radius):
+        """Draw every TrailBuffer in `trails` with a single batched blit"""
+        items = []
+        for trail in trails:
+            n = trail.count
+            if n < 2:
+                continue
+            lut = self.lut(trail.capacity, radius)
+            # Newest point uses the last LUT entry; a filling trail uses the bright end
+            offset = trail.capacity - n
+            for i, (x, y) in enumerate(trail.points()[:-1]):
+                stamp, half = lut[offset + i]
+                items.append((stamp, (int(x - half), int(y - half))))
+        if items:
+            screen.blits(items, doreturn=False)